@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing of nested form-style tables.
+
+Builds DOCX packages whose body is a form: a table of label/value rows
+where one value cell holds the next nested form, down to the given
+depth. Value cells use content controls (w:sdt), as form templates do.
+For each depth the script reports the document.xml size, the number of
+paragraphs parsed, and the parse time per KB of XML, which stays flat
+when parse cost is linear in XML size.
+
+Usage:
+    python scripts/benchmark_nested_tables.py [OPTIONS]
+
+Options:
+    --depth N     Maximum nesting depth (default: 5)
+    --forms N     Top-level forms in the body (default: 50)
+    --fields N    Label/value rows per form (default: 6)
+    --repeat N    Timing repetitions, best is reported (default: 5)
+"""
+
+import argparse
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from docx2latex.infrastructure.parsing.docx_parser import DocxParser
+from docx2latex.shared.result import Ok
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def paragraph(text: str) -> str:
+    return f"<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>{text}</w:t></w:r></w:p>"
+
+
+def form(level: int, depth: int, fields: int) -> str:
+    """Build a form table; the last value cell nests the next level."""
+    rows = []
+    for field in range(fields):
+        label_text = paragraph(f"Field {level}.{field}")
+        label = f'<w:tc><w:tcPr><w:tcW w:w="2400"/></w:tcPr>{label_text}</w:tc>'
+        if field == fields - 1 and level < depth:
+            value = form(level + 1, depth, fields)
+        else:
+            value = paragraph(f"value {level}.{field}")
+        value_cell = f"<w:tc><w:sdt><w:sdtContent>{value}</w:sdtContent></w:sdt></w:tc>"
+        rows.append(f"<w:tr>{label}{value_cell}</w:tr>")
+
+    grid = '<w:tblGrid><w:gridCol w:w="2400"/><w:gridCol w:w="6000"/></w:tblGrid>'
+    return f"<w:tbl><w:tblPr/>{grid}{''.join(rows)}</w:tbl>{paragraph('')}"
+
+
+def build_docx(depth: int, forms: int, fields: int) -> tuple[bytes, str]:
+    """Build a DOCX package; returns its bytes and its document.xml."""
+    body = "".join(form(1, depth, fields) for _ in range(forms))
+    document_xml = f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", document_xml)
+    return buffer.getvalue(), document_xml
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark nested table parsing")
+    parser.add_argument("--depth", type=int, default=5, help="Maximum nesting depth")
+    parser.add_argument("--forms", type=int, default=50, help="Top-level forms in the body")
+    parser.add_argument("--fields", type=int, default=6, help="Label/value rows per form")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    docx_parser = DocxParser()
+
+    columns = ("depth", "xml KB", "tables", "paragraphs", "best ms", "us/KB")
+    widths = (5, 9, 7, 11, 9, 7)
+    print(" ".join(f"{name:>{width}}" for name, width in zip(columns, widths, strict=True)))
+    for depth in range(1, args.depth + 1):
+        data, document_xml = build_docx(depth, args.forms, args.fields)
+        expected_paragraphs = document_xml.count("<w:p>")
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = docx_parser.parse_bytes(data)
+            best = min(best, time.perf_counter() - start)
+
+        if not isinstance(result, Ok):
+            print(f"Parse failed at depth {depth}: {result.error}")
+            sys.exit(1)
+
+        # Each paragraph must be parsed exactly once, whatever the depth
+        document = result.value
+        paragraphs = document.paragraph_count
+        if paragraphs != expected_paragraphs:
+            print(f"Depth {depth}: parsed {paragraphs} paragraphs, XML has {expected_paragraphs}")
+
+        kb = len(document_xml) / 1024
+        print(
+            f"{depth:>5} {kb:>9.1f} {document.table_count:>7} {paragraphs:>11} "
+            f"{best * 1000:>9.1f} {best * 1e6 / kb:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,7 @@ class ConversionOptions:
 
     # Math options
     display_math_style: str = "display"  # display, equation, align
+    math_workers: int = 1  # Processes converting equations (1: in-process)
 
     # Image options
     max_image_width: float = 1.0  # fraction of linewidth
@@ -41,6 +42,9 @@ class ConversionOptions:
     # Table options
     table_style: str = "booktabs"  # booktabs, standard, custom
 
+    # Parallel conversion
+    workers: int = 1  # Processes converting the document's content (1: serial)
+
     # Debug/verbose
     verbose: bool = False
     debug: bool = False
@@ -39,6 +39,11 @@ class ConversionResult:
     parse_time_ms: float = 0
     convert_time_ms: float = 0
     write_time_ms: float = 0
+    parse_cached: bool = False  # Document loaded from the parse cache
+
+    # Formula cache activity during this conversion
+    math_cache_hits: int = 0
+    math_cache_misses: int = 0
 
     @property
     def total_time_ms(self) -> float:
@@ -68,6 +73,8 @@ class ConversionResult:
             "warnings": len(self.warnings),
             "errors": len(self.errors),
             "time_ms": self.total_time_ms,
+            "parse_cached": self.parse_cached,
+            "math_cache": {"hits": self.math_cache_hits, "misses": self.math_cache_misses},
         }
 
     def __str__(self) -> str:
@@ -3,5 +3,6 @@ Application services.
 """
 
 from docx2latex.application.services.conversion_service import ConversionService
+from docx2latex.application.services.incremental_service import IncrementalConversionService
 
-__all__ = ["ConversionService"]
+__all__ = ["ConversionService", "IncrementalConversionService"]
@@ -6,7 +6,13 @@ Orchestrates the full DOCX to LaTeX conversion pipeline.
 
 from __future__ import annotations
 
+import dataclasses
+import multiprocessing
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,18 +20,51 @@ from docx2latex.application.dto.conversion_options import ConversionOptions
 from docx2latex.application.dto.conversion_result import ConversionResult
 from docx2latex.domain.entities.elements import Image, ListBlock, Paragraph, Table
 from docx2latex.domain.protocols.converter import ConversionContext
+from docx2latex.infrastructure.converters.math.cache import MathCache
+from docx2latex.infrastructure.converters.math.converter import MathConverter
 from docx2latex.infrastructure.converters.registry import create_default_registry
 from docx2latex.infrastructure.parsing.docx_parser import DocxParser
 from docx2latex.infrastructure.writing.latex_writer import LatexWriter
 from docx2latex.shared.logging import get_logger
-from docx2latex.shared.result import Err, Ok
+from docx2latex.shared.result import Err, Ok, Result
 
 if TYPE_CHECKING:
     from docx2latex.domain.entities.document import Document
+    from docx2latex.infrastructure.caching.parse_cache import ParseCache
     from docx2latex.infrastructure.converters.registry import ConverterRegistry
 
 logger = get_logger("service")
 
+# Documents with fewer top-level elements are converted serially even when
+# workers are requested: forking the pool would cost more than it saves
+PARALLEL_MIN_ELEMENTS = 1000
+
+# Chunks submitted per worker process
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(slots=True)
+class _Chunk:
+    """Consecutive top-level elements of a section, converted together."""
+
+    section: int  # Index of the section in the document
+    elements: list[Paragraph | Table | ListBlock | Image]
+
+
+@dataclass(slots=True)
+class _ChunkResult:
+    """LaTeX of a chunk's elements, and what they added to the context."""
+
+    parts: list[str]  # One per element ("" if it produces none)
+    packages: set[str] = field(default_factory=set)
+    warnings: list[str] = field(default_factory=list)
+    labels: dict[str, str] = field(default_factory=dict)
+
+
+# Service, chunks and context of the parallel conversion a worker
+# process takes part in; set by _init_worker, in workers only
+_worker_job: tuple[ConversionService, list[_Chunk], ConversionContext] | None = None
+
 
 class ConversionService:
     """
@@ -39,6 +78,8 @@ class ConversionService:
         parser: DocxParser | None = None,
         registry: ConverterRegistry | None = None,
         writer: LatexWriter | None = None,
+        parse_cache: ParseCache | None = None,
+        math_cache: MathCache | None = None,
     ) -> None:
         """
         Initialize the conversion service.
@@ -47,10 +88,16 @@ class ConversionService:
             parser: Document parser (default: DocxParser)
             registry: Converter registry (default: create_default_registry)
             writer: LaTeX writer (default: LatexWriter)
+            parse_cache: Cache of parsed documents (default: no caching)
+            math_cache: Cache of converted formulas, shared by all documents
+                this service converts (default: a new MathCache). Used by
+                the default registry only.
         """
         self._parser = parser or DocxParser()
-        self._registry = registry or create_default_registry()
+        self._math_cache = math_cache if math_cache is not None else MathCache()
+        self._registry = registry or create_default_registry(self._math_cache)
         self._writer = writer or LatexWriter()
+        self._parse_cache = parse_cache
 
     def convert(
         self,
@@ -78,7 +125,7 @@ class ConversionService:
         logger.info(f"Parsing: {input_path}")
         start_time = time.perf_counter()
 
-        parse_result = self._parser.parse(input_path)
+        parse_result = self._parse(input_path, result)
         result.parse_time_ms = (time.perf_counter() - start_time) * 1000
 
         if isinstance(parse_result, Err):
@@ -87,7 +134,8 @@ class ConversionService:
             return result
 
         document = parse_result.value
-        logger.info(f"Parsed: {document.paragraph_count} paragraphs, {document.table_count} tables")
+        stats = document.statistics()
+        logger.info(f"Parsed: {stats.paragraphs} paragraphs, {stats.tables} tables")
 
         # Step 2: Convert to LaTeX
         logger.info("Converting to LaTeX...")
@@ -103,14 +151,21 @@ class ConversionService:
             },
         )
 
-        latex_content = self._convert_document(document, context)
+        math_before = self._math_cache.stats
+        self._convert_math(document, options)
+        latex_content = self._convert_content(document, context, options)
         result.convert_time_ms = (time.perf_counter() - start_time) * 1000
 
-        # Collect statistics
-        result.paragraph_count = document.paragraph_count
-        result.table_count = document.table_count
-        result.image_count = document.image_count
-        result.math_count = document.math_count
+        self._math_cache.flush()
+        math_after = self._math_cache.stats
+        result.math_cache_hits = math_after.hits - math_before.hits
+        result.math_cache_misses = math_after.misses - math_before.misses
+
+        # Collect statistics (conversion does not change the document's content)
+        result.paragraph_count = stats.paragraphs
+        result.table_count = stats.tables
+        result.image_count = stats.images
+        result.math_count = stats.math_blocks
 
         # Collect warnings
         result.warnings = context.warnings.copy()
@@ -134,6 +189,76 @@ class ConversionService:
 
         return result
 
+    def _parse(self, input_path: Path, result: ConversionResult) -> Result[Document, str]:
+        """
+        Parse a DOCX file, through the parse cache if one is configured.
+
+        Documents are cached right after parsing, before conversion
+        fills in any derived fields.
+
+        Args:
+            input_path: Path to the DOCX file
+            result: Conversion result (parse_cached is set on a hit)
+
+        Returns:
+            Result containing the Document or error message
+        """
+        cache = self._parse_cache
+        if cache is None:
+            return self._parser.parse(input_path)
+
+        try:
+            key = cache.key_for(input_path)
+        except OSError:
+            # Unreadable input: let the parser report it
+            return self._parser.parse(input_path)
+
+        document = cache.get(key, input_path)
+        if document is not None:
+            logger.info("Parse cache hit")
+            result.parse_cached = True
+            return Ok(document)
+
+        parse_result = self._parser.parse(input_path)
+        if isinstance(parse_result, Ok):
+            cache.put(key, parse_result.value)
+        return parse_result
+
+    def _convert_math(self, document: Document, options: ConversionOptions) -> None:
+        """
+        Convert the document's formulas ahead of its elements.
+
+        Each distinct formula is converted once, in options.math_workers
+        processes; the math converter then reuses the LaTeX.
+
+        Args:
+            document: Parsed document
+            options: Conversion options
+        """
+        converter = self._registry.get_converter_for_type("math")
+        if isinstance(converter, MathConverter):
+            converter.convert_many(document.iter_math_blocks(), options.math_workers)
+
+    def _convert_content(
+        self, document: Document, context: ConversionContext, options: ConversionOptions
+    ) -> str:
+        """
+        Convert document content to LaTeX, in options.workers processes if worthwhile.
+
+        Args:
+            document: Parsed document
+            context: Conversion context
+            options: Conversion options
+
+        Returns:
+            LaTeX content string
+        """
+        if options.workers > 1:
+            elements = sum(len(section.elements) for section in document.sections)
+            if elements >= PARALLEL_MIN_ELEMENTS:
+                return self._convert_parallel(document, context, options.workers)
+        return self._convert_document(document, context)
+
     def _convert_document(
         self, document: Document, context: ConversionContext
     ) -> str:
@@ -147,20 +272,135 @@ class ConversionService:
         Returns:
             LaTeX content string
         """
+        return self._join_sections(
+            [
+                self._convert_section_elements(section.elements, context)
+                for section in document.sections
+            ]
+        )
+
+    @staticmethod
+    def _join_sections(sections: list[str]) -> str:
+        """Join the LaTeX of a document's sections."""
         parts = []
 
-        for section in document.sections:
-            section_content = self._convert_section_elements(
-                section.elements, context
-            )
+        for section_content in sections:
             parts.append(section_content)
 
             # Add section break if there are multiple sections
-            if len(document.sections) > 1:
+            if len(sections) > 1:
                 parts.append("\n\\clearpage\n")
 
         return "\n\n".join(parts)
 
+    def _convert_parallel(
+        self, document: Document, context: ConversionContext, workers: int
+    ) -> str:
+        """
+        Convert document content to LaTeX in worker processes.
+
+        The output and the context end up as after _convert_document.
+        Runs of top-level elements are converted in forked workers, each
+        chunk against a context of its own; what chunks add to the
+        context is merged back in document order. Changes workers make
+        to elements are not seen here: formulas should already be
+        converted (see _convert_math).
+
+        The document is converted serially where fork is unavailable,
+        while other threads run (a fork copies only the calling thread,
+        so locks the others hold would never be released in the
+        workers), and if top-level images need numbering in document
+        order (only hand-built documents have them; the parser attaches
+        images to the document).
+
+        Args:
+            document: Parsed document
+            context: Conversion context
+            workers: Number of worker processes
+
+        Returns:
+            LaTeX content string
+        """
+        if (
+            "fork" not in multiprocessing.get_all_start_methods()
+            or threading.active_count() > 1
+            or any(
+                isinstance(element, Image)
+                for section in document.sections
+                for element in section.elements
+            )
+        ):
+            return self._convert_document(document, context)
+
+        total = sum(len(section.elements) for section in document.sections)
+        size = -(-total // (workers * _CHUNKS_PER_WORKER))
+        chunks = [
+            _Chunk(index, section.elements[start : start + size])
+            for index, section in enumerate(document.sections)
+            for start in range(0, len(section.elements), size)
+        ]
+        converted = self._convert_chunks(chunks, context, workers)
+
+        # Merge in document order
+        sections: list[list[str]] = [[] for _ in document.sections]
+        for chunk, result in zip(chunks, converted, strict=True):
+            sections[chunk.section].extend(result.parts)
+            context.required_packages.update(result.packages)
+            context.warnings.extend(result.warnings)
+            context.labels.update(result.labels)
+
+        return self._join_sections(
+            ["\n\n".join(part for part in parts if part) for parts in sections]
+        )
+
+    def _convert_chunks(
+        self, chunks: list[_Chunk], context: ConversionContext, workers: int
+    ) -> list[_ChunkResult]:
+        """
+        Convert chunks in forked worker processes, in-process if the pool fails.
+
+        Workers inherit the job through fork rather than pickling it, and
+        are sent only chunk indices.
+        """
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(self, chunks, context),
+            ) as pool:
+                return list(pool.map(_convert_chunk_in_worker, range(len(chunks))))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Converting in-process: worker pool failed ({e})")
+            return [self._convert_chunk(chunk, context) for chunk in chunks]
+
+    def _convert_chunk(self, chunk: _Chunk, context: ConversionContext) -> _ChunkResult:
+        """
+        Convert a chunk against a context of its own.
+
+        The chunk's collections are shared with the contexts that
+        enter_table and enter_list derive from it, so what nested
+        converters add is collected; their image counters are copies,
+        exactly as on the serial path.
+
+        Args:
+            chunk: Chunk to convert
+            context: Document's conversion context (not modified)
+
+        Returns:
+            LaTeX of the chunk's elements and what they added to the context
+        """
+        chunk_context = dataclasses.replace(
+            context, required_packages=set(), warnings=[], labels={}
+        )
+        parts = [self._convert_element(element, chunk_context) for element in chunk.elements]
+        return _ChunkResult(
+            parts,
+            chunk_context.required_packages,
+            chunk_context.warnings,
+            chunk_context.labels,
+        )
+
     def _convert_section_elements(
         self,
         elements: list[Paragraph | Table | ListBlock | Image],
@@ -179,14 +419,32 @@ class ConversionService:
         parts = []
 
         for element in elements:
-            result = self._registry.convert(element, context)
-            if isinstance(result, Ok):
-                content = result.value.strip()
-                if content:
-                    parts.append(content)
+            content = self._convert_element(element, context)
+            if content:
+                parts.append(content)
 
         return "\n\n".join(parts)
 
+    def _convert_element(
+        self,
+        element: Paragraph | Table | ListBlock | Image,
+        context: ConversionContext,
+    ) -> str:
+        """
+        Convert a top-level section element.
+
+        Args:
+            element: Section element
+            context: Conversion context
+
+        Returns:
+            LaTeX content for the element ("" if it produces none)
+        """
+        result = self._registry.convert(element, context)
+        if isinstance(result, Ok):
+            return result.value.strip()
+        return ""
+
     def convert_bytes(
         self,
         data: bytes,
@@ -225,7 +483,8 @@ class ConversionService:
             image_dir=options.image_dir,
         )
 
-        latex_content = self._convert_document(document, context)
+        self._convert_math(document, options)
+        latex_content = self._convert_content(document, context, options)
 
         # Write
         write_result = self._writer.write(latex_content, context, output_path)
@@ -239,3 +498,18 @@ class ConversionService:
         result.warnings = context.warnings.copy()
 
         return result
+
+
+def _init_worker(
+    service: ConversionService, chunks: list[_Chunk], context: ConversionContext
+) -> None:
+    """Set the job of a worker process of a parallel conversion."""
+    global _worker_job
+    _worker_job = (service, chunks, context)
+
+
+def _convert_chunk_in_worker(index: int) -> _ChunkResult:
+    """Convert a chunk of the parallel conversion, in a worker process."""
+    assert _worker_job is not None
+    service, chunks, context = _worker_job
+    return service._convert_chunk(chunks[index], context)
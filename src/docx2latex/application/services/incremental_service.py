@@ -0,0 +1,131 @@
+"""
+Incremental conversion service.
+
+Reconverts successive revisions of one document, for watch mode.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from docx2latex.application.services.conversion_service import ConversionService
+from docx2latex.infrastructure.parsing.incremental import IncrementalParser
+
+if TYPE_CHECKING:
+    from docx2latex.domain.entities.document import Document
+    from docx2latex.domain.entities.elements import Image, ListBlock, Paragraph, Table
+    from docx2latex.domain.protocols.converter import ConversionContext
+    from docx2latex.infrastructure.converters.registry import ConverterRegistry
+    from docx2latex.infrastructure.parsing.incremental import IncrementalStats
+    from docx2latex.infrastructure.writing.latex_writer import LatexWriter
+
+
+@dataclass(frozen=True, slots=True)
+class _Fragment:
+    """Converted top-level element, with its effects on the context."""
+
+    latex: str
+    packages: frozenset[str]
+    warnings: tuple[str, ...]
+    labels: tuple[tuple[str, str], ...]
+    image_counter: int  # Image counter the element was converted at
+    images: int  # Image names the element took
+
+
+class IncrementalConversionService(ConversionService):
+    """
+    Conversion service for successive revisions of one document.
+
+    Documents are parsed with an IncrementalParser, so body elements an
+    edit did not touch are the same entities as in the previous
+    revision. Their LaTeX and everything they added to the context
+    (required packages, labels, warnings, image names) are kept from
+    the previous conversion and replayed; converters only run for new
+    or changed elements, and for elements whose image names would
+    shift. The output is identical to a full conversion.
+
+    An instance holds per-document state: use one per watched document.
+    """
+
+    def __init__(
+        self,
+        registry: ConverterRegistry | None = None,
+        writer: LatexWriter | None = None,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            registry: Converter registry (default: create_default_registry)
+            writer: LaTeX writer (default: LatexWriter)
+        """
+        self._incremental_parser = IncrementalParser()
+        super().__init__(parser=self._incremental_parser, registry=registry, writer=writer)
+        self._fragments: dict[int, _Fragment] = {}  # Element ID -> fragment
+        self._previous_fragments: dict[int, _Fragment] = {}
+        self.fragments_reused = 0
+        self.fragments_converted = 0
+
+    @property
+    def parse_stats(self) -> IncrementalStats | None:
+        """What the last parse reused."""
+        return self._incremental_parser.last_stats
+
+    def reset(self) -> None:
+        """Forget previous revisions; the next conversion starts from scratch."""
+        self._incremental_parser.reset()
+        self._fragments = {}
+
+    def _convert_document(self, document: Document, context: ConversionContext) -> str:
+        # Keep only the fragments of elements still in the document
+        self._previous_fragments, self._fragments = self._fragments, {}
+        self.fragments_reused = 0
+        self.fragments_converted = 0
+        try:
+            return super()._convert_document(document, context)
+        finally:
+            self._previous_fragments = {}
+
+    def _convert_parallel(
+        self, document: Document, context: ConversionContext, _workers: int
+    ) -> str:
+        # Fragments are recorded in this process; only edits are converted anyway
+        return self._convert_document(document, context)
+
+    def _convert_element(
+        self,
+        element: Paragraph | Table | ListBlock | Image,
+        context: ConversionContext,
+    ) -> str:
+        fragment = self._previous_fragments.get(element.id)
+        if fragment is not None and fragment.image_counter == context.image_counter:
+            self.fragments_reused += 1
+        else:
+            # Convert against private collections, to record what this
+            # element adds to the context
+            element_context = dataclasses.replace(
+                context, required_packages=set(), labels=dict(context.labels), warnings=[]
+            )
+            latex = super()._convert_element(element, element_context)
+            fragment = _Fragment(
+                latex,
+                frozenset(element_context.required_packages),
+                tuple(element_context.warnings),
+                tuple(
+                    (key, value)
+                    for key, value in element_context.labels.items()
+                    if context.labels.get(key) != value
+                ),
+                context.image_counter,
+                element_context.image_counter - context.image_counter,
+            )
+            self.fragments_converted += 1
+
+        self._fragments[element.id] = fragment
+        context.required_packages.update(fragment.packages)
+        context.labels.update(fragment.labels)
+        context.warnings.extend(fragment.warnings)
+        context.image_counter += fragment.images
+        return fragment.latex
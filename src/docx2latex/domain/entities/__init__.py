@@ -17,6 +17,7 @@ from docx2latex.domain.entities.elements import (
     Table,
     TableCell,
     TableRow,
+    element_id_scope,
 )
 
 __all__ = [
@@ -32,4 +33,5 @@ __all__ = [
     "Table",
     "TableCell",
     "TableRow",
+    "element_id_scope",
 ]
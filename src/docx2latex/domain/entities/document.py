@@ -6,6 +6,7 @@ The Document is the main container for all document content.
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -17,9 +18,11 @@ from docx2latex.domain.entities.elements import (
     ListBlock,
     MathBlock,
     Paragraph,
+    Run,
     Table,
 )
 from docx2latex.domain.value_objects.layout import PageLayout
+from docx2latex.domain.value_objects.statistics import DocumentStatistics
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -165,12 +168,10 @@ class Document:
             if isinstance(element, Paragraph):
                 yield element
             elif isinstance(element, Table):
-                for row in element.rows:
-                    for cell in row.cells:
-                        yield from cell.paragraphs
+                yield from element.iter_paragraphs()
             elif isinstance(element, ListBlock):
                 for item in element.items:
-                    yield from item.paragraphs
+                    yield from item.iter_paragraphs()
 
     def iter_math_blocks(self) -> Iterator[MathBlock]:
         """Iterate over all math blocks."""
@@ -180,15 +181,61 @@ class Document:
                     yield content
 
     def iter_tables(self) -> Iterator[Table]:
-        """Iterate over all tables."""
+        """Iterate over all tables, including nested tables."""
         for element in self.iter_elements():
             if isinstance(element, Table):
-                yield element
+                yield from element.iter_tables()
 
     def iter_images(self) -> Iterator[Image]:
         """Iterate over all images."""
         yield from self.images.values()
 
+    def statistics(self) -> DocumentStatistics:
+        """
+        Collect content statistics in a single traversal of the document.
+
+        Prefer this over the individual count properties when several
+        numbers are needed: each property walks the tree again.
+        """
+        by_type: Counter[str] = Counter()
+        text_length = 0
+        max_table_depth = 0
+        max_list_depth = 0
+
+        # (element, enclosing table depth, enclosing list depth)
+        stack: list[tuple[DocumentElement, int, int]] = [
+            (element, 0, 0) for element in self.iter_elements()
+        ]
+        while stack:
+            element, table_depth, list_depth = stack.pop()
+            element_type = element.element_type
+            by_type[element_type] += 1
+
+            if isinstance(element, Run):
+                text_length += len(element.text)
+                continue
+            if element_type == "table":
+                table_depth += 1
+                max_table_depth = max(max_table_depth, table_depth)
+            elif element_type == "list_item":
+                list_depth += 1
+                max_list_depth = max(max_list_depth, list_depth)
+
+            stack.extend((child, table_depth, list_depth) for child in element.children())
+
+        return DocumentStatistics(
+            sections=len(self.sections),
+            elements=sum(len(section.elements) for section in self.sections),
+            paragraphs=by_type["paragraph"],
+            tables=by_type["table"],
+            math_blocks=by_type["math"],
+            images=self.image_count,
+            text_length=text_length,
+            max_table_depth=max_table_depth,
+            max_list_depth=max_list_depth,
+            by_type=dict(by_type),
+        )
+
     @property
     def element_count(self) -> int:
         """Get total count of elements."""
@@ -223,12 +270,13 @@ class Document:
 
     def summary(self) -> dict[str, Any]:
         """Get a summary of document contents."""
+        stats = self.statistics()
         return {
-            "sections": len(self.sections),
-            "paragraphs": self.paragraph_count,
-            "tables": self.table_count,
-            "images": self.image_count,
-            "math_blocks": self.math_count,
+            "sections": stats.sections,
+            "paragraphs": stats.paragraphs,
+            "tables": stats.tables,
+            "images": stats.images,
+            "math_blocks": stats.math_blocks,
             "title": self.metadata.title,
             "author": self.metadata.author,
         }
@@ -238,9 +286,10 @@ class Document:
         return f"Document('{title}', {self.paragraph_count} paragraphs)"
 
     def __repr__(self) -> str:
+        stats = self.statistics()
         return (
-            f"Document(sections={len(self.sections)}, "
-            f"paragraphs={self.paragraph_count}, "
-            f"tables={self.table_count}, "
-            f"images={self.image_count})"
+            f"Document(sections={stats.sections}, "
+            f"paragraphs={stats.paragraphs}, "
+            f"tables={stats.tables}, "
+            f"images={stats.images})"
         )
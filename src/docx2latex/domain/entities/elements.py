@@ -7,7 +7,10 @@ These are the core building blocks of a document structure.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
+from itertools import count
 from typing import TYPE_CHECKING, Any, Self
 from uuid import UUID, uuid4
 
@@ -23,14 +26,57 @@ from docx2latex.domain.value_objects.style import (
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from lxml import etree
+
+    from docx2latex.domain.value_objects.part_ref import PartRef
+
+# Source of element IDs; parsing installs a fresh counter per document
+_element_ids: ContextVar[Iterator[int] | None] = ContextVar("element_ids", default=None)
+
+# Fallback for elements created outside any ID scope
+_process_ids = count(1)
+
+
+def next_element_id() -> int:
+    """Get the next element ID from the current ID scope."""
+    ids = _element_ids.get()
+    return next(ids if ids is not None else _process_ids)
+
+
+@contextmanager
+def element_id_scope(ids: Iterator[int] | None = None) -> Iterator[None]:
+    """
+    Number the elements created inside the block 1, 2, 3, ...
+
+    The parser opens one scope per document, so element IDs are small,
+    deterministic and unique within their document. Elements created
+    outside any scope draw from a process-wide counter.
+
+    Args:
+        ids: ID source to use instead of a fresh counter, to keep
+            numbering across several scopes (e.g. successive revisions
+            of one document)
+    """
+    token = _element_ids.set(ids if ids is not None else count(1))
+    try:
+        yield
+    finally:
+        _element_ids.reset(token)
+
 
 class DocumentElement(ABC):
     """
     Abstract base class for all document elements.
 
     Provides common interface for traversal and identification.
+    Elements are slotted dataclasses identified by a document-scoped
+    integer ``id``; a globally unique ``uuid`` is created on demand.
     """
 
+    __slots__ = ("_uuid",)
+
+    _uuid: UUID
+
     @property
     @abstractmethod
     def element_type(self) -> str:
@@ -42,6 +88,16 @@ class DocumentElement(ABC):
         """Iterate over child elements."""
         ...
 
+    @property
+    def uuid(self) -> UUID:
+        """Globally unique identifier, created on first access."""
+        try:
+            return self._uuid
+        except AttributeError:
+            uuid = uuid4()
+            self._uuid = uuid
+            return uuid
+
     def accept(self, visitor: Any) -> Any:
         """Accept a visitor (Visitor pattern)."""
         method_name = f"visit_{self.element_type}"
@@ -49,7 +105,7 @@ class DocumentElement(ABC):
         return method(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Run(DocumentElement):
     """
     A run of text with consistent formatting.
@@ -60,7 +116,7 @@ class Run(DocumentElement):
 
     text: str
     style: TextStyle = field(default_factory=TextStyle.empty)
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -77,7 +133,7 @@ class Run(DocumentElement):
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class Hyperlink(DocumentElement):
     """
     A hyperlink element containing runs.
@@ -89,7 +145,7 @@ class Hyperlink(DocumentElement):
     runs: list[Run] = field(default_factory=list)
     tooltip: str | None = None
     bookmark: str | None = None  # Internal bookmark reference
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -108,23 +164,37 @@ class Hyperlink(DocumentElement):
         return self.bookmark is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class MathBlock(DocumentElement):
     """
     A mathematical formula.
 
-    Contains the original OMML XML and converted LaTeX.
+    Contains the original OMML and converted LaTeX. The parser stores
+    the OMML as the element subtree it already built, so converting it
+    needs no serialise/reparse round trip; XML text is accepted too
+    (e.g. for formulas built by hand) and is serialised on demand by
+    ``omml_xml``.
     """
 
-    omml_xml: str  # Original Office Math ML
+    omml: str | etree._Element  # Original Office Math ML
     latex: str = ""  # Converted LaTeX (filled during conversion)
     math_type: MathType = MathType.INLINE
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
         return "math"
 
+    @property
+    def omml_xml(self) -> str:
+        """Original OMML as XML text."""
+        if isinstance(self.omml, str):
+            return self.omml
+        # Only the parser stores elements, so lxml is available here
+        from lxml import etree
+
+        return etree.tostring(self.omml, encoding="unicode", with_tail=False)
+
     def children(self) -> Iterator[DocumentElement]:
         return iter([])
 
@@ -133,7 +203,7 @@ class MathBlock(DocumentElement):
         return self.math_type in (MathType.DISPLAY, MathType.EQUATION)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph(DocumentElement):
     """
     A paragraph element containing runs, math, and hyperlinks.
@@ -144,7 +214,7 @@ class Paragraph(DocumentElement):
     # Content can be runs, math blocks, or hyperlinks
     content: list[Run | MathBlock | Hyperlink] = field(default_factory=list)
     style: ParagraphStyle = field(default_factory=ParagraphStyle.empty)
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -193,50 +263,63 @@ class Paragraph(DocumentElement):
 
     def add_math(self, omml_xml: str, math_type: MathType = MathType.INLINE) -> MathBlock:
         """Add a math block to the paragraph."""
-        math = MathBlock(omml_xml=omml_xml, math_type=math_type)
+        math = MathBlock(omml=omml_xml, math_type=math_type)
         self.content.append(math)
         return math
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell(DocumentElement):
     """
-    A table cell containing paragraphs.
+    A table cell containing paragraphs and nested tables.
 
     Can span multiple rows or columns.
     """
 
-    paragraphs: list[Paragraph] = field(default_factory=list)
+    content: list[Paragraph | Table] = field(default_factory=list)
     row_span: int = 1
     col_span: int = 1
     width: Dimension | None = None
     alignment: Alignment = Alignment.LEFT
     vertical_alignment: str = "top"  # top, center, bottom
     is_header: bool = False
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
         return "table_cell"
 
     def children(self) -> Iterator[DocumentElement]:
-        return iter(self.paragraphs)
+        return iter(self.content)
+
+    @property
+    def paragraphs(self) -> list[Paragraph]:
+        """Get the paragraphs directly in this cell (not in nested tables)."""
+        return [item for item in self.content if isinstance(item, Paragraph)]
 
     @property
     def text(self) -> str:
         """Get plain text content."""
-        return "\n".join(p.text for p in self.paragraphs)
+        return "\n".join(item.text for item in self.content)
 
     def is_empty(self) -> bool:
         """Check if cell has no content."""
-        return all(p.is_empty() for p in self.paragraphs)
+        return all(item.is_empty() for item in self.content)
+
+    def iter_paragraphs(self) -> Iterator[Paragraph]:
+        """Iterate over all paragraphs in the cell, including nested tables."""
+        for item in self.content:
+            if isinstance(item, Paragraph):
+                yield item
+            else:
+                yield from item.iter_paragraphs()
 
     def is_merged(self) -> bool:
         """Check if this cell spans multiple rows or columns."""
         return self.row_span > 1 or self.col_span > 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow(DocumentElement):
     """
     A table row containing cells.
@@ -245,7 +328,7 @@ class TableRow(DocumentElement):
     cells: list[TableCell] = field(default_factory=list)
     height: Dimension | None = None
     is_header: bool = False
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -260,7 +343,7 @@ class TableRow(DocumentElement):
         return sum(cell.col_span for cell in self.cells)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(DocumentElement):
     """
     A table element containing rows.
@@ -272,7 +355,7 @@ class Table(DocumentElement):
     caption: str | None = None
     label: str | None = None  # For cross-references
     has_header_row: bool = False
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -298,8 +381,32 @@ class Table(DocumentElement):
         """Get rows marked as header."""
         return [row for row in self.rows if row.is_header]
 
+    @property
+    def text(self) -> str:
+        """Get plain text content, one line per cell."""
+        return "\n".join(cell.text for row in self.rows for cell in row.cells)
 
-@dataclass
+    def is_empty(self) -> bool:
+        """Check if no cell has content."""
+        return all(cell.is_empty() for row in self.rows for cell in row.cells)
+
+    def iter_paragraphs(self) -> Iterator[Paragraph]:
+        """Iterate over all paragraphs in the table, including nested tables."""
+        for row in self.rows:
+            for cell in row.cells:
+                yield from cell.iter_paragraphs()
+
+    def iter_tables(self) -> Iterator[Table]:
+        """Iterate over this table and all tables nested in it (depth-first)."""
+        yield self
+        for row in self.rows:
+            for cell in row.cells:
+                for item in cell.content:
+                    if isinstance(item, Table):
+                        yield from item.iter_tables()
+
+
+@dataclass(slots=True)
 class ListItem(DocumentElement):
     """
     A list item containing paragraphs.
@@ -311,7 +418,7 @@ class ListItem(DocumentElement):
     sub_items: list[ListItem] = field(default_factory=list)
     level: int = 0
     number: int | str | None = None  # For numbered lists
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -329,8 +436,14 @@ class ListItem(DocumentElement):
     def has_sub_items(self) -> bool:
         return len(self.sub_items) > 0
 
+    def iter_paragraphs(self) -> Iterator[Paragraph]:
+        """Iterate over all paragraphs in the item, including sub-items."""
+        yield from self.paragraphs
+        for sub_item in self.sub_items:
+            yield from sub_item.iter_paragraphs()
+
 
-@dataclass
+@dataclass(slots=True)
 class ListBlock(DocumentElement):
     """
     A list (bulleted or numbered) containing items.
@@ -340,7 +453,7 @@ class ListBlock(DocumentElement):
     list_type: ListType = ListType.BULLET
     start_number: int = 1
     level: int = 0
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -353,7 +466,7 @@ class ListBlock(DocumentElement):
         return self.list_type != ListType.BULLET
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(DocumentElement):
     """
     An image element.
@@ -379,10 +492,11 @@ class Image(DocumentElement):
     alt_text: str | None = None
     label: str | None = None  # For cross-references
 
-    # Raw data (filled during parsing)
+    # Image content: in-memory bytes, or a lazy handle into the package
     data: bytes = field(default=b"", repr=False)
+    source: PartRef | None = None
 
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_element_id)
 
     @property
     def element_type(self) -> str:
@@ -407,6 +521,17 @@ class Image(DocumentElement):
         }
         return type_map.get(self.content_type, "png")
 
+    @property
+    def size(self) -> int:
+        """Get image size in bytes without loading the data."""
+        if self.data:
+            return len(self.data)
+        return self.source.size if self.source else 0
+
+    def has_content(self) -> bool:
+        """Check if image bytes are available (in memory or in the package)."""
+        return bool(self.data) or self.source is not None
+
     def needs_conversion(self) -> bool:
         """Check if image format needs conversion for LaTeX."""
         return self.extension in ("emf", "wmf", "gif")
@@ -7,7 +7,7 @@ Defines the interface for parsing DOCX files into domain entities.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import IO, TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from docx2latex.domain.entities.document import Document
@@ -45,3 +45,15 @@ class IDocumentParser(Protocol):
             Result containing the parsed Document or an error message
         """
         ...
+
+    def parse_stream(self, stream: IO[bytes]) -> Result[Document, str]:
+        """
+        Parse DOCX data from a binary stream.
+
+        Args:
+            stream: Readable binary stream containing a DOCX package
+
+        Returns:
+            Result containing the parsed Document or an error message
+        """
+        ...
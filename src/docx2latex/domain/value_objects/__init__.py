@@ -9,6 +9,8 @@ from docx2latex.domain.value_objects.color import Color
 from docx2latex.domain.value_objects.dimension import Dimension, DimensionUnit
 from docx2latex.domain.value_objects.font import FontSpec
 from docx2latex.domain.value_objects.layout import PageLayout
+from docx2latex.domain.value_objects.part_ref import PackageArchive, PartRef
+from docx2latex.domain.value_objects.statistics import DocumentStatistics
 from docx2latex.domain.value_objects.style import (
     Alignment,
     BorderSide,
@@ -26,10 +28,13 @@ __all__ = [
     "Color",
     "Dimension",
     "DimensionUnit",
+    "DocumentStatistics",
     "FontSpec",
     "ListType",
     "MathType",
+    "PackageArchive",
     "PageLayout",
     "ParagraphStyle",
+    "PartRef",
     "TextStyle",
 ]
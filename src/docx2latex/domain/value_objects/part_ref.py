@@ -0,0 +1,113 @@
+"""
+Package part reference value object.
+
+Points at a member of a DOCX (ZIP) package without holding its bytes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class PackageArchive:
+    """
+    Open archive of a DOCX package, shared by the part references into it.
+
+    The ZIP central directory is read once, when the first part is
+    opened, rather than once per part; the archive then stays open
+    until closed or garbage collected. A forked child process opens an
+    archive of its own, since reads through a file offset shared with
+    its parent would interleave.
+    """
+
+    def __init__(self, package: Path | bytes | IO[bytes], owns_package: bool = False) -> None:
+        """
+        Initialize the archive (nothing is opened yet).
+
+        Args:
+            package: File path, raw archive bytes or seekable stream
+            owns_package: Close the stream along with the archive
+        """
+        self.package = package
+        self._owns_package = owns_package
+        self._lock = threading.Lock()
+        self._archive: zipfile.ZipFile | None = None
+        self._pid = 0
+
+    def open(self, member: str) -> IO[bytes]:
+        """Open a member of the package for streaming reads."""
+        with self._lock:
+            if self._archive is None or self._pid != os.getpid():
+                package = self.package
+                source = BytesIO(package) if isinstance(package, bytes) else package
+                self._archive = zipfile.ZipFile(source)
+                self._pid = os.getpid()
+            return self._archive.open(member)
+
+    def close(self) -> None:
+        """Close the archive, and the package stream if it is owned."""
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+            if self._owns_package and not isinstance(self.package, (bytes, os.PathLike)):
+                self.package.close()
+
+    def __copy__(self) -> PackageArchive:
+        # A handle on an external resource: copies share it
+        return self
+
+    def __deepcopy__(self, _memo: dict[int, object]) -> PackageArchive:
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class PartRef:
+    """
+    Immutable, lazy handle to a part inside a DOCX package.
+
+    Stores only where the part lives (package and member name) and the
+    size and CRC recorded in the ZIP central directory. The part is
+    decompressed only when opened. The package may be a file path, the
+    raw archive bytes, or a seekable stream that is kept open. Part
+    references into the same package share an open archive through
+    ``archive``; without one, each open reads the package afresh.
+    """
+
+    package: Path | bytes | IO[bytes] = field(repr=False)
+    member: str
+    size: int = 0
+    crc: int = 0
+    archive: PackageArchive | None = field(default=None, repr=False, compare=False)
+
+    @contextmanager
+    def open(self) -> Iterator[IO[bytes]]:
+        """
+        Open the part for streaming reads.
+
+        Yields:
+            Readable binary stream of the decompressed part
+        """
+        if self.archive is not None:
+            with self.archive.open(self.member) as stream:
+                yield stream
+            return
+
+        source = BytesIO(self.package) if isinstance(self.package, bytes) else self.package
+        with zipfile.ZipFile(source) as archive, archive.open(self.member) as stream:
+            yield stream
+
+    def read(self) -> bytes:
+        """Read the whole part into memory."""
+        with self.open() as stream:
+            return stream.read()
@@ -0,0 +1,47 @@
+"""
+Document statistics value object.
+
+Counts and sizes of a document's content, collected in one traversal.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentStatistics:
+    """
+    Immutable summary of a document's content.
+
+    Produced by Document.statistics(), which walks the element tree
+    once; read several numbers from one instance instead of calling the
+    per-count properties of Document, each of which walks the tree again.
+    """
+
+    sections: int = 0
+    elements: int = 0  # Top-level elements of all sections
+    paragraphs: int = 0  # Including paragraphs in tables and lists
+    tables: int = 0  # Including nested tables
+    math_blocks: int = 0
+    images: int = 0
+    text_length: int = 0  # Characters of run text (hyperlinks included)
+    max_table_depth: int = 0  # 1 for a table without nested tables
+    max_list_depth: int = 0  # 1 for a list without sub-items
+    by_type: dict[str, int] = field(default_factory=dict, hash=False)  # Per element_type
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary (e.g. for JSON output)."""
+        return {
+            "sections": self.sections,
+            "elements": self.elements,
+            "paragraphs": self.paragraphs,
+            "tables": self.tables,
+            "math_blocks": self.math_blocks,
+            "images": self.images,
+            "text_length": self.text_length,
+            "max_table_depth": self.max_table_depth,
+            "max_list_depth": self.max_list_depth,
+            "by_type": dict(self.by_type),
+        }
@@ -261,7 +261,7 @@ class ParagraphStyle:
     page_break_before: bool = False
     style_name: str | None = None
     outline_level: int | None = None  # For headings (0-8)
-    borders: dict[BorderSide, BorderStyle] = field(default_factory=dict)
+    borders: dict[BorderSide, BorderStyle] = field(default_factory=dict, hash=False)
 
     def is_heading(self) -> bool:
         """Check if this is a heading style."""
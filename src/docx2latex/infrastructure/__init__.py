@@ -5,5 +5,6 @@ Contains implementations of domain protocols:
 - DOCX parsing
 - Element converters
 - LaTeX writing
+- Parse caching
 - Asset management
 """
@@ -0,0 +1,13 @@
+"""
+Caching infrastructure.
+
+Persists expensive intermediate results between conversions.
+"""
+
+from docx2latex.infrastructure.caching.equation_store import EquationStore
+from docx2latex.infrastructure.caching.parse_cache import ParseCache
+
+__all__ = [
+    "EquationStore",
+    "ParseCache",
+]
@@ -0,0 +1,258 @@
+"""
+Persistent store of converted equations.
+
+Lets worker processes, and successive runs over a corpus, share the
+LaTeX of recurring formulas through a local SQLite database.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, cast
+
+from docx2latex import __version__
+from docx2latex.infrastructure.converters.math.converter import MATH_CONVERTER_VERSION
+from docx2latex.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger("equation_store")
+
+# Writes are buffered and committed in batches of this size
+DEFAULT_BATCH_SIZE = 256
+
+# Default eviction bounds
+DEFAULT_MAX_AGE_DAYS = 90
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# How long a connection waits for another process's write lock
+BUSY_TIMEOUT_S = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS equations (
+    key BLOB NOT NULL,
+    version TEXT NOT NULL,
+    latex TEXT NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (key, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS equations_used ON equations (used);
+"""
+
+
+def default_version() -> str:
+    """Version tag of the LaTeX the current math converter produces."""
+    return f"{__version__}/{MATH_CONVERTER_VERSION}"
+
+
+class EquationStore:
+    """
+    SQLite-backed store of converted formulas, shared between processes.
+
+    Entries are keyed by the formula key (see omml_key) and the version
+    of the converter that produced them; entries of any other version
+    are never read, so a converter change invalidates them
+    automatically. They are left in place for processes still running
+    that version, and age out like any unused entry.
+
+    The database runs in WAL mode, so any number of processes read it
+    concurrently while one writes. New entries and last-use times are
+    buffered and committed in batches. Entries unused for ``max_age_days``
+    are evicted on close, then the least recently used ones beyond
+    ``max_entries``. Database errors are logged and disable the store;
+    they never fail a conversion.
+
+    A SQLite connection must not be used across fork, so in a forked
+    child process the store is disabled: it reads and writes nothing,
+    and leaves the parent's connection alone.
+
+    Usually wrapped by a MathCache, which keeps the hot formulas in
+    memory. One instance may be shared by the threads of a process.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        version: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Database file
+            version: Converter version tag (default: default_version())
+            batch_size: Number of buffered writes that triggers a commit
+            max_age_days: Age after which unused entries are evicted
+            max_entries: Maximum number of entries kept
+        """
+        self._path = path
+        self._version = version or default_version()
+        self._batch_size = batch_size
+        self._max_age_s = max_age_days * 86400
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._pending: dict[bytes, str] = {}
+        self._touched: set[bytes] = set()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        # Connection inherited through fork, kept referenced so that it
+        # is never closed (or otherwise used) by the child
+        self._inherited: sqlite3.Connection | None = None
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                path, timeout=BUSY_TIMEOUT_S, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Equation store disabled, cannot open {path}: {e}")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def available(self) -> bool:
+        """Check if the store is open and usable."""
+        return self._connection is not None and self._pid == os.getpid()
+
+    def get(self, key: bytes) -> str | None:
+        """Get the LaTeX of a formula, or None if it is not stored."""
+        with self._lock:
+            self._check_process()
+            latex = self._pending.get(key)
+            if latex is not None or self._connection is None:
+                return latex
+            try:
+                row = self._connection.execute(
+                    "SELECT latex FROM equations WHERE key = ? AND version = ?",
+                    (key, self._version),
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+
+            if row is None:
+                return None
+            self._touched.add(key)
+            self._flush_if_full()
+            return cast("str", row[0])
+
+    def put(self, key: bytes, latex: str) -> None:
+        """Store the LaTeX of a formula (committed with the next batch)."""
+        with self._lock:
+            self._check_process()
+            if self._connection is None:
+                return
+            self._pending[key] = latex
+            self._flush_if_full()
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        with self._lock:
+            self._check_process()
+            self._flush()
+
+    def close(self) -> None:
+        """Commit buffered writes, evict old entries and close the database."""
+        with self._lock:
+            self._check_process()
+            self._flush()
+            if self._connection is None:
+                return
+            try:
+                self._evict(self._connection)
+            except sqlite3.Error as e:
+                logger.warning(f"Equation store eviction failed: {e}")
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> EquationStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._check_process()
+            if self._connection is None:
+                return 0
+            try:
+                row = self._connection.execute("SELECT COUNT(*) FROM equations").fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return 0
+            return cast("int", row[0])
+
+    def _check_process(self) -> None:
+        """Disable the store in a process forked since it was opened."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._inherited, self._connection = self._connection, None
+        # Buffered entries are the parent's to commit
+        self._pending.clear()
+        self._touched.clear()
+
+    def _flush_if_full(self) -> None:
+        if len(self._pending) + len(self._touched) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Commit buffered entries and last-use times in one transaction."""
+        if self._connection is None or not (self._pending or self._touched):
+            return
+
+        now = time.time()
+        try:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO equations (key, version, latex, used) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(key, self._version, latex, now) for key, latex in self._pending.items()],
+                )
+                self._connection.executemany(
+                    "UPDATE equations SET used = ? WHERE key = ? AND version = ?",
+                    [(now, key, self._version) for key in self._touched],
+                )
+        except sqlite3.Error as e:
+            self._disable(e)
+        self._pending.clear()
+        self._touched.clear()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """
+        Remove entries unused for too long, then the oldest beyond the bound.
+
+        Entries of every version count, so those of older converters go
+        once they stop being used.
+        """
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM equations WHERE used < ?", (time.time() - self._max_age_s,)
+            )
+            connection.execute(
+                "DELETE FROM equations WHERE used <= ("
+                "SELECT used FROM equations ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def _disable(self, error: sqlite3.Error) -> None:
+        logger.warning(f"Equation store disabled after error: {error}")
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
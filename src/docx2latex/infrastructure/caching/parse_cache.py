@@ -0,0 +1,272 @@
+"""
+Content-addressed on-disk cache of parsed documents.
+
+Reconverting an unchanged DOCX (new options, another document class,
+a template fix) can reuse the Document parsed the first time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import stat
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any
+
+from lxml import etree
+
+from docx2latex import __version__
+from docx2latex.domain.entities.document import Document
+from docx2latex.domain.value_objects.part_ref import PackageArchive, PartRef
+from docx2latex.shared.logging import get_logger
+
+logger = get_logger("parse_cache")
+
+# Bump when the cached representation changes incompatibly
+CACHE_FORMAT_VERSION = 2
+
+# Default bound on the total size of the cache directory
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+CACHE_FILE_SUFFIX = ".doc.z"
+
+# Errors that make a cache entry unusable (treated as a miss)
+_LOAD_ERRORS = (
+    OSError,
+    EOFError,
+    zlib.error,
+    pickle.UnpicklingError,
+    etree.XMLSyntaxError,
+    AttributeError,
+    TypeError,
+    ValueError,
+)
+
+
+def _is_private_directory(directory: Path) -> bool:
+    """
+    Check that a directory is owned by the current user and writable by nobody else.
+
+    Always true on platforms without POSIX ownership.
+    """
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return True
+    try:
+        info = directory.stat()
+    except OSError:
+        return False
+    return info.st_uid == getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class _DocumentPickler(pickle.Pickler):
+    """Pickler storing image part references without their package, and XML subtrees as XML."""
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, PartRef):
+            return ("part", obj.member, obj.size, obj.crc)
+        if isinstance(obj, etree._Element):
+            return ("xml", etree.tostring(obj, with_tail=False))
+        return None
+
+
+class _DocumentUnpickler(pickle.Unpickler):
+    """Unpickler binding image part references to the current package file."""
+
+    def __init__(self, file: io.BytesIO, package: Path) -> None:
+        super().__init__(file)
+        self._package = package
+        self._archive = PackageArchive(package)
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, *args = pid
+        if kind == "part":
+            member, size, crc = args
+            return PartRef(
+                package=self._package, member=member, size=size, crc=crc, archive=self._archive
+            )
+        if kind == "xml":
+            return etree.fromstring(args[0])
+        raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed Documents, keyed by the content of their DOCX.
+
+    The key is the SHA-256 of the input bytes salted with the package
+    and cache format versions, so an upgrade never serves a stale
+    parse. Documents are stored pickled and zlib-compressed; image parts
+    are stored as references into the package, never as bytes, and are
+    rebound to the file being converted when an entry is loaded. OMML
+    subtrees are stored as XML and rebuilt on load.
+
+    The directory is bounded in size: when a store pushes it past the
+    limit, the least recently used entries are evicted (entries are
+    touched on every hit). Entries are written atomically, so several
+    processes can share a directory. Cache failures are logged and
+    treated as misses; they never fail a conversion.
+
+    Loading an entry unpickles it, which can run arbitrary code, so the
+    cache trusts whoever can write to its directory. It is created
+    private to the current user, and a directory that is owned by
+    another user or writable by group or others is ignored.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        salt: str = "",
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first store)
+            max_bytes: Maximum total size of the cache entries
+            salt: Extra key salt, for parsers configured differently
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._salt = f"docx2latex {__version__}/{CACHE_FORMAT_VERSION}/{salt}".encode()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def key_for(self, path: Path) -> str:
+        """
+        Compute the cache key of a DOCX file.
+
+        Args:
+            path: Path to the DOCX file
+
+        Returns:
+            Hex digest identifying the file content
+        """
+        digest = hashlib.sha256(self._salt)
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str, package: Path) -> Document | None:
+        """
+        Load a cached Document.
+
+        Args:
+            key: Cache key (see key_for)
+            package: DOCX file the Document's images are read from
+
+        Returns:
+            The cached Document, or None on a miss
+        """
+        entry = self._entry_path(key)
+        if self._directory.exists() and not self._is_trusted():
+            self.misses += 1
+            return None
+
+        try:
+            data = zlib.decompress(entry.read_bytes())
+            document = _DocumentUnpickler(io.BytesIO(data), package).load()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except _LOAD_ERRORS as e:
+            logger.warning(f"Discarding unreadable cache entry {entry.name}: {e}")
+            entry.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        if not isinstance(document, Document):
+            logger.warning(f"Discarding cache entry {entry.name}: not a Document")
+            entry.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Mark as recently used
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+
+        document.source_path = package
+        self.hits += 1
+        return document
+
+    def put(self, key: str, document: Document) -> None:
+        """
+        Store a Document, evicting old entries if the cache is full.
+
+        Args:
+            key: Cache key (see key_for)
+            document: Parsed document
+        """
+        try:
+            buffer = io.BytesIO()
+            _DocumentPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(document)
+            data = zlib.compress(buffer.getbuffer(), 6)
+
+            self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_trusted():
+                return
+            fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                tmp_path.replace(self._entry_path(key))
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            logger.warning(f"Failed to cache parsed document: {e}")
+            return
+
+        self._evict()
+
+    def _is_trusted(self) -> bool:
+        """Check that only the current user can write cache entries."""
+        if _is_private_directory(self._directory):
+            return True
+        logger.warning(
+            f"Ignoring cache directory {self._directory}: "
+            "it must be owned by the current user and not writable by others"
+        )
+        return False
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its bound."""
+        entries = []
+        total = 0
+        for entry in self._directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        if total <= self._max_bytes:
+            return
+
+        entries.sort(key=lambda item: item[0])
+        for _, size, entry in entries:
+            if total <= self._max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for entry in self._directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            entry.unlink(missing_ok=True)
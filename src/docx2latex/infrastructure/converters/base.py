@@ -7,7 +7,7 @@ Provides common structure for all element converters.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from docx2latex.domain.entities.elements import DocumentElement
 from docx2latex.domain.protocols.converter import ConversionContext, IElementConverter
@@ -27,8 +27,20 @@ class BaseConverter(ABC, Generic[T]):
 
     Uses the Template Method pattern to provide a consistent
     conversion flow while allowing subclasses to customize steps.
+    Subclasses that override neither hook skip them: convert returns
+    the result of do_convert as is.
     """
 
+    # Whether the class overrides pre_convert or post_convert
+    _has_hooks: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._has_hooks = (
+            cls.pre_convert is not BaseConverter.pre_convert
+            or cls.post_convert is not BaseConverter.post_convert
+        )
+
     @property
     @abstractmethod
     def element_type(self) -> str:
@@ -56,6 +68,9 @@ class BaseConverter(ABC, Generic[T]):
             Result containing LaTeX string or error message
         """
         try:
+            if not self._has_hooks:
+                return self.do_convert(element, context)
+
             # Pre-conversion
             pre_result = self.pre_convert(element, context)
             if isinstance(pre_result, Err):
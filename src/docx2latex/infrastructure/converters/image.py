@@ -6,6 +6,7 @@ Converts Image entities to LaTeX figures.
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 from docx2latex.domain.entities.elements import DocumentElement, Image
@@ -17,6 +18,9 @@ from docx2latex.shared.result import Ok, Result
 
 logger = get_logger("image")
 
+# Chunk size for streaming image parts out of the package
+IMAGE_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class ImageConverter(BaseConverter[Image]):
     """
@@ -36,7 +40,7 @@ class ImageConverter(BaseConverter[Image]):
         self, element: Image, context: ConversionContext
     ) -> Result[None, str]:
         """Export image to file before conversion."""
-        if not element.data:
+        if not element.has_content():
             return Ok(None)
 
         if context.output_dir is None:
@@ -55,7 +59,12 @@ class ImageConverter(BaseConverter[Image]):
         # Write image file
         image_path = image_dir / filename
         try:
-            image_path.write_bytes(element.data)
+            if element.data or element.source is None:
+                image_path.write_bytes(element.data)
+            else:
+                # Stream straight from the package without materialising the bytes
+                with element.source.open() as src, image_path.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, IMAGE_COPY_CHUNK_SIZE)
             # Store path for conversion
             element.filename = str(Path(context.image_dir) / filename)
         except Exception as e:
@@ -4,11 +4,20 @@ Math conversion module - OMML to LaTeX.
 This is the critical module for high-quality math conversion.
 """
 
+from docx2latex.infrastructure.converters.math.cache import MathCache, MathCacheStats
 from docx2latex.infrastructure.converters.math.converter import MathConverter
+from docx2latex.infrastructure.converters.math.extractor import (
+    EquationExtractor,
+    ExtractedEquation,
+)
 from docx2latex.infrastructure.converters.math.omml_parser import OmmlParser
 from docx2latex.infrastructure.converters.math.symbols import SymbolMapper
 
 __all__ = [
+    "EquationExtractor",
+    "ExtractedEquation",
+    "MathCache",
+    "MathCacheStats",
     "MathConverter",
     "OmmlParser",
     "SymbolMapper",
@@ -0,0 +1,214 @@
+"""
+Memoisation of OMML to LaTeX conversions.
+
+The same formulas recur constantly, within a document and across
+documents (``x``, ``i=1``, ``\\sum_{i=1}^{n}``, units), so converted
+LaTeX is cached by the canonical form of its OMML.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from lxml import etree
+
+if TYPE_CHECKING:
+    from docx2latex.infrastructure.caching.equation_store import EquationStore
+
+# Default bounds of a MathCache
+DEFAULT_MATH_CACHE_ENTRIES = 4096
+DEFAULT_MATH_CACHE_BYTES = 8 * 1024 * 1024
+
+# Marks revision-tracking attributes (w:rsidR, w:rsidRPr, ...) in canonical XML;
+# they do not affect rendering
+_RSID_MARKER = b":rsid"
+
+# Approximate fixed cost of an entry (key, string and dict overhead)
+_ENTRY_OVERHEAD = 128
+
+
+def omml_key(omml: str | etree._Element) -> bytes:
+    """
+    Compute the cache key of an OMML formula.
+
+    The key is a digest of the canonical form of the formula (see
+    canonical_omml), so the same formula gets the same key whatever its
+    namespace declarations, attribute order or editing history.
+
+    Args:
+        omml: OMML root element, or OMML XML string
+
+    Returns:
+        16-byte digest
+
+    Raises:
+        etree.XMLSyntaxError: If an XML string is malformed
+    """
+    return canonical_key(canonical_omml(omml))
+
+
+def canonical_omml(omml: str | etree._Element) -> bytes:
+    """
+    Serialise an OMML formula in canonical form.
+
+    The form is exclusive C14N with revision IDs removed. It is a
+    standalone XML document, declaring the namespaces it uses.
+
+    Args:
+        omml: OMML root element, or OMML XML string
+
+    Returns:
+        Canonical XML
+
+    Raises:
+        etree.XMLSyntaxError: If an XML string is malformed
+    """
+    root = etree.fromstring(omml.encode()) if isinstance(omml, str) else omml
+    canonical = etree.tostring(root, method="c14n", exclusive=True, with_comments=False)
+
+    if _RSID_MARKER in canonical:
+        # Rare in math: drop revision IDs from a copy, along with the
+        # namespace declarations they alone made visible
+        root = copy.deepcopy(root)
+        for elem in root.iter(etree.Element):
+            for name in [name for name in elem.attrib if _is_rsid(name)]:
+                del elem.attrib[name]
+        canonical = etree.tostring(root, method="c14n", exclusive=True, with_comments=False)
+
+    return canonical
+
+
+def canonical_key(canonical: bytes) -> bytes:
+    """Compute the cache key of a formula from its canonical form."""
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _is_rsid(name: str | bytes) -> bool:
+    """Check if an attribute name is a revision ID (w:rsidR, w:rsidRPr, ...)."""
+    if isinstance(name, bytes):
+        name = name.decode()
+    return name.rpartition("}")[2].startswith("rsid")
+
+
+@dataclass(frozen=True, slots=True)
+class MathCacheStats:
+    """Counters of a MathCache."""
+
+    hits: int = 0
+    misses: int = 0
+    store_hits: int = 0  # Hits served by the persistent store (included in hits)
+    entries: int = 0
+    bytes: int = 0
+
+
+class MathCache:
+    """
+    Bounded LRU cache of converted formulas.
+
+    Maps OMML keys (see omml_key) to the LaTeX the math converter
+    produced, before wrapping it for its math type. Bounded by entry
+    count and by approximate size; the least recently used formulas are
+    evicted first. Safe to share between threads, and meant to be
+    shared across all documents converted by one service.
+
+    With an EquationStore, the cache is the first level in front of
+    it: memory misses are looked up in the store, and new conversions
+    are written through to it, so other processes and later runs
+    reuse them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MATH_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_MATH_CACHE_BYTES,
+        store: EquationStore | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached formulas
+            max_bytes: Maximum approximate size of the cached entries
+            store: Persistent store behind the cache (default: none)
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._store = store
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._store_hits = 0
+
+    @property
+    def store(self) -> EquationStore | None:
+        return self._store
+
+    def get(self, key: bytes) -> str | None:
+        """Get the LaTeX of a formula, or None if it is not cached."""
+        with self._lock:
+            latex = self._entries.get(key)
+            if latex is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return latex
+
+        latex = self._store.get(key) if self._store is not None else None
+        with self._lock:
+            if latex is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._store_hits += 1
+        self._insert(key, latex)
+        return latex
+
+    def put(self, key: bytes, latex: str) -> None:
+        """Cache the LaTeX of a formula, evicting old entries if needed."""
+        self._insert(key, latex)
+        if self._store is not None:
+            self._store.put(key, latex)
+
+    def flush(self) -> None:
+        """Commit pending writes to the persistent store, if any."""
+        if self._store is not None:
+            self._store.flush()
+
+    def _insert(self, key: bytes, latex: str) -> None:
+        """Add an entry to the memory level."""
+        size = len(latex) + _ENTRY_OVERHEAD
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous) + _ENTRY_OVERHEAD
+            self._entries[key] = latex
+            self._bytes += size
+
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted) + _ENTRY_OVERHEAD
+
+    @property
+    def stats(self) -> MathCacheStats:
+        with self._lock:
+            return MathCacheStats(
+                self._hits, self._misses, self._store_hits, len(self._entries), self._bytes
+            )
+
+    def clear(self) -> None:
+        """Remove all entries from memory (counters and the store are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,26 +6,65 @@ Converts MathBlock entities to LaTeX using the OMML parser.
 
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from lxml import etree
+
 from docx2latex.domain.entities.elements import DocumentElement, MathBlock
 from docx2latex.domain.protocols.converter import ConversionContext
 from docx2latex.domain.value_objects.style import MathType
 from docx2latex.infrastructure.converters.base import BaseConverter
+from docx2latex.infrastructure.converters.math.cache import (
+    MathCache,
+    canonical_key,
+    canonical_omml,
+    omml_key,
+)
 from docx2latex.infrastructure.converters.math.omml_parser import OmmlParser
 from docx2latex.shared.logging import get_logger
 from docx2latex.shared.result import Ok, Result
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = get_logger("math")
 
+# Bump whenever a change to the OMML conversion alters the LaTeX produced
+# for some formula; persisted conversions of other versions are ignored
+MATH_CONVERTER_VERSION = 5
+
+# Fewer distinct formulas than this are converted in-process even when
+# workers are requested: starting the pool would cost more than it saves
+PARALLEL_MIN_FORMULAS = 256
+
+# Chunks submitted per worker process
+_CHUNKS_PER_WORKER = 4
+
 
 class MathConverter(BaseConverter[MathBlock]):
     """
     Converter for math blocks.
 
-    Transforms OMML XML to LaTeX math notation.
+    Transforms OMML to LaTeX math notation. With a MathCache, each
+    distinct formula is converted once and then served from the cache.
+
+    convert_many converts a document's formulas ahead of its paragraphs,
+    each distinct one once and optionally across processes; converting
+    a block it filled in then just wraps its LaTeX.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: MathCache | None = None) -> None:
+        """
+        Initialize the converter.
+
+        Args:
+            cache: Cache of converted formulas (default: no caching)
+        """
         self._parser = OmmlParser()
+        self._cache = cache
 
     @property
     def element_type(self) -> str:
@@ -52,11 +91,8 @@ class MathConverter(BaseConverter[MathBlock]):
         context.require_package("amssymb")
         context.require_package("mathtools")
 
-        # Parse OMML to LaTeX
-        latex_content = self._parser.parse(element.omml_xml)
-
-        # Clean up the LaTeX
-        latex_content = self._clean_latex(latex_content)
+        # Convert OMML to LaTeX, unless convert_many already did
+        latex_content = element.latex or self._to_latex(element.omml)
 
         # Store converted LaTeX back in element for reference
         element.latex = latex_content
@@ -74,33 +110,97 @@ class MathConverter(BaseConverter[MathBlock]):
         else:
             return Ok(f"${latex_content}$")
 
-    def _clean_latex(self, latex: str) -> str:
+    def convert_many(self, blocks: Iterable[MathBlock], workers: int = 1) -> int:
         """
-        Clean and optimize LaTeX output.
+        Convert math blocks ahead of time, each distinct formula once.
+
+        Fills in the LaTeX of the blocks that have none. Blocks are
+        grouped by the canonical form of their OMML; formulas found in
+        the cache are not converted again. Malformed formulas are left
+        for convert to report.
 
         Args:
-            latex: Raw LaTeX string
+            blocks: Math blocks, e.g. Document.iter_math_blocks()
+            workers: Processes converting the formulas (1: this process)
 
         Returns:
-            Cleaned LaTeX string
+            Number of formulas converted
         """
-        # Remove excessive whitespace
-        latex = " ".join(latex.split())
-
-        # Remove empty groups
-        while "{}" in latex:
-            latex = latex.replace("{}", "")
-
-        # Note: We DO NOT remove braces around single characters because
-        # commands like \frac{k}{m} need those braces.
-        # The previous regex was incorrectly transforming \frac{k}{m} to \frackm
-        import re
-
-        # Normalize spacing around operators
-        latex = re.sub(r"\s+([+\-=])\s+", r" \1 ", latex)
-
-        # Remove trailing/leading spaces within braces
-        latex = re.sub(r"\{\s+", "{", latex)
-        latex = re.sub(r"\s+\}", "}", latex)
-
-        return latex.strip()
+        # Canonical OMML and blocks of each distinct formula
+        formulas: dict[bytes, tuple[bytes, list[MathBlock]]] = {}
+        for block in blocks:
+            if block.latex:
+                continue
+            try:
+                canonical = canonical_omml(block.omml)
+            except etree.XMLSyntaxError:
+                continue
+            key = canonical_key(canonical)
+            if key in formulas:
+                formulas[key][1].append(block)
+            else:
+                formulas[key] = (canonical, [block])
+
+        pending: list[bytes] = []
+        for key, (_, same) in formulas.items():
+            latex = self._cache.get(key) if self._cache is not None else None
+            if latex is None:
+                pending.append(key)
+                continue
+            for block in same:
+                block.latex = latex
+
+        converted = self._parse_many([formulas[key][0] for key in pending], workers)
+        for key, latex in zip(pending, converted, strict=True):
+            if self._cache is not None:
+                self._cache.put(key, latex)
+            for block in formulas[key][1]:
+                block.latex = latex
+
+        logger.debug(
+            f"Converted {len(pending)} of {len(formulas)} distinct formulas"
+        )
+        return len(pending)
+
+    def _parse_many(self, formulas: list[bytes], workers: int) -> list[str]:
+        """Convert canonical formulas, across worker processes if worthwhile."""
+        if workers <= 1 or len(formulas) < PARALLEL_MIN_FORMULAS:
+            return self._parser.parse_many(formulas)
+
+        # Whole chunks are submitted at once, keeping inter-process
+        # traffic to a few messages per worker
+        chunksize = -(-len(formulas) // (workers * _CHUNKS_PER_WORKER))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_parse_in_worker, formulas, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Converting formulas in-process: worker pool failed ({e})")
+            return self._parser.parse_many(formulas)
+
+    def _to_latex(self, omml: str | etree._Element) -> str:
+        """Convert OMML to LaTeX, through the cache if there is one."""
+        if self._cache is None:
+            return self._parser.parse(omml)
+
+        try:
+            key = omml_key(omml)
+        except etree.XMLSyntaxError:
+            # Let the parser report the malformed formula
+            return self._parser.parse(omml)
+
+        latex = self._cache.get(key)
+        if latex is None:
+            latex = self._parser.parse(omml)
+            self._cache.put(key, latex)
+        return latex
+
+
+@functools.cache
+def _worker_parser() -> OmmlParser:
+    """Parser of a worker process, created on its first formula."""
+    return OmmlParser()
+
+
+def _parse_in_worker(canonical: bytes) -> str:
+    """Convert a canonical formula in a worker process."""
+    return _worker_parser().parse(canonical)
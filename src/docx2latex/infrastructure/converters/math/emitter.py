@@ -0,0 +1,191 @@
+"""
+LaTeX emitter for the formula IR.
+
+Writes a laid-out IR tree as LaTeX in one pass, with an explicit stack,
+normalising spaces as it goes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from docx2latex.infrastructure.converters.math.ir import (
+    Accent,
+    Command,
+    Delim,
+    Frac,
+    Group,
+    Matrix,
+    Script,
+    Symbol,
+    Text,
+    ends_with_command,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docx2latex.infrastructure.converters.math.ir import Node
+
+    # A node's output, in order: words (without whitespace), spaces and
+    # child nodes
+    Parts = list[str | Node | None]
+
+# Part written as a space
+SPACE = None
+
+
+class _WordBuffer:
+    """
+    Accumulates LaTeX words.
+
+    Runs of whitespace become a single space, dropped at either end,
+    after an opening brace and before a closing one. A space is inserted
+    where a letter would otherwise run into a control word.
+    """
+
+    __slots__ = ("_space", "_words")
+
+    def __init__(self) -> None:
+        self._words: list[str] = []
+        self._space = False
+
+    def write(self, latex: str) -> None:
+        """Write LaTeX text."""
+        words = latex.split()
+        if not words:
+            if latex:
+                self.space()
+            return
+
+        if latex[0].isspace():
+            self.space()
+        self.word(words[0])
+        for word in words[1:]:
+            self.space()
+            self.word(word)
+        if latex[-1].isspace():
+            self.space()
+
+    def space(self) -> None:
+        """Write a space (merged with neighbouring ones)."""
+        self._space = bool(self._words)
+
+    def word(self, word: str) -> None:
+        """Write a non-empty piece of LaTeX without whitespace."""
+        words = self._words
+        if words:
+            last = words[-1]
+            if self._space:
+                if last[-1] != "{" and word[0] != "}":
+                    words.append(" ")
+            elif word[0].isalpha() and ends_with_command(last):
+                words.append(" ")
+        self._space = False
+        words.append(word)
+
+    def getvalue(self) -> str:
+        return "".join(self._words)
+
+
+def emit(root: Node) -> str:
+    """
+    Write a laid-out IR tree as LaTeX.
+
+    Args:
+        root: Tree, after the prune and layout passes
+
+    Returns:
+        LaTeX math string
+    """
+    buffer = _WordBuffer()
+    stack: Parts = [root]
+    while stack:
+        part = stack.pop()
+        if isinstance(part, str):
+            buffer.word(part)
+        elif part is None:
+            buffer.space()
+        elif isinstance(part, (Text, Symbol)):
+            buffer.write(part.latex)
+        elif isinstance(part, Group):
+            stack.extend(reversed(part.items))
+        else:
+            parts = _PARTS[type(part)](part)
+            parts.reverse()
+            stack.extend(parts)
+    return buffer.getvalue()
+
+
+def _frac_parts(node: Frac) -> Parts:
+    if node.kind in ("skw", "lin"):
+        # Skewed (diagonal) and linear fractions
+        return ["{", node.num, "}", "/", "{", node.den, "}"]
+    if node.kind == "noBar":
+        # Binomial-like (no bar)
+        return [r"\binom", "{", node.num, "}", "{", node.den, "}"]
+    name = r"\dfrac" if node.display else r"\frac"
+    return [name, "{", node.num, "}", "{", node.den, "}"]
+
+
+def _script_parts(node: Script) -> Parts:
+    parts: Parts = []
+    if node.sub is not None:
+        parts += ["_", "{", node.sub, "}"]
+    if node.sup is not None:
+        parts += ["^", "{", node.sup, "}"]
+
+    if node.pre:
+        # Pre-scripts attach to an empty group before the base
+        return ["{", "}", *parts, node.base] if parts else [node.base]
+    if node.wrap_base:
+        return ["{", node.base, "}", *parts]
+    return [node.base, *parts]
+
+
+def _delim_parts(node: Delim) -> Parts:
+    parts: Parts = []
+    for i, item in enumerate(node.items):
+        if i and node.separator:
+            parts.append(Text(node.separator))
+        parts.append(item)
+
+    if node.left or node.right:
+        return [rf"\left{node.left}", SPACE, *parts, SPACE, rf"\right{node.right}"]
+    return parts
+
+
+def _matrix_parts(node: Matrix) -> Parts:
+    parts: Parts = [rf"\begin{{{node.env}}}", SPACE]
+    for i, row in enumerate(node.rows):
+        if i:
+            parts += [SPACE, r"\\", SPACE]
+        for j, cell in enumerate(row):
+            if j:
+                parts += [SPACE, "&", SPACE]
+            parts.append(cell)
+    parts += [SPACE, rf"\end{{{node.env}}}"]
+    return parts
+
+
+def _command_parts(node: Command) -> Parts:
+    parts: Parts = [node.name]
+    if node.option is not None:
+        parts += ["[", node.option, "]"]
+    for arg in node.args:
+        parts += ["{", arg, "}"]
+    return parts
+
+
+def _accent_parts(node: Accent) -> Parts:
+    return [node.wide_command if node.wide else node.command, "{", node.base, "}"]
+
+
+_PARTS: dict[type, Callable[[Any], Parts]] = {
+    Frac: _frac_parts,
+    Script: _script_parts,
+    Delim: _delim_parts,
+    Matrix: _matrix_parts,
+    Command: _command_parts,
+    Accent: _accent_parts,
+}
@@ -0,0 +1,160 @@
+"""
+Streaming equation extractor.
+
+Converts the equations of a DOCX package to LaTeX without building
+domain entities, for indexing equations rather than converting
+documents.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any
+
+from lxml import etree
+
+from docx2latex.infrastructure.converters.math.cache import MathCache, omml_key
+from docx2latex.infrastructure.converters.math.omml_parser import OmmlParser
+from docx2latex.infrastructure.parsing.package_index import PackageIndex
+from docx2latex.infrastructure.parsing.xml_namespaces import M, W
+from docx2latex.shared.logging import get_logger
+from docx2latex.shared.result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+logger = get_logger("extractor")
+
+# Elements of document.xml the extractor follows
+_EXTRACTED_TAGS = (W.P, M.OMATH)
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractedEquation:
+    """An equation of a DOCX package, as converted by EquationExtractor."""
+
+    index: int  # Position among the equations of document.xml
+    display: bool  # In an m:oMathPara
+    paragraph: int | None  # Ordinal of the enclosing w:p in document.xml
+    latex: str
+    digest: str  # Hex OMML key (see omml_key)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "index": self.index,
+            "type": "display" if self.display else "inline",
+            "paragraph": self.paragraph,
+            "latex": self.latex,
+            "omml_digest": self.digest,
+        }
+
+
+class EquationExtractor:
+    """
+    Extractor of the equations of DOCX files.
+
+    Streams document.xml once and converts each m:oMath as soon as it
+    ends, then drops its subtree: memory stays flat whatever the size
+    of the document. With a MathCache, formulas repeated within and
+    across files are converted once.
+    """
+
+    def __init__(self, parser: OmmlParser | None = None, cache: MathCache | None = None) -> None:
+        """
+        Initialize the extractor.
+
+        Args:
+            parser: OMML parser (default: OmmlParser)
+            cache: Cache of converted formulas (default: no caching)
+        """
+        self._parser = parser or OmmlParser()
+        self._cache = cache
+
+    def extract(
+        self, path: Path, on_equation: Callable[[ExtractedEquation], None]
+    ) -> Result[int, str]:
+        """
+        Extract the equations of a DOCX file, in document order.
+
+        Args:
+            path: Path to the DOCX file
+            on_equation: Called with each equation as soon as it is converted
+
+        Returns:
+            Result containing the number of equations or error message.
+            On a malformed document.xml, the equations before the error
+            have already been passed on.
+        """
+        try:
+            archive = zipfile.ZipFile(path)
+        except zipfile.BadZipFile:
+            return Err("Invalid DOCX file (not a valid ZIP archive)")
+        except OSError as e:
+            return Err(f"Failed to read file: {e}")
+
+        with archive:
+            package = PackageIndex(archive)
+            main_part = package.main_document_part
+            if not package.has_part(main_part):
+                return Err("Missing document.xml")
+
+            try:
+                with package.open(main_part) as stream:
+                    return Ok(self._extract_body(stream, on_equation))
+            except etree.XMLSyntaxError as e:
+                return Err(f"Invalid document.xml: {e}")
+
+    def _extract_body(
+        self, stream: IO[bytes], on_equation: Callable[[ExtractedEquation], None]
+    ) -> int:
+        """Stream document.xml and convert each equation."""
+        count = 0
+        paragraphs = 0
+        open_paragraphs: list[int] = []  # Ordinals of the enclosing w:p elements
+        events = etree.iterparse(stream, events=("start", "end"), tag=_EXTRACTED_TAGS)
+        for event, elem in events:
+            if elem.tag == W.P:
+                if event == "start":
+                    open_paragraphs.append(paragraphs)
+                    paragraphs += 1
+                    continue
+                open_paragraphs.pop()
+            elif event == "start":
+                continue
+            else:
+                latex, digest = self._convert(elem)
+                parent = elem.getparent()
+                on_equation(
+                    ExtractedEquation(
+                        index=count,
+                        display=parent is not None and parent.tag == M.OMATHPARA,
+                        paragraph=open_paragraphs[-1] if open_paragraphs else None,
+                        latex=latex,
+                        digest=digest,
+                    )
+                )
+                count += 1
+
+            # Converted equations and finished paragraphs are done with;
+            # drop them and, at body level, the finished siblings before them
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None and parent.tag == W.BODY:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        logger.debug(f"Extracted {count} equations from {paragraphs} paragraphs")
+        return count
+
+    def _convert(self, omml: etree._Element) -> tuple[str, str]:
+        """Convert an equation, through the cache if there is one; also return its digest."""
+        key = omml_key(omml)
+        latex = self._cache.get(key) if self._cache is not None else None
+        if latex is None:
+            latex = self._parser.parse(omml)
+            if self._cache is not None:
+                self._cache.put(key, latex)
+        return latex, key.hex()
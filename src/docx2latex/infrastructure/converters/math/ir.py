@@ -0,0 +1,144 @@
+"""
+Intermediate representation of converted formulas.
+
+OmmlParser builds a tree of these nodes from OMML. The passes then
+clean it up and lay it out, and the emitter writes it as LaTeX.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class Text:
+    """Mapped run text: letters, digits, operators and symbol commands."""
+
+    latex: str
+
+    def children(self) -> list[Node]:
+        return []
+
+
+@dataclass(slots=True)
+class Symbol:
+    """A single LaTeX command, such as a big operator or a function name."""
+
+    latex: str
+
+    def children(self) -> list[Node]:
+        return []
+
+
+@dataclass(slots=True)
+class Group:
+    """Sequence of nodes, written one after the other."""
+
+    items: list[Node] = field(default_factory=list)
+
+    def children(self) -> list[Node]:
+        return self.items
+
+
+@dataclass(slots=True)
+class Frac:
+    """Fraction: bar (\\frac), noBar (\\binom), skw or lin (slashed)."""
+
+    num: Node
+    den: Node
+    kind: str = "bar"
+    display: bool = False  # Set by layout: \dfrac for complex bar fractions
+
+    def children(self) -> list[Node]:
+        return [self.num, self.den]
+
+
+@dataclass(slots=True)
+class Script:
+    """Base with a subscript and/or superscript, after it or before it."""
+
+    base: Node
+    sub: Node | None = None
+    sup: Node | None = None
+    pre: bool = False
+    wrap_base: bool = False  # Set by layout: brace multi-character bases
+
+    def children(self) -> list[Node]:
+        return [node for node in (self.base, self.sub, self.sup) if node is not None]
+
+
+@dataclass(slots=True)
+class Delim:
+    """Items between \\left and \\right delimiters, joined by a separator."""
+
+    left: str
+    right: str
+    items: list[Node]
+    separator: str = ""
+
+    def children(self) -> list[Node]:
+        return self.items
+
+
+@dataclass(slots=True)
+class Matrix:
+    """Rows of cells in a matrix-like environment (matrix, aligned)."""
+
+    env: str
+    rows: list[list[Node]]
+
+    def children(self) -> list[Node]:
+        return [cell for row in self.rows for cell in row]
+
+
+@dataclass(slots=True)
+class Command:
+    """LaTeX command with braced arguments and an optional [option]."""
+
+    name: str
+    args: list[Node]
+    option: Node | None = None
+
+    def children(self) -> list[Node]:
+        return self.args if self.option is None else [self.option, *self.args]
+
+
+@dataclass(slots=True)
+class Accent:
+    """Accent over a base, in its wide form over multi-character bases."""
+
+    command: str
+    wide_command: str
+    base: Node
+    wide: bool = False  # Set by layout
+
+    def children(self) -> list[Node]:
+        return [self.base]
+
+
+Node = Text | Symbol | Group | Frac | Script | Delim | Matrix | Command | Accent
+
+
+def postorder(root: Node) -> list[Node]:
+    """List the nodes of a tree, children before their parent, without recursion."""
+    # Reversed pre-order, children visited last to first
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children())
+    order.reverse()
+    return order
+
+
+def ends_with_command(word: str) -> bool:
+    """
+    Check if a word ends with a control word (``\\alpha``, ``x\\cdot``).
+
+    A letter written right after it would be read as part of the command.
+    """
+    start = word.rfind("\\")
+    if start < 0 or not word[-1].isalpha():
+        return False
+    return not any(c in "{}[]" for c in word[start + 1:])
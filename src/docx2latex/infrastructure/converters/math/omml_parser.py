@@ -2,18 +2,127 @@
 OMML (Office Math Markup Language) parser.
 
 Parses OMML XML and converts to LaTeX math.
+
+The parser builds the formula as an IR tree (see ir), which the passes
+clean up and lay out and the emitter writes as LaTeX. Building walks
+the XML with an explicit stack rather than by recursion, so the depth
+of machine-generated formulas is not limited by the interpreter's
+recursion limit: handlers of structures are generators, which yield
+each element they need converted, receive its node, and return their
+own node.
 """
 
 from __future__ import annotations
 
+from types import GeneratorType
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
 from lxml import etree
 
+from docx2latex.infrastructure.converters.math.emitter import emit
+from docx2latex.infrastructure.converters.math.ir import (
+    Accent,
+    Command,
+    Delim,
+    Frac,
+    Group,
+    Matrix,
+    Script,
+    Symbol,
+    Text,
+)
+from docx2latex.infrastructure.converters.math.passes import layout, prune
 from docx2latex.infrastructure.converters.math.symbols import SymbolMapper
-from docx2latex.infrastructure.parsing.xml_namespaces import NS
+from docx2latex.infrastructure.parsing.xml_namespaces import M
 from docx2latex.shared.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+
+    from docx2latex.infrastructure.converters.math.ir import Node
+
+    # A conversion in progress: yields elements to convert, receives their
+    # nodes, and returns the node of its own element
+    Steps = Generator[etree._Element, Node, Node]
+
 logger = get_logger("omml")
 
+# Script types: roman, script, fraktur, double-struck, sans-serif, monospace
+_SCRIPT_STYLES = {
+    "script": r"\mathcal",
+    "fraktur": r"\mathfrak",
+    "double-struck": r"\mathbb",
+    "sans-serif": r"\mathsf",
+    "monospace": r"\mathtt",
+}
+
+# Styles: p (plain), b (bold), i (italic), bi (bold-italic)
+_STYLES = {
+    "b": r"\mathbf",
+    "i": r"\mathit",
+    "bi": r"\boldsymbol",
+}
+
+# Bracket characters to LaTeX (separate maps for left and right)
+_LEFT_DELIMITERS = {
+    "(": "(",
+    "[": "[",
+    "{": r"\{",
+    "|": "|",
+    "‖": r"\|",
+    "⟨": r"\langle",
+    "⌈": r"\lceil",
+    "⌊": r"\lfloor",
+    "": "",
+}
+_RIGHT_DELIMITERS = {
+    ")": ")",
+    "]": "]",
+    "}": r"\}",
+    "|": "|",
+    "‖": r"\|",
+    "⟩": r"\rangle",
+    "⌉": r"\rceil",
+    "⌋": r"\rfloor",
+    "": "",
+}
+
+# Accent characters to LaTeX commands, for multi-character bases
+_WIDE_ACCENTS = {
+    "̂": r"\widehat",
+    "̃": r"\widetilde",
+    "̄": r"\overline",
+    "̇": r"\dot",
+    "̈": r"\ddot",
+    "⃗": r"\overrightarrow",
+    "̆": r"\breve",
+    "̌": r"\check",
+    "̊": r"\mathring",
+    "⏞": r"\overbrace",
+    "⏟": r"\underbrace",
+    "^": r"\widehat",
+    "~": r"\widetilde",
+    "→": r"\overrightarrow",
+}
+
+# Accent characters to LaTeX commands, for single-character bases
+_ACCENTS = {
+    "̂": r"\hat",
+    "̃": r"\tilde",
+    "̄": r"\bar",
+    "̇": r"\dot",
+    "̈": r"\ddot",
+    "⃗": r"\vec",
+    "̆": r"\breve",
+    "̌": r"\check",
+    "̊": r"\mathring",
+    "⏞": r"\overbrace",
+    "⏟": r"\underbrace",
+    "^": r"\hat",
+    "~": r"\tilde",
+    "→": r"\vec",
+}
+
 
 class OmmlParser:
     """
@@ -25,191 +134,164 @@ class OmmlParser:
     def __init__(self) -> None:
         self._symbols = SymbolMapper()
 
-    def parse(self, omml_xml: str) -> str:
+    def parse(self, omml: str | bytes | etree._Element) -> str:
         """
-        Parse OMML XML string to LaTeX.
+        Parse OMML to LaTeX.
 
         Args:
-            omml_xml: OMML XML string
+            omml: OMML root element, or OMML XML as text or bytes
 
         Returns:
             LaTeX math string
         """
         try:
-            root = etree.fromstring(omml_xml.encode())
-            return self._convert_element(root)
+            if isinstance(omml, str):
+                omml = omml.encode()
+            root = etree.fromstring(omml) if isinstance(omml, bytes) else omml
+            return emit(layout(prune(self._convert_tree(root))))
         except Exception as e:
             logger.warning(f"OMML parse error: {e}")
             return ""
 
-    def _convert_element(self, elem: etree._Element) -> str:
+    def parse_many(self, formulas: Iterable[str | bytes | etree._Element]) -> list[str]:
         """
-        Convert an OMML element to LaTeX.
+        Parse several OMML formulas to LaTeX.
 
-        Dispatches to specific handlers based on element type.
+        Args:
+            formulas: OMML root elements, or OMML XML as text or bytes
+
+        Returns:
+            LaTeX math strings, in the order of the formulas
         """
-        tag = etree.QName(elem).localname
-
-        handlers = {
-            "oMath": self._handle_omath,
-            "r": self._handle_run,
-            "t": self._handle_text,
-            "f": self._handle_fraction,
-            "rad": self._handle_radical,
-            "sSub": self._handle_subscript,
-            "sSup": self._handle_superscript,
-            "sSubSup": self._handle_subsup,
-            "sPre": self._handle_presup,
-            "nary": self._handle_nary,
-            "limLow": self._handle_limlower,
-            "limUpp": self._handle_limupper,
-            "m": self._handle_matrix,
-            "d": self._handle_delimiter,
-            "eqArr": self._handle_eqarray,
-            "bar": self._handle_bar,
-            "acc": self._handle_accent,
-            "box": self._handle_box,
-            "func": self._handle_function,
-            "groupChr": self._handle_groupchar,
-            "borderBox": self._handle_borderbox,
-            "phant": self._handle_phantom,
-        }
-
-        handler = handlers.get(tag)
-        if handler:
-            return handler(elem)
+        return [self.parse(omml) for omml in formulas]
+
+    def _convert_tree(self, root: etree._Element) -> Node:
+        """Convert an OMML tree, keeping the conversions in progress on a stack."""
+        node = self._convert_element(root)
+        if not isinstance(node, GeneratorType):
+            # Handlers return either steps (always generators) or a node
+            return cast("Node", node)
+
+        stack: list[Steps] = [node]
+        value: Any = None
+        while stack:
+            try:
+                child = stack[-1].send(value)
+            except StopIteration as done:
+                # Pass the finished element's node on to its parent
+                stack.pop()
+                value = done.value
+                continue
+
+            node = self._convert_element(child)
+            if isinstance(node, GeneratorType):
+                stack.append(node)
+                value = None
+            else:
+                value = node
 
-        # Default: process children
-        return self._process_children(elem)
+        return cast("Node", value)
 
-    def _process_children(self, elem: etree._Element) -> str:
-        """Process all children of an element."""
-        parts = []
-        for child in elem:
-            result = self._convert_element(child)
-            if result:
-                parts.append(result)
-        return self._join_with_spacing(parts)
+    def _convert_element(self, elem: etree._Element) -> Node | Steps:
+        """
+        Start the conversion of an OMML element.
 
-    def _join_with_spacing(self, parts: list[str]) -> str:
-        """Join parts with smart spacing for LaTeX commands.
+        Dispatches to specific handlers based on element tag.
 
-        Adds space when a LaTeX command ending with a letter
-        is followed by content starting with a letter.
+        Returns:
+            Node of a leaf element, or the steps converting a structure
         """
-        if not parts:
-            return ""
+        handler = self._HANDLERS.get(elem.tag)
+        if handler is not None:
+            return handler(self, elem)
 
-        result = [parts[0]]
-        for i in range(1, len(parts)):
-            prev = parts[i - 1]
-            curr = parts[i]
-
-            # Check if we need a space between prev and curr
-            needs_space = False
-            if prev and curr:
-                # Find last LaTeX command in prev
-                last_backslash = prev.rfind("\\")
-                if last_backslash >= 0:
-                    # Get the command part after backslash
-                    after_backslash = prev[last_backslash + 1:]
-                    # Check if command ends at the string end and ends with letter
-                    if after_backslash and after_backslash[-1].isalpha():
-                        # Check if there's no brace/bracket after the command
-                        # Commands like \frac{} don't need extra space
-                        if not any(c in after_backslash for c in "{}[]"):
-                            # Check if next part starts with letter
-                            if curr and curr[0].isalpha():
-                                needs_space = True
-
-            if needs_space:
-                result.append(" ")
-            result.append(curr)
-
-        return "".join(result)
-
-    def _get_element(self, parent: etree._Element, tag: str) -> etree._Element | None:
-        """Get child element by tag (without namespace)."""
-        for child in parent:
-            if etree.QName(child).localname == tag:
-                return child
-        return None
+        # Comments and processing instructions
+        if not isinstance(elem.tag, str):
+            return Group()
+
+        # Default: process children
+        return self._process_children(elem)
+
+    def _process_children(self, elem: etree._Element) -> Steps:
+        """Process all children of an element."""
+        items = []
+        for child in elem:
+            items.append((yield child))
+        return Group(items)
+
+    def _process_part(self, elem: etree._Element | None) -> Steps:
+        """Process the children of an optional part of a structure."""
+        if elem is None:
+            return Group()
+        return (yield from self._process_children(elem))
+
+    @staticmethod
+    def _index(elem: etree._Element) -> dict[Any, etree._Element]:
+        """Index the children of an element by tag, in one pass (first one wins)."""
+        children: dict[Any, etree._Element] = {}
+        for child in elem:
+            children.setdefault(child.tag, child)
+        return children
+
+    @staticmethod
+    def _get_property(props: etree._Element | None, tag: str, default: str) -> str:
+        """Get the value of a property from a properties element (m:fPr, m:dPr, ...)."""
+        if props is not None:
+            for child in props:
+                if child.tag == tag:
+                    return child.get(M.VAL, default)
+        return default
 
     def _get_text(self, elem: etree._Element) -> str:
         """Get text content from element tree."""
         parts = []
-        for t in elem.iter(f"{{{NS['m']}}}t"):
+        for t in elem.iter(M.T):
             if t.text:
                 parts.append(t.text)
         return "".join(parts)
 
-    def _handle_omath(self, elem: etree._Element) -> str:
+    def _handle_omath(self, elem: etree._Element) -> Steps:
         """Handle oMath (math block) element."""
         return self._process_children(elem)
 
-    def _handle_run(self, elem: etree._Element) -> str:
+    def _handle_run(self, elem: etree._Element) -> Node:
         """Handle math run element (m:r)."""
         # Check for special styling
-        rpr = self._get_element(elem, "rPr")
-        style_prefix = ""
-        style_suffix = ""
+        rpr = self._index(elem).get(M.RPR)
+        style = ""
 
         if rpr is not None:
-            # Check for script type (normal, bold, italic, etc.)
-            scr = self._get_element(rpr, "scr")
-            sty = self._get_element(rpr, "sty")
-
-            if scr is not None:
-                scr_val = scr.get(f"{{{NS['m']}}}val", "")
-                # Script types: roman, script, fraktur, double-struck, sans-serif, monospace
-                script_map = {
-                    "script": (r"\mathcal{", "}"),
-                    "fraktur": (r"\mathfrak{", "}"),
-                    "double-struck": (r"\mathbb{", "}"),
-                    "sans-serif": (r"\mathsf{", "}"),
-                    "monospace": (r"\mathtt{", "}"),
-                }
-                if scr_val in script_map:
-                    style_prefix, style_suffix = script_map[scr_val]
-
-            if sty is not None:
-                sty_val = sty.get(f"{{{NS['m']}}}val", "")
-                # Style: p (plain), b (bold), i (italic), bi (bold-italic)
-                if sty_val == "b" and not style_prefix:
-                    style_prefix, style_suffix = r"\mathbf{", "}"
-                elif sty_val == "i" and not style_prefix:
-                    style_prefix, style_suffix = r"\mathit{", "}"
-                elif sty_val == "bi" and not style_prefix:
-                    style_prefix, style_suffix = r"\boldsymbol{", "}"
+            # Script type first, then style (normal, bold, italic, etc.)
+            style = _SCRIPT_STYLES.get(self._get_property(rpr, M.SCR, ""), "")
+            if not style:
+                style = _STYLES.get(self._get_property(rpr, M.STY, ""), "")
 
         raw_text = self._get_text(elem)
 
         # Check if this is a function name
         if self._symbols.is_function_name(raw_text):
-            text = self._symbols.get_function_latex(raw_text)
-            return f"{style_prefix}{text}{style_suffix}" if style_prefix else text
+            function = Symbol(self._symbols.get_function_latex(raw_text))
+            return Command(style, [function]) if style else function
 
         # For styled text, we need to handle mixed content carefully
         # e.g., "∈R" with double-struck should become "\in \mathbb{R}", not "\mathbb{∈R}"
-        if style_prefix:
-            return self._apply_style_smartly(raw_text, style_prefix, style_suffix)
+        if style:
+            return self._apply_style_smartly(raw_text, style)
 
-        text = self._symbols.map_text(raw_text)
-        return text
+        return Text(self._symbols.map_text(raw_text))
 
-    def _apply_style_smartly(self, text: str, prefix: str, suffix: str) -> str:
+    def _apply_style_smartly(self, text: str, style: str) -> Group:
         """Apply style only to letters, not to operators.
 
         This handles cases like "∈R" with double-struck style,
         which should become "\\in \\mathbb{R}" not "\\mathbb{∈R}".
         """
-        result = []
-        letter_buffer = []
+        items: list[Node] = []
+        letter_buffer: list[str] = []
 
         def flush_letters() -> None:
             if letter_buffer:
-                letters = "".join(letter_buffer)
-                result.append(f"{prefix}{letters}{suffix}")
+                items.append(Command(style, [Text("".join(letter_buffer))]))
                 letter_buffer.clear()
 
         for char in text:
@@ -217,410 +299,231 @@ class OmmlParser:
             # If it's a LaTeX command (starts with \), it's an operator
             if mapped.startswith("\\") or not char.isalpha():
                 flush_letters()
-                result.append(mapped)
+                items.append(Text(mapped))
             else:
                 letter_buffer.append(char)
 
         flush_letters()
-        return self._join_with_spacing(result) if len(result) > 1 else "".join(result)
+        return Group(items)
 
-    def _handle_text(self, elem: etree._Element) -> str:
+    def _handle_text(self, elem: etree._Element) -> Node:
         """Handle text element (m:t)."""
-        text = elem.text or ""
-        return self._symbols.map_text(text)
+        return Text(self._symbols.map_text(elem.text or ""))
 
-    def _handle_fraction(self, elem: etree._Element) -> str:
+    def _handle_fraction(self, elem: etree._Element) -> Steps:
         """Handle fraction element (m:f)."""
-        # Get fraction properties
-        fpr = self._get_element(elem, "fPr")
-        frac_type = "bar"  # Default: normal fraction with bar
-
-        if fpr is not None:
-            type_elem = self._get_element(fpr, "type")
-            if type_elem is not None:
-                frac_type = type_elem.get(f"{{{NS['m']}}}val", "bar")
-
-        # Get numerator and denominator
-        num = self._get_element(elem, "num")
-        den = self._get_element(elem, "den")
-
-        num_latex = self._process_children(num) if num is not None else ""
-        den_latex = self._process_children(den) if den is not None else ""
-
-        if frac_type == "noBar":
-            # Binomial-like (no bar)
-            return rf"\binom{{{num_latex}}}{{{den_latex}}}"
-        elif frac_type == "skw":
-            # Skewed fraction (diagonal)
-            return rf"{{{num_latex}}}/{{{den_latex}}}"
-        elif frac_type == "lin":
-            # Linear fraction
-            return rf"{{{num_latex}}}/{{{den_latex}}}"
-        else:
-            # Normal fraction with bar
-            # Use \dfrac for display style if content is complex
-            if len(num_latex) > 5 or len(den_latex) > 5:
-                return rf"\dfrac{{{num_latex}}}{{{den_latex}}}"
-            return rf"\frac{{{num_latex}}}{{{den_latex}}}"
-
-    def _handle_radical(self, elem: etree._Element) -> str:
-        """Handle radical (square root) element (m:rad)."""
-        # Check for degree (nth root)
-        radpr = self._get_element(elem, "radPr")
-        deg_hide = False
+        children = self._index(elem)
+        # Default: normal fraction with bar
+        frac_type = self._get_property(children.get(M.FPR), M.TYPE, "bar")
 
-        if radpr is not None:
-            deghide = self._get_element(radpr, "degHide")
-            if deghide is not None:
-                deg_hide = deghide.get(f"{{{NS['m']}}}val", "0") == "1"
+        num = yield from self._process_part(children.get(M.NUM))
+        den = yield from self._process_part(children.get(M.DEN))
+        return Frac(num, den, frac_type)
 
-        deg = self._get_element(elem, "deg")
-        e = self._get_element(elem, "e")
+    def _handle_radical(self, elem: etree._Element) -> Steps:
+        """Handle radical (square root) element (m:rad)."""
+        children = self._index(elem)
+        # Check for degree (nth root)
+        deg_hide = self._get_property(children.get(M.RADPR), M.DEGHIDE, "0") == "1"
+        deg = children.get(M.DEG)
 
-        base_latex = self._process_children(e) if e is not None else ""
+        base = yield from self._process_part(children.get(M.E))
 
         if deg is not None and not deg_hide:
-            deg_latex = self._process_children(deg)
-            if deg_latex and deg_latex.strip():
-                return rf"\sqrt[{deg_latex}]{{{base_latex}}}"
+            # Blank degrees are pruned, leaving a square root
+            degree = yield from self._process_children(deg)
+            return Command(r"\sqrt", [base], option=degree)
 
-        return rf"\sqrt{{{base_latex}}}"
+        return Command(r"\sqrt", [base])
 
-    def _handle_subscript(self, elem: etree._Element) -> str:
+    def _handle_subscript(self, elem: etree._Element) -> Steps:
         """Handle subscript element (m:sSub)."""
-        e = self._get_element(elem, "e")
-        sub = self._get_element(elem, "sub")
-
-        base = self._process_children(e) if e is not None else ""
-        sub_latex = self._process_children(sub) if sub is not None else ""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        sub = yield from self._process_part(children.get(M.SUB))
+        return Script(base, sub=sub)
 
-        # Wrap base if it's more than one character
-        if len(base) > 1 and not base.startswith("\\"):
-            base = f"{{{base}}}"
-
-        return f"{base}_{{{sub_latex}}}"
-
-    def _handle_superscript(self, elem: etree._Element) -> str:
+    def _handle_superscript(self, elem: etree._Element) -> Steps:
         """Handle superscript element (m:sSup)."""
-        e = self._get_element(elem, "e")
-        sup = self._get_element(elem, "sup")
-
-        base = self._process_children(e) if e is not None else ""
-        sup_latex = self._process_children(sup) if sup is not None else ""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        sup = yield from self._process_part(children.get(M.SUP))
+        return Script(base, sup=sup)
 
-        # Wrap base if it's more than one character
-        if len(base) > 1 and not base.startswith("\\"):
-            base = f"{{{base}}}"
-
-        return f"{base}^{{{sup_latex}}}"
-
-    def _handle_subsup(self, elem: etree._Element) -> str:
+    def _handle_subsup(self, elem: etree._Element) -> Steps:
         """Handle sub-superscript element (m:sSubSup)."""
-        e = self._get_element(elem, "e")
-        sub = self._get_element(elem, "sub")
-        sup = self._get_element(elem, "sup")
-
-        base = self._process_children(e) if e is not None else ""
-        sub_latex = self._process_children(sub) if sub is not None else ""
-        sup_latex = self._process_children(sup) if sup is not None else ""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        sub = yield from self._process_part(children.get(M.SUB))
+        sup = yield from self._process_part(children.get(M.SUP))
+        return Script(base, sub=sub, sup=sup)
 
-        if len(base) > 1 and not base.startswith("\\"):
-            base = f"{{{base}}}"
-
-        return f"{base}_{{{sub_latex}}}^{{{sup_latex}}}"
-
-    def _handle_presup(self, elem: etree._Element) -> str:
+    def _handle_presup(self, elem: etree._Element) -> Steps:
         """Handle pre-sub-superscript element (m:sPre)."""
-        e = self._get_element(elem, "e")
-        sub = self._get_element(elem, "sub")
-        sup = self._get_element(elem, "sup")
-
-        base = self._process_children(e) if e is not None else ""
-        sub_latex = self._process_children(sub) if sub is not None else ""
-        sup_latex = self._process_children(sup) if sup is not None else ""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        sub = yield from self._process_part(children.get(M.SUB))
+        sup = yield from self._process_part(children.get(M.SUP))
 
-        # Pre-scripts: use \prescript from mathtools or {}^{}_{}X format
-        return rf"{{}}_{{{sub_latex}}}^{{{sup_latex}}}{base}"
+        # Pre-scripts: {}_{}^{}X format
+        return Script(base, sub=sub, sup=sup, pre=True)
 
-    def _handle_nary(self, elem: etree._Element) -> str:
+    def _handle_nary(self, elem: etree._Element) -> Steps:
         """Handle n-ary operator (sum, product, integral) element (m:nary)."""
-        narypr = self._get_element(elem, "naryPr")
-
-        # Get operator character
-        chr_val = "∫"  # Default to integral
-        lim_loc = "subSup"  # Default limit location
-
-        if narypr is not None:
-            chr_elem = self._get_element(narypr, "chr")
-            if chr_elem is not None:
-                chr_val = chr_elem.get(f"{{{NS['m']}}}val", "∫")
-
-            limloc_elem = self._get_element(narypr, "limLoc")
-            if limloc_elem is not None:
-                lim_loc = limloc_elem.get(f"{{{NS['m']}}}val", "subSup")
-
-        # Get limits and base
-        sub = self._get_element(elem, "sub")
-        sup = self._get_element(elem, "sup")
-        e = self._get_element(elem, "e")
-
-        operator = self._symbols.get_nary_latex(chr_val)
-        sub_latex = self._process_children(sub) if sub is not None else ""
-        sup_latex = self._process_children(sup) if sup is not None else ""
-        base_latex = self._process_children(e) if e is not None else ""
-
-        # Build result
-        result = operator
-
-        if lim_loc == "undOvr":
-            # Limits above and below (display style)
-            if sub_latex:
-                result += rf"_{{{sub_latex}}}"
-            if sup_latex:
-                result += rf"^{{{sup_latex}}}"
-        else:
-            # Limits as sub/superscript
-            if sub_latex:
-                result += rf"_{{{sub_latex}}}"
-            if sup_latex:
-                result += rf"^{{{sup_latex}}}"
-
-        result += f" {base_latex}"
-        return result
-
-    def _handle_limlower(self, elem: etree._Element) -> str:
-        """Handle lower limit element (m:limLow)."""
-        e = self._get_element(elem, "e")
-        lim = self._get_element(elem, "lim")
+        children = self._index(elem)
+        narypr = children.get(M.NARYPR)
 
-        base = self._process_children(e) if e is not None else ""
-        lim_latex = self._process_children(lim) if lim is not None else ""
+        # Operator character defaults to integral; limit location is ignored,
+        # limits are sub/superscripts in both inline and display (undOvr) style
+        chr_val = self._get_property(narypr, M.CHR_ATTR, "∫")
 
-        return rf"\underset{{{lim_latex}}}{{{base}}}"
+        operator = Symbol(self._symbols.get_nary_latex(chr_val))
+        sub = yield from self._process_part(children.get(M.SUB))
+        sup = yield from self._process_part(children.get(M.SUP))
+        base = yield from self._process_part(children.get(M.E))
 
-    def _handle_limupper(self, elem: etree._Element) -> str:
-        """Handle upper limit element (m:limUpp)."""
-        e = self._get_element(elem, "e")
-        lim = self._get_element(elem, "lim")
+        return Group([Script(operator, sub=sub, sup=sup), Text(" "), base])
 
-        base = self._process_children(e) if e is not None else ""
-        lim_latex = self._process_children(lim) if lim is not None else ""
+    def _handle_limlower(self, elem: etree._Element) -> Steps:
+        """Handle lower limit element (m:limLow)."""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        lim = yield from self._process_part(children.get(M.LIM))
+        return Command(r"\underset", [lim, base])
 
-        return rf"\overset{{{lim_latex}}}{{{base}}}"
+    def _handle_limupper(self, elem: etree._Element) -> Steps:
+        """Handle upper limit element (m:limUpp)."""
+        children = self._index(elem)
+        base = yield from self._process_part(children.get(M.E))
+        lim = yield from self._process_part(children.get(M.LIM))
+        return Command(r"\overset", [lim, base])
 
-    def _handle_matrix(self, elem: etree._Element) -> str:
+    def _handle_matrix(self, elem: etree._Element) -> Steps:
         """Handle matrix element (m:m)."""
         rows = []
 
-        for mr in elem.iter(f"{{{NS['m']}}}mr"):
+        for mr in elem.iterchildren(M.MR):
             cells = []
-            for e in mr.iter(f"{{{NS['m']}}}e"):
-                cell_latex = self._process_children(e)
-                cells.append(cell_latex)
-            rows.append(" & ".join(cells))
+            for e in mr.iterchildren(M.E):
+                cells.append((yield from self._process_children(e)))
+            rows.append(cells)
 
-        matrix_content = r" \\ ".join(rows)
-        return rf"\begin{{matrix}} {matrix_content} \end{{matrix}}"
+        return Matrix("matrix", rows)
 
-    def _handle_delimiter(self, elem: etree._Element) -> str:
+    def _handle_delimiter(self, elem: etree._Element) -> Steps:
         """Handle delimiter (brackets) element (m:d)."""
-        dpr = self._get_element(elem, "dPr")
+        dpr = self._index(elem).get(M.DELPRIM)
 
         # Default brackets
-        beg_chr = "("
-        end_chr = ")"
-        sep_chr = ""
-
-        if dpr is not None:
-            begchr = self._get_element(dpr, "begChr")
-            endchr = self._get_element(dpr, "endChr")
-            sepchr = self._get_element(dpr, "sepChr")
-
-            if begchr is not None:
-                beg_chr = begchr.get(f"{{{NS['m']}}}val", "(")
-            if endchr is not None:
-                end_chr = endchr.get(f"{{{NS['m']}}}val", ")")
-            if sepchr is not None:
-                sep_chr = sepchr.get(f"{{{NS['m']}}}val", "")
-
-        # Process content elements
+        beg_chr = self._get_property(dpr, M.BEGCHR, "(")
+        end_chr = self._get_property(dpr, M.ENDCHR, ")")
+        sep_chr = self._get_property(dpr, M.SEPCHR, "")
+
+        # Process content elements (nested ones belong to nested structures)
         contents = []
-        for e in elem.iter(f"{{{NS['m']}}}e"):
-            contents.append(self._process_children(e))
-
-        content = sep_chr.join(contents) if sep_chr else "".join(contents)
-
-        # Map bracket characters to LaTeX (separate maps for left and right)
-        left_map = {
-            "(": "(",
-            "[": "[",
-            "{": r"\{",
-            "|": "|",
-            "‖": r"\|",
-            "⟨": r"\langle",
-            "⌈": r"\lceil",
-            "⌊": r"\lfloor",
-            "": "",
-        }
-        right_map = {
-            ")": ")",
-            "]": "]",
-            "}": r"\}",
-            "|": "|",
-            "‖": r"\|",
-            "⟩": r"\rangle",
-            "⌉": r"\rceil",
-            "⌋": r"\rfloor",
-            "": "",
-        }
-
-        left = left_map.get(beg_chr, beg_chr)
-        right = right_map.get(end_chr, end_chr)
-
-        if left or right:
-            return rf"\left{left} {content} \right{right}"
-        return content
-
-    def _handle_eqarray(self, elem: etree._Element) -> str:
+        for e in elem.iterchildren(M.E):
+            contents.append((yield from self._process_children(e)))
+
+        left = _LEFT_DELIMITERS.get(beg_chr, beg_chr)
+        right = _RIGHT_DELIMITERS.get(end_chr, end_chr)
+        return Delim(left, right, contents, sep_chr)
+
+    def _handle_eqarray(self, elem: etree._Element) -> Steps:
         """Handle equation array element (m:eqArr)."""
         rows = []
 
-        for e in elem.iter(f"{{{NS['m']}}}e"):
-            row_latex = self._process_children(e)
-            rows.append(row_latex)
+        for e in elem.iterchildren(M.E):
+            rows.append([(yield from self._process_children(e))])
 
-        content = r" \\ ".join(rows)
-        return rf"\begin{{aligned}} {content} \end{{aligned}}"
+        return Matrix("aligned", rows)
 
-    def _handle_bar(self, elem: etree._Element) -> str:
+    def _handle_bar(self, elem: etree._Element) -> Steps:
         """Handle bar/overline element (m:bar)."""
-        barpr = self._get_element(elem, "barPr")
-        pos = "top"  # Default position
+        children = self._index(elem)
+        # Default position: top
+        pos = self._get_property(children.get(M.BARPR), M.POS, "top")
 
-        if barpr is not None:
-            pos_elem = self._get_element(barpr, "pos")
-            if pos_elem is not None:
-                pos = pos_elem.get(f"{{{NS['m']}}}val", "top")
+        base = yield from self._process_part(children.get(M.E))
+        return Command(r"\underline" if pos == "bot" else r"\overline", [base])
 
-        e = self._get_element(elem, "e")
-        base = self._process_children(e) if e is not None else ""
+    def _handle_accent(self, elem: etree._Element) -> Steps:
+        """Handle accent element (m:acc)."""
+        children = self._index(elem)
+        # Default to circumflex
+        chr_val = self._get_property(children.get(M.ACCPR), M.CHR_ATTR, "̂")
 
-        if pos == "bot":
-            return rf"\underline{{{base}}}"
-        return rf"\overline{{{base}}}"
+        base = yield from self._process_part(children.get(M.E))
 
-    def _handle_accent(self, elem: etree._Element) -> str:
-        """Handle accent element (m:acc)."""
-        accpr = self._get_element(elem, "accPr")
-        chr_val = "̂"  # Default to circumflex
-
-        if accpr is not None:
-            chr_elem = self._get_element(accpr, "chr")
-            if chr_elem is not None:
-                chr_val = chr_elem.get(f"{{{NS['m']}}}val", "̂")
-
-        e = self._get_element(elem, "e")
-        base = self._process_children(e) if e is not None else ""
-
-        # Determine if base has multiple characters (for wide accents)
-        # Strip braces and commands to count actual characters
-        base_stripped = base
-        for cmd in [r"\mathit", r"\mathrm", r"\mathbf"]:
-            base_stripped = base_stripped.replace(cmd, "")
-        base_stripped = base_stripped.replace("{", "").replace("}", "")
-        is_multi_char = len(base_stripped) > 1
-
-        # Map accent characters to LaTeX commands
-        # Use wide versions for multi-character bases
-        if is_multi_char:
-            accent_map = {
-                "̂": r"\widehat",
-                "̃": r"\widetilde",
-                "̄": r"\overline",
-                "̇": r"\dot",
-                "̈": r"\ddot",
-                "⃗": r"\overrightarrow",
-                "̆": r"\breve",
-                "̌": r"\check",
-                "̊": r"\mathring",
-                "⏞": r"\overbrace",
-                "⏟": r"\underbrace",
-                "^": r"\widehat",
-                "~": r"\widetilde",
-                "→": r"\overrightarrow",
-            }
-        else:
-            accent_map = {
-                "̂": r"\hat",
-                "̃": r"\tilde",
-                "̄": r"\bar",
-                "̇": r"\dot",
-                "̈": r"\ddot",
-                "⃗": r"\vec",
-                "̆": r"\breve",
-                "̌": r"\check",
-                "̊": r"\mathring",
-                "⏞": r"\overbrace",
-                "⏟": r"\underbrace",
-                "^": r"\hat",
-                "~": r"\tilde",
-                "→": r"\vec",
-            }
-
-        accent_cmd = accent_map.get(chr_val, r"\widehat" if is_multi_char else r"\hat")
-        return rf"{accent_cmd}{{{base}}}"
-
-    def _handle_box(self, elem: etree._Element) -> str:
+        # Layout picks the wide version for multi-character bases
+        return Accent(
+            _ACCENTS.get(chr_val, r"\hat"), _WIDE_ACCENTS.get(chr_val, r"\widehat"), base
+        )
+
+    def _handle_box(self, elem: etree._Element) -> Steps:
         """Handle box element (m:box)."""
-        e = self._get_element(elem, "e")
-        return self._process_children(e) if e is not None else ""
+        return self._process_part(self._index(elem).get(M.E))
 
-    def _handle_function(self, elem: etree._Element) -> str:
+    def _handle_function(self, elem: etree._Element) -> Steps:
         """Handle function element (m:func)."""
-        fname = self._get_element(elem, "fName")
-        e = self._get_element(elem, "e")
+        children = self._index(elem)
+        name = yield from self._process_part(children.get(M.FNAME))
+        arg = yield from self._process_part(children.get(M.E))
 
-        func_name = self._process_children(fname) if fname is not None else ""
-        arg = self._process_children(e) if e is not None else ""
+        # Check if this is a recognized function spelled over several runs
+        if isinstance(name, Group):
+            texts = [item for item in name.items if isinstance(item, Text)]
+            clean_name = "".join(text.latex for text in texts).strip()
+            if len(texts) == len(name.items) and self._symbols.is_function_name(clean_name):
+                name = Symbol(self._symbols.get_function_latex(clean_name))
 
-        # Check if this is a recognized function
-        clean_name = func_name.strip()
-        if self._symbols.is_function_name(clean_name):
-            func_latex = self._symbols.get_function_latex(clean_name)
-            return f"{func_latex} {arg}"
+        return Group([name, Text(" "), arg])
 
-        return f"{func_name} {arg}"
-
-    def _handle_groupchar(self, elem: etree._Element) -> str:
+    def _handle_groupchar(self, elem: etree._Element) -> Steps:
         """Handle group character element (m:groupChr)."""
-        groupchrpr = self._get_element(elem, "groupChrPr")
-        chr_val = "⏟"  # Default to underbrace
-        pos = "bot"  # Default position
-
-        if groupchrpr is not None:
-            chr_elem = self._get_element(groupchrpr, "chr")
-            pos_elem = self._get_element(groupchrpr, "pos")
-
-            if chr_elem is not None:
-                chr_val = chr_elem.get(f"{{{NS['m']}}}val", "⏟")
-            if pos_elem is not None:
-                pos = pos_elem.get(f"{{{NS['m']}}}val", "bot")
+        children = self._index(elem)
+        groupchrpr = children.get(M.GROUPCHRPR)
+        # Default to underbrace
+        chr_val = self._get_property(groupchrpr, M.CHR_ATTR, "⏟")
+        pos = self._get_property(groupchrpr, M.POS, "bot")
 
-        e = self._get_element(elem, "e")
-        base = self._process_children(e) if e is not None else ""
+        base = yield from self._process_part(children.get(M.E))
 
         if chr_val == "⏞" or pos == "top":
-            return rf"\overbrace{{{base}}}"
-        return rf"\underbrace{{{base}}}"
+            return Command(r"\overbrace", [base])
+        return Command(r"\underbrace", [base])
 
-    def _handle_borderbox(self, elem: etree._Element) -> str:
+    def _handle_borderbox(self, elem: etree._Element) -> Steps:
         """Handle border box element (m:borderBox)."""
-        e = self._get_element(elem, "e")
-        content = self._process_children(e) if e is not None else ""
-        return rf"\boxed{{{content}}}"
+        content = yield from self._process_part(self._index(elem).get(M.E))
+        return Command(r"\boxed", [content])
 
-    def _handle_phantom(self, elem: etree._Element) -> str:
+    def _handle_phantom(self, elem: etree._Element) -> Steps:
         """Handle phantom element (m:phant)."""
-        e = self._get_element(elem, "e")
-        content = self._process_children(e) if e is not None else ""
-        return rf"\phantom{{{content}}}"
+        content = yield from self._process_part(self._index(elem).get(M.E))
+        return Command(r"\phantom", [content])
+
+    # Handlers by element tag
+    _HANDLERS: ClassVar[dict[str, Callable[[OmmlParser, etree._Element], Node | Steps]]] = {
+        M.OMATH: _handle_omath,
+        M.R: _handle_run,
+        M.T: _handle_text,
+        M.F: _handle_fraction,
+        M.RAD: _handle_radical,
+        M.SSUB: _handle_subscript,
+        M.SSUP: _handle_superscript,
+        M.SSUBSUP: _handle_subsup,
+        M.SPRE: _handle_presup,
+        M.NARY: _handle_nary,
+        M.LIMLOW: _handle_limlower,
+        M.LIMUP: _handle_limupper,
+        M.M: _handle_matrix,
+        M.D: _handle_delimiter,
+        M.EQU: _handle_eqarray,
+        M.BAR: _handle_bar,
+        M.ACC: _handle_accent,
+        M.BOX: _handle_box,
+        M.FUNC: _handle_function,
+        M.GROUPCHR: _handle_groupchar,
+        M.BORDERBOX: _handle_borderbox,
+        M.PHANT: _handle_phantom,
+    }
@@ -0,0 +1,258 @@
+"""
+Passes over the formula IR.
+
+Each pass walks the tree once, children first, without recursion:
+
+- prune flattens nested groups and drops empty text, empty scripts and
+  blank root degrees;
+- layout measures the LaTeX each node will be written as, and makes the
+  decisions that depend on it (\\dfrac, braced script bases, wide accents).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from docx2latex.infrastructure.converters.math.ir import (
+    Accent,
+    Command,
+    Delim,
+    Frac,
+    Group,
+    Matrix,
+    Script,
+    Symbol,
+    Text,
+    ends_with_command,
+    postorder,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docx2latex.infrastructure.converters.math.ir import Node
+
+# Fractions with a wider numerator or denominator are written as \dfrac
+DFRAC_MIN_WIDTH = 6
+
+# Style commands that do not count towards the width of an accent base
+_STYLE_COMMANDS = frozenset({r"\mathit", r"\mathrm", r"\mathbf"})
+
+
+def prune(root: Node) -> Node:
+    """
+    Remove what would be written as nothing, or as invalid LaTeX.
+
+    Args:
+        root: Tree built by the OMML parser
+
+    Returns:
+        The same tree, pruned in place
+    """
+    for node in postorder(root):
+        if isinstance(node, Group):
+            items: list[Node] = []
+            for item in node.items:
+                if isinstance(item, Group):
+                    # Already pruned: no empty items, no nested groups
+                    items.extend(item.items)
+                elif not (isinstance(item, Text) and not item.latex):
+                    items.append(item)
+            node.items = items
+        elif isinstance(node, Script):
+            if node.sub is not None and _is_empty(node.sub):
+                node.sub = None
+            if node.sup is not None and _is_empty(node.sup):
+                node.sup = None
+        elif isinstance(node, Command) and node.option is not None and _is_blank(node.option):
+            node.option = None
+    return root
+
+
+def _is_empty(node: Node) -> bool:
+    return (isinstance(node, Group) and not node.items) or (
+        isinstance(node, Text) and not node.latex
+    )
+
+
+def _is_blank(node: Node) -> bool:
+    """Check if a pruned node is written as whitespace at most."""
+    if isinstance(node, Text):
+        return not node.latex.strip()
+    return isinstance(node, Group) and all(_is_blank(item) for item in node.items)
+
+
+class _Metrics(NamedTuple):
+    """What layout decisions need to know of the LaTeX written for a node."""
+
+    width: int  # Length
+    lead: str  # First character ("" if nothing is written)
+    command_end: bool  # Ends with a control word
+    bare: int  # Length without braces and style commands
+
+
+_NOTHING = _Metrics(0, "", False, 0)
+
+# Nodes with layout decisions
+_DECIDED = (Frac, Script, Accent)
+
+
+def layout(root: Node) -> Node:
+    """
+    Make the layout decisions that depend on the written width of subtrees.
+
+    Args:
+        root: Pruned tree
+
+    Returns:
+        The same tree, with its layout decisions set
+    """
+    metrics: dict[int, _Metrics] = {}
+    for node in _measured(root):
+        metrics[id(node)] = _MEASURES[type(node)](node, metrics)
+    return root
+
+
+def _measured(root: Node) -> list[Node]:
+    """
+    List the nodes layout measures, children before their parent.
+
+    These are the nodes with a layout decision and everything below
+    them; the rest of the tree (long equation arrays, large matrices)
+    is only walked through.
+    """
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _DECIDED):
+            # Nested decisions come first in the subtree's order
+            order += postorder(node)
+        else:
+            stack.extend(node.children())
+    return order
+
+
+def _measure_text(node: Text | Symbol, _metrics: dict[int, _Metrics]) -> _Metrics:
+    words = node.latex.split()
+    if not words:
+        # Whitespace, written as one space between its neighbours
+        return _Metrics(1, "", False, 1) if node.latex else _NOTHING
+    width = sum(map(len, words)) + len(words) - 1
+    braces = node.latex.count("{") + node.latex.count("}")
+    return _Metrics(width, words[0][0], ends_with_command(words[-1]), width - braces)
+
+
+def _measure_group(node: Group, metrics: dict[int, _Metrics]) -> _Metrics:
+    return _sequence([metrics[id(item)] for item in node.items])
+
+
+def _sequence(parts: list[_Metrics]) -> _Metrics:
+    """Measure items written one after the other."""
+    width = bare = 0
+    lead = ""
+    command_end = False
+    for part in parts:
+        if command_end and part.lead.isalpha():
+            # The writer separates them with a space
+            width += 1
+            bare += 1
+        width += part.width
+        bare += part.bare
+        lead = lead or part.lead
+        command_end = part.command_end
+    return _Metrics(width, lead, command_end, bare)
+
+
+def _measure_frac(node: Frac, metrics: dict[int, _Metrics]) -> _Metrics:
+    num = metrics[id(node.num)]
+    den = metrics[id(node.den)]
+    if node.kind in ("skw", "lin"):
+        width = num.width + den.width + 5
+        return _Metrics(width, "{", False, num.bare + den.bare + 1)
+
+    if node.kind == "noBar":
+        name = r"\binom"
+    else:
+        node.display = num.width >= DFRAC_MIN_WIDTH or den.width >= DFRAC_MIN_WIDTH
+        name = r"\dfrac" if node.display else r"\frac"
+    width = len(name) + num.width + den.width + 4
+    return _Metrics(width, "\\", False, len(name) + num.bare + den.bare)
+
+
+def _measure_script(node: Script, metrics: dict[int, _Metrics]) -> _Metrics:
+    base = metrics[id(node.base)]
+    scripts = [metrics[id(s)] for s in (node.sub, node.sup) if s is not None]
+    if not scripts:
+        return base
+
+    width = sum(script.width + 3 for script in scripts)
+    bare = sum(script.bare + 1 for script in scripts)
+    if node.pre:
+        return _Metrics(
+            width + 2 + base.width, "{", base.command_end, bare + base.bare
+        )
+
+    # Brace bases written as more than one character, unless they start
+    # with a command (\frac{..}{..}, \left( .. \right), ...)
+    node.wrap_base = base.width > 1 and base.lead != "\\"
+    if node.wrap_base:
+        return _Metrics(width + base.width + 2, "{", False, bare + base.bare)
+    lead = base.lead or ("_" if node.sub is not None else "^")
+    return _Metrics(width + base.width, lead, False, bare + base.bare)
+
+
+def _measure_delim(node: Delim, metrics: dict[int, _Metrics]) -> _Metrics:
+    parts = [metrics[id(item)] for item in node.items]
+    separators = len(node.separator) * max(len(parts) - 1, 0)
+    content = _sequence(parts)
+    if not (node.left or node.right):
+        return content._replace(
+            width=content.width + separators, bare=content.bare + separators
+        )
+
+    right = rf"\right{node.right}"
+    width = len(rf"\left{node.left}") + content.width + separators + len(right) + 2
+    return _Metrics(width, "\\", ends_with_command(right), width - content.width + content.bare)
+
+
+def _measure_matrix(node: Matrix, metrics: dict[int, _Metrics]) -> _Metrics:
+    width = 2 * len(rf"\begin{{{node.env}}}") + 2
+    for i, row in enumerate(node.rows):
+        width += 4 if i else 0
+        for j, cell in enumerate(row):
+            width += metrics[id(cell)].width + (3 if j else 0)
+    return _Metrics(width, "\\", False, width)
+
+
+def _measure_command(node: Command, metrics: dict[int, _Metrics]) -> _Metrics:
+    args = [metrics[id(arg)] for arg in node.args]
+    width = len(node.name) + sum(arg.width + 2 for arg in args)
+    bare = sum(arg.bare for arg in args)
+    if node.name not in _STYLE_COMMANDS:
+        bare += len(node.name)
+    if node.option is not None:
+        option = metrics[id(node.option)]
+        width += option.width + 2
+        bare += option.bare + 2
+    return _Metrics(width, "\\", False, bare)
+
+
+def _measure_accent(node: Accent, metrics: dict[int, _Metrics]) -> _Metrics:
+    base = metrics[id(node.base)]
+    node.wide = base.bare > 1
+    name = node.wide_command if node.wide else node.command
+    return _Metrics(len(name) + base.width + 2, "\\", False, len(name) + base.bare)
+
+
+_MEASURES: dict[type, Callable[[Any, dict[int, _Metrics]], _Metrics]] = {
+    Text: _measure_text,
+    Symbol: _measure_text,
+    Group: _measure_group,
+    Frac: _measure_frac,
+    Script: _measure_script,
+    Delim: _measure_delim,
+    Matrix: _measure_matrix,
+    Command: _measure_command,
+    Accent: _measure_accent,
+}
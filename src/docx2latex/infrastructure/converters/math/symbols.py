@@ -4,18 +4,10 @@ Symbol mapping for math conversion.
 Maps Unicode characters and OMML symbols to LaTeX commands.
 """
 
+import re
+from string import ascii_lowercase, ascii_uppercase, digits
 from typing import Final
 
-# Mathematical italic variants (Unicode Mathematical Alphanumeric Symbols)
-MATH_ITALIC: Final[dict[str, str]] = {
-    "𝜋": r"\pi",
-    "𝜃": r"\theta",
-    "𝑟": "r",
-    "𝑥": "x",
-    "𝑦": "y",
-    "𝑛": "n",
-}
-
 # Greek letters - lowercase
 GREEK_LOWER: Final[dict[str, str]] = {
     "α": r"\alpha",
@@ -60,6 +52,7 @@ GREEK_UPPER: Final[dict[str, str]] = {
     "Ζ": "Z",
     "Η": "H",
     "Θ": r"\Theta",
+    "ϴ": r"\Theta",
     "Ι": "I",
     "Κ": "K",
     "Λ": r"\Lambda",
@@ -307,6 +300,154 @@ BRACKETS: Final[dict[str, tuple[str, str]]] = {
     "⌊": (r"\left\lfloor", r"\right\rfloor"),
 }
 
+# Mathematical Alphanumeric Symbols (U+1D400-U+1D7FF): runs of letters,
+# Greek letters and digits, one run per style. Each style is the LaTeX
+# commands to nest around the base character.
+Style = tuple[str, ...]
+
+# 13 runs of A-Z a-z
+_LATIN_START = 0x1D400
+_LATIN: Final[str] = ascii_uppercase + ascii_lowercase
+_LATIN_STYLES: Final[tuple[Style, ...]] = (
+    (r"\mathbf",),  # Bold
+    (),  # Italic: the default for letters in math mode
+    (r"\boldsymbol",),  # Bold italic
+    (r"\mathcal",),  # Script
+    (r"\boldsymbol", r"\mathcal"),  # Bold script
+    (r"\mathfrak",),  # Fraktur
+    (r"\mathbb",),  # Double-struck
+    (r"\boldsymbol", r"\mathfrak"),  # Bold fraktur
+    (r"\mathsf",),  # Sans-serif
+    (r"\boldsymbol", r"\mathsf"),  # Sans-serif bold
+    (r"\mathsf",),  # Sans-serif italic
+    (r"\boldsymbol", r"\mathsf"),  # Sans-serif bold italic
+    (r"\mathtt",),  # Monospace
+)
+
+# Italic dotless i and j
+_DOTLESS_START = 0x1D6A4
+_DOTLESS: Final[tuple[str, ...]] = (r"\imath", r"\jmath")
+
+# 5 runs of the Greek alphabet with its variant forms
+_GREEK_START = 0x1D6A8
+_GREEK: Final[str] = "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡϴΣΤΥΦΧΨΩ∇αβγδεζηθικλμνξοπρςστυφχψω∂ϵϑϰϕϱϖ"
+_GREEK_STYLES: Final[tuple[Style, ...]] = (
+    (r"\boldsymbol",),  # Bold
+    (),  # Italic
+    (r"\boldsymbol",),  # Bold italic
+    (r"\boldsymbol",),  # Sans-serif bold
+    (r"\boldsymbol",),  # Sans-serif bold italic
+)
+
+# 5 runs of 0-9
+_DIGIT_START = 0x1D7CE
+_DIGIT_STYLES: Final[tuple[Style, ...]] = (
+    (r"\mathbf",),  # Bold
+    (r"\mathbb",),  # Double-struck
+    (r"\mathsf",),  # Sans-serif
+    (r"\boldsymbol", r"\mathsf"),  # Sans-serif bold
+    (r"\mathtt",),  # Monospace
+)
+
+# Alphabets LaTeX only has in capitals, with the style their small
+# letters and digits fall back to
+_CAPITALS_ONLY: Final[dict[Style, Style]] = {
+    (r"\mathcal",): (),
+    (r"\boldsymbol", r"\mathcal"): (r"\boldsymbol",),
+    (r"\mathbb",): (),
+}
+
+# Small double-struck letters amssymb does provide
+_DOUBLE_STRUCK_SMALL: Final[dict[str, str]] = {"k": r"\Bbbk"}
+
+# Letters encoded before the block, in Letterlike Symbols; their code
+# points in the block are reserved. Small script letters are written
+# as plain letters, like those of the block
+LETTERLIKE: Final[dict[str, tuple[str, Style]]] = {
+    "\N{PLANCK CONSTANT}": ("h", ()),
+    "\N{SCRIPT CAPITAL B}": ("B", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL E}": ("E", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL F}": ("F", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL H}": ("H", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL I}": ("I", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL L}": ("L", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL M}": ("M", (r"\mathcal",)),
+    "\N{SCRIPT CAPITAL R}": ("R", (r"\mathcal",)),
+    "\N{SCRIPT SMALL E}": ("e", ()),
+    "\N{SCRIPT SMALL G}": ("g", ()),
+    "\N{SCRIPT SMALL O}": ("o", ()),
+    "\N{BLACK-LETTER CAPITAL C}": ("C", (r"\mathfrak",)),
+    "\N{BLACK-LETTER CAPITAL H}": ("H", (r"\mathfrak",)),
+    "\N{BLACK-LETTER CAPITAL Z}": ("Z", (r"\mathfrak",)),
+    "\N{DOUBLE-STRUCK CAPITAL C}": ("C", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL H}": ("H", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL N}": ("N", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL P}": ("P", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL Q}": ("Q", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL R}": ("R", (r"\mathbb",)),
+    "\N{DOUBLE-STRUCK CAPITAL Z}": ("Z", (r"\mathbb",)),
+}
+
+
+def decode_math_alphanumeric(char: str) -> tuple[str, Style] | None:
+    """
+    Decode a Mathematical Alphanumeric Symbol from its code point.
+
+    Args:
+        char: Unicode character
+
+    Returns:
+        Base character and style commands (e.g. ("R", ("\\mathbb",)) for
+        U+1D53B), or None if the character is not in the block
+    """
+    if char in LETTERLIKE:
+        return LETTERLIKE[char]
+    code = ord(char)
+    if _LATIN_START <= code < _DOTLESS_START:
+        run, offset = divmod(code - _LATIN_START, len(_LATIN))
+        letter, style = _LATIN[offset], _LATIN_STYLES[run]
+        if letter.islower() and style in _CAPITALS_ONLY:
+            if style == (r"\mathbb",) and letter in _DOUBLE_STRUCK_SMALL:
+                return _DOUBLE_STRUCK_SMALL[letter], ()
+            return letter, _CAPITALS_ONLY[style]
+        return letter, style
+    if _DOTLESS_START <= code < _DOTLESS_START + len(_DOTLESS):
+        return _DOTLESS[code - _DOTLESS_START], ()
+    if _GREEK_START <= code < _GREEK_START + len(_GREEK) * len(_GREEK_STYLES):
+        run, offset = divmod(code - _GREEK_START, len(_GREEK))
+        return _GREEK[offset], _GREEK_STYLES[run]
+    if _DIGIT_START <= code < _DIGIT_START + len(digits) * len(_DIGIT_STYLES):
+        run, offset = divmod(code - _DIGIT_START, len(digits))
+        style = _DIGIT_STYLES[run]
+        return digits[offset], _CAPITALS_ONLY.get(style, style)
+    return None
+
+
+def _math_alphanumerics() -> dict[str, str]:
+    """Map every decodable Mathematical Alphanumeric Symbol to LaTeX."""
+    base_map = {**GREEK_LOWER, **GREEK_UPPER, **OPERATORS}
+    chars = [chr(code) for code in range(_LATIN_START, 0x1D800)]
+    result = {}
+    for char in [*LETTERLIKE, *chars]:
+        decoded = decode_math_alphanumeric(char)
+        if decoded is None:
+            continue
+        base, style = decoded
+        latex = base_map.get(base, base)
+        for command in reversed(style):
+            latex = f"{command}{{{latex}}}"
+        result[char] = latex
+    return result
+
+
+MATH_ALPHANUMERICS: Final[dict[str, str]] = _math_alphanumerics()
+
+# Marks mapped commands that end with a letter, until map_text knows
+# whether a letter follows (NUL cannot occur in XML text)
+_COMMAND_END = "\x00"
+_COMMAND_BEFORE_LETTER = re.compile(_COMMAND_END + r"(?=[^\W\d_])")
+_ENDS_WITH_COMMAND = re.compile(r"\\[A-Za-z]+$")
+
 
 class SymbolMapper:
     """
@@ -315,16 +456,6 @@ class SymbolMapper:
     Provides comprehensive symbol translation for math conversion.
     """
 
-    def __init__(self) -> None:
-        # Combine all mappings
-        self._map: dict[str, str] = {}
-        self._map.update(MATH_ITALIC)
-        self._map.update(GREEK_LOWER)
-        self._map.update(GREEK_UPPER)
-        self._map.update(OPERATORS)
-        self._map.update(SUPERSCRIPTS)
-        self._map.update(SUBSCRIPTS)
-
     # Invisible characters that should be stripped
     INVISIBLE_CHARS = {
         "\u200b",  # Zero-width space
@@ -338,6 +469,24 @@ class SymbolMapper:
         "\ufeff",  # Zero-width no-break space (BOM)
     }
 
+    def __init__(self) -> None:
+        # Combine all mappings
+        self._map: dict[str, str] = {}
+        self._map.update(MATH_ALPHANUMERICS)
+        self._map.update(GREEK_LOWER)
+        self._map.update(GREEK_UPPER)
+        self._map.update(OPERATORS)
+        self._map.update(SUPERSCRIPTS)
+        self._map.update(SUBSCRIPTS)
+        self._map.update(dict.fromkeys(self.INVISIBLE_CHARS, ""))
+
+        # The same mapping as a str.translate table, with commands that
+        # end with a letter marked for map_text
+        self._table: dict[int, str] = {
+            ord(char): latex + _COMMAND_END if _ENDS_WITH_COMMAND.search(latex) else latex
+            for char, latex in self._map.items()
+        }
+
     def map_char(self, char: str) -> str:
         """
         Map a single character to LaTeX.
@@ -348,9 +497,6 @@ class SymbolMapper:
         Returns:
             LaTeX equivalent or original character, empty string for invisible chars
         """
-        # Strip invisible characters
-        if char in self.INVISIBLE_CHARS:
-            return ""
         return self._map.get(char, char)
 
     def map_text(self, text: str) -> str:
@@ -363,18 +509,12 @@ class SymbolMapper:
         Returns:
             LaTeX equivalent text
         """
-        result = []
-        for i, char in enumerate(text):
-            mapped = self.map_char(char)
-            result.append(mapped)
-
-            # Add space after LaTeX commands ending with letter if followed by letter
-            # e.g., \times followed by P should become \times P, not \timesP
-            if (mapped.startswith("\\") and mapped[-1].isalpha()
-                    and i + 1 < len(text) and text[i + 1].isalpha()):
-                result.append(" ")
-
-        return "".join(result)
+        mapped = text.translate(self._table)
+        if _COMMAND_END in mapped:
+            # Separate commands ending with a letter from a following
+            # letter: \times P, not \timesP
+            mapped = _COMMAND_BEFORE_LETTER.sub(" ", mapped).replace(_COMMAND_END, "")
+        return mapped
 
     def is_function_name(self, name: str) -> bool:
         """Check if a name is a recognized function."""
@@ -1,10 +1,22 @@
 """
 Converter registry - Factory pattern for element converters.
+
+Third-party converters are discovered through the ``docx2latex.converters``
+entry point group. Each entry point is named after the element type it
+converts and loads a callable that takes the registry and returns the
+converter (a converter class taking the registry will do):
+
+    [project.entry-points."docx2latex.converters"]
+    chart = "mypackage.charts:ChartConverter"
+
+A plugin is imported only when an element of its type first turns up
+that no registered converter handles.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Any
 
 from docx2latex.domain.entities.elements import DocumentElement
 from docx2latex.domain.protocols.converter import ConversionContext
@@ -13,10 +25,15 @@ from docx2latex.shared.logging import get_logger
 from docx2latex.shared.result import Err, Ok, Result
 
 if TYPE_CHECKING:
-    pass
+    from importlib.metadata import EntryPoint
+
+    from docx2latex.infrastructure.converters.math.cache import MathCache
 
 logger = get_logger("registry")
 
+# Entry point group of third-party converters
+PLUGIN_GROUP = "docx2latex.converters"
+
 
 class ConverterRegistry:
     """
@@ -24,12 +41,27 @@ class ConverterRegistry:
 
     Manages available converters and routes elements to the
     appropriate converter based on element type.
+
+    The converter of each element class is looked up once, in
+    registration order and then among plugins, and cached: converters
+    must decide can_convert from the element's class alone.
     """
 
-    def __init__(self) -> None:
-        self._converters: list[BaseConverter] = []
+    def __init__(self, plugin_group: str | None = None) -> None:
+        """
+        Initialize the registry.
 
-    def register(self, converter: BaseConverter) -> None:
+        Args:
+            plugin_group: Entry point group to load missing converters
+                from (default: no plugins)
+        """
+        self._converters: list[BaseConverter[Any]] = []
+        # Element class -> converter
+        self._dispatch: dict[type[DocumentElement], BaseConverter[Any] | None] = {}
+        self._plugin_group = plugin_group
+        self._plugins: dict[str, EntryPoint] | None = None  # Discovered on first miss
+
+    def register(self, converter: BaseConverter[Any]) -> None:
         """
         Register a converter.
 
@@ -37,9 +69,10 @@ class ConverterRegistry:
             converter: The converter to register
         """
         self._converters.append(converter)
+        self._dispatch.clear()
         logger.debug(f"Registered converter for: {converter.element_type}")
 
-    def get_converter(self, element: DocumentElement) -> BaseConverter | None:
+    def get_converter(self, element: DocumentElement) -> BaseConverter[Any] | None:
         """
         Get the appropriate converter for an element.
 
@@ -49,9 +82,63 @@ class ConverterRegistry:
         Returns:
             The matching converter, or None if no converter found
         """
+        try:
+            return self._dispatch[type(element)]
+        except KeyError:
+            converter = self._find_converter(element)
+            self._dispatch[type(element)] = converter
+            return converter
+
+    def _find_converter(self, element: DocumentElement) -> BaseConverter[Any] | None:
+        """Find the converter of an element among registered ones, then plugins."""
         for converter in self._converters:
             if converter.can_convert(element):
                 return converter
+
+        plugin = self._load_plugin(element.element_type)
+        if plugin is not None and plugin.can_convert(element):
+            return plugin
+        return None
+
+    def _load_plugin(self, element_type: str) -> BaseConverter[Any] | None:
+        """Load and register the plugin converter of an element type, if any."""
+        if self._plugin_group is None:
+            return None
+        if self._plugins is None:
+            self._plugins = {ep.name: ep for ep in entry_points(group=self._plugin_group)}
+
+        # Each plugin is tried once, even if it fails to load
+        entry_point = self._plugins.pop(element_type, None)
+        if entry_point is None:
+            return None
+        try:
+            factory = entry_point.load()
+            if isinstance(factory, type) and not issubclass(factory, BaseConverter):
+                raise TypeError(f"{factory.__name__} is not a BaseConverter subclass")
+            converter = factory(self)
+            if not isinstance(converter, BaseConverter):
+                raise TypeError(f"it returned {type(converter).__name__}, not a BaseConverter")
+        except Exception as e:
+            logger.warning(f"Failed to load converter plugin {entry_point.value}: {e}")
+            return None
+
+        self.register(converter)
+        logger.debug(f"Loaded converter plugin: {entry_point.value}")
+        return converter
+
+    def get_converter_for_type(self, element_type: str) -> BaseConverter[Any] | None:
+        """
+        Get the converter registered for an element type.
+
+        Args:
+            element_type: Element type (e.g. "math")
+
+        Returns:
+            The first converter for that type, or None if there is none
+        """
+        for converter in self._converters:
+            if converter.element_type == element_type:
+                return converter
         return None
 
     def convert(
@@ -85,10 +172,13 @@ class ConverterRegistry:
         return [c.element_type for c in self._converters]
 
 
-def create_default_registry() -> ConverterRegistry:
+def create_default_registry(math_cache: MathCache | None = None) -> ConverterRegistry:
     """
     Create a registry with all default converters.
 
+    Args:
+        math_cache: Cache of converted formulas (default: no caching)
+
     Returns:
         Configured ConverterRegistry
     """
@@ -98,11 +188,11 @@ def create_default_registry() -> ConverterRegistry:
     from docx2latex.infrastructure.converters.paragraph import ParagraphConverter
     from docx2latex.infrastructure.converters.table import TableConverter
 
-    registry = ConverterRegistry()
+    registry = ConverterRegistry(PLUGIN_GROUP)
 
     # Register all converters
     registry.register(ParagraphConverter(registry))
-    registry.register(MathConverter())
+    registry.register(MathConverter(math_cache))
     registry.register(TableConverter(registry))
     registry.register(ListConverter(registry))
     registry.register(ImageConverter())
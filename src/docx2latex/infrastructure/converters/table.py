@@ -147,21 +147,21 @@ class TableConverter(BaseConverter[Table]):
         return align_map.get(cell.alignment, "l")
 
     def _convert_cell(self, cell: TableCell, context: ConversionContext) -> str:
-        """Convert cell content to LaTeX."""
-        if not cell.paragraphs:
+        """Convert cell content (paragraphs and nested tables) to LaTeX."""
+        if not cell.content:
             return ""
 
-        # Convert paragraphs
+        # Convert paragraphs and nested tables
         parts = []
-        for para in cell.paragraphs:
+        for item in cell.content:
             if self._registry:
-                result = self._registry.convert(para, context)
+                result = self._registry.convert(item, context)
                 if isinstance(result, Ok):
                     content = result.value.strip()
                     if content:
                         parts.append(content)
             else:
-                parts.append(para.text)
+                parts.append(item.text)
 
         # Join multiple paragraphs with line breaks
         if len(parts) > 1:
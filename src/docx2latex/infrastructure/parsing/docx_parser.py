@@ -6,10 +6,13 @@ Parses DOCX files into domain Document entities.
 
 from __future__ import annotations
 
+import shutil
+import tempfile
 import zipfile
+from contextlib import ExitStack
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 from lxml import etree
 
@@ -25,9 +28,11 @@ from docx2latex.domain.entities.elements import (
     Table,
     TableCell,
     TableRow,
+    element_id_scope,
 )
 from docx2latex.domain.value_objects.dimension import Dimension
 from docx2latex.domain.value_objects.layout import PageLayout
+from docx2latex.domain.value_objects.part_ref import PackageArchive, PartRef
 from docx2latex.domain.value_objects.style import (
     Alignment,
     ListType,
@@ -35,32 +40,210 @@ from docx2latex.domain.value_objects.style import (
     ParagraphStyle,
     TextStyle,
 )
-from docx2latex.infrastructure.parsing.style_resolver import StyleResolver
+from docx2latex.infrastructure.parsing.package_index import PackageIndex, Relationship
+from docx2latex.infrastructure.parsing.style_cache import StyleCache, property_key
+from docx2latex.infrastructure.parsing.style_resolver import (
+    PropertyMap,
+    StyleResolver,
+    child_properties,
+)
 from docx2latex.infrastructure.parsing.xml_namespaces import NS, A, M, PIC, R, W, WP
 from docx2latex.shared.exceptions import DocxParseError
 from docx2latex.shared.logging import get_logger
 from docx2latex.shared.result import Err, Ok, Result
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
 
 logger = get_logger("parser")
 
+# Top-level body content produced by the streaming parser
+BodyElement = Paragraph | Table | ListBlock | PageLayout
+
+# A body element with its list numbering (numId, ilvl), if any
+NumberedBlock = tuple[BodyElement, tuple[str, int] | None]
+
+# Chunk size used when spooling non-seekable input streams
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_content(parent: etree._Element, *tags: str) -> Iterator[etree._Element]:
+    """
+    Iterate over the child elements of a table, row or cell with given tags.
+
+    Content controls (w:sdt) and custom XML wrappers are transparent:
+    their content is yielded as if it were a direct child. Nothing
+    else is descended into, so nested tables are left to their cell.
+    """
+    for child in parent:
+        tag = child.tag
+        if tag in tags:
+            yield child
+        elif tag == W.SDT:
+            content = child.find(W.SDTCONTENT)
+            if content is not None:
+                yield from iter_content(content, *tags)
+        elif tag == W.CUSTOMXML:
+            yield from iter_content(child, *tags)
+
+
+def _run_child_text(child: etree._Element) -> str:
+    """Get the text contributed by a break, tab or symbol in a run ("" for anything else)."""
+    tag = child.tag
+    if tag == W.BR:
+        return "\n\\newpage\n" if child.get(W.TYPE, "") == "page" else "\n"
+
+    if tag == W.TAB:
+        return "\t"
+
+    if tag == W.SYM:
+        # Symbol - try to get character
+        char = child.get(W.CHAR, "")
+        if char:
+            try:
+                return chr(int(char, 16))
+            except ValueError:
+                return "?"
+
+    return ""
+
+
+def read_core_properties(root: etree._Element) -> DocumentMetadata:
+    """
+    Read document metadata from a parsed core properties part.
+
+    Args:
+        root: Root element of docProps/core.xml
+
+    Returns:
+        Document metadata
+    """
+    metadata = DocumentMetadata()
+
+    # Title
+    title_elem = root.find(f".//{{{NS['dc']}}}title")
+    if title_elem is not None and title_elem.text:
+        metadata.title = title_elem.text
+
+    # Author
+    creator_elem = root.find(f".//{{{NS['dc']}}}creator")
+    if creator_elem is not None and creator_elem.text:
+        metadata.author = creator_elem.text
+
+    # Subject
+    subject_elem = root.find(f".//{{{NS['dc']}}}subject")
+    if subject_elem is not None and subject_elem.text:
+        metadata.subject = subject_elem.text
+
+    # Description
+    desc_elem = root.find(f".//{{{NS['dc']}}}description")
+    if desc_elem is not None and desc_elem.text:
+        metadata.description = desc_elem.text
+
+    # Created date
+    created_elem = root.find(f".//{{{NS['dcterms']}}}created")
+    if created_elem is not None and created_elem.text:
+        metadata.created = created_elem.text
+
+    # Modified date
+    modified_elem = root.find(f".//{{{NS['dcterms']}}}modified")
+    if modified_elem is not None and modified_elem.text:
+        metadata.modified = modified_elem.text
+
+    return metadata
+
+
+def read_section_layout(sectpr: etree._Element) -> PageLayout:
+    """
+    Read the page layout of a section properties (w:sectPr) element.
+
+    Args:
+        sectpr: Section properties element
+
+    Returns:
+        Page layout of the section
+    """
+    # Page size
+    width = None
+    height = None
+    pgsz = sectpr.find(f"{{{NS['w']}}}pgSz", namespaces=NS)
+    if pgsz is not None:
+        w = pgsz.get(f"{{{NS['w']}}}w")
+        h = pgsz.get(f"{{{NS['w']}}}h")
+        if w:
+            try:
+                width = int(w)
+            except ValueError:
+                pass
+        if h:
+            try:
+                height = int(h)
+            except ValueError:
+                pass
+
+    # Page margins
+    margin_top = None
+    margin_bottom = None
+    margin_left = None
+    margin_right = None
+    header = None
+    footer = None
+    gutter = None
+
+    pgmar = sectpr.find(f"{{{NS['w']}}}pgMar", namespaces=NS)
+    if pgmar is not None:
+        for attr, var_name in [
+            ("top", "margin_top"),
+            ("bottom", "margin_bottom"),
+            ("left", "margin_left"),
+            ("right", "margin_right"),
+            ("header", "header"),
+            ("footer", "footer"),
+            ("gutter", "gutter"),
+        ]:
+            val = pgmar.get(f"{{{NS['w']}}}{attr}")
+            if val:
+                try:
+                    locals()[var_name] = int(val)
+                except ValueError:
+                    pass
+
+    return PageLayout.from_docx_section(
+        width_twips=width,
+        height_twips=height,
+        margin_top_twips=margin_top,
+        margin_bottom_twips=margin_bottom,
+        margin_left_twips=margin_left,
+        margin_right_twips=margin_right,
+        header_twips=header,
+        footer_twips=footer,
+        gutter_twips=gutter,
+    )
+
 
 class DocxParser:
     """
     Parser for DOCX files.
 
     Extracts document content, styles, and embedded resources
-    into domain entities.
+    into domain entities. The parser holds no per-document state:
+    each call works on its own ParseSession, so one instance can
+    serve concurrent parses from several threads.
     """
 
-    def __init__(self) -> None:
-        self._style_resolver = StyleResolver()
-        self._relationships: dict[str, dict[str, str]] = {}
-        self._numbering: dict[str, dict[str, dict]] = {}  # numId -> ilvl -> props
-        self._current_list_stack: list[ListBlock] = []
-        self._zipfile: zipfile.ZipFile | None = None
+    def __init__(self, part_executor: Executor | None = None) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            part_executor: Optional thread pool used to decompress and
+                parse independent package parts (styles, numbering, core
+                properties, main document) concurrently. It is owned by
+                the caller and may be shared between parsers. Without it,
+                parts are loaded one after another.
+        """
+        self._part_executor = part_executor
 
     def parse(self, path: Path) -> Result[Document, str]:
         """
@@ -78,101 +261,251 @@ class DocxParser:
         if not path.suffix.lower() == ".docx":
             return Err(f"Not a DOCX file: {path}")
 
-        try:
-            with open(path, "rb") as f:
-                data = f.read()
-            result = self.parse_bytes(data)
-            if isinstance(result, Ok):
-                result.value.source_path = path
-            return result
-        except Exception as e:
-            return Err(f"Failed to read file: {e}")
+        result = self._parse_package(path, PackageArchive(path))
+        if isinstance(result, Ok):
+            result.value.source_path = path
+        return result
 
     def parse_bytes(self, data: bytes) -> Result[Document, str]:
         """
         Parse DOCX data from bytes.
 
+        Images keep a reference to ``data`` instead of copying their
+        bytes out of the archive.
+
         Args:
             data: Raw DOCX file bytes
 
+        Returns:
+            Result containing Document or error message
+        """
+        return self._parse_package(BytesIO(data), PackageArchive(data))
+
+    def parse_stream(self, stream: IO[bytes]) -> Result[Document, str]:
+        """
+        Parse DOCX data from a binary stream.
+
+        Seekable streams are read in place; non-seekable ones (sockets,
+        pipes, upload bodies) are first spooled to a temporary file.
+        Images keep a reference to the (possibly spooled) stream; a
+        caller's stream must stay open while they are exported. The
+        spool is closed after parsing if the document has no images,
+        and otherwise belongs to the images' shared PackageArchive.
+
+        Args:
+            stream: Readable binary stream containing a DOCX package
+
+        Returns:
+            Result containing Document or error message
+        """
+        if stream.seekable():
+            return self._parse_package(stream, PackageArchive(stream))
+
+        with ExitStack() as stack:
+            spool = stack.enter_context(tempfile.TemporaryFile())
+            try:
+                shutil.copyfileobj(stream, spool, SPOOL_CHUNK_SIZE)
+                spool.seek(0)
+            except OSError as e:
+                return Err(f"Failed to read stream: {e}")
+
+            result = self._parse_package(spool, PackageArchive(spool, owns_package=True))
+            if isinstance(result, Ok) and result.value.images:
+                # Images stream from the spool: it closes with their archive
+                stack.pop_all()
+            return result
+
+    def _parse_package(
+        self, file: Path | IO[bytes], source: PackageArchive
+    ) -> Result[Document, str]:
+        """
+        Parse a DOCX package.
+
+        The archive is opened in place; parts are streamed from it and
+        never copied whole into memory.
+
+        Args:
+            file: Path or seekable stream of the DOCX package
+            source: Shared archive of the package, for lazy image handles
+
         Returns:
             Result containing Document or error message
         """
         try:
-            self._zipfile = zipfile.ZipFile(BytesIO(data))
+            archive = zipfile.ZipFile(file)
         except zipfile.BadZipFile:
             return Err("Invalid DOCX file (not a valid ZIP archive)")
+        except OSError as e:
+            return Err(f"Failed to read file: {e}")
+
+        with archive:
+            try:
+                document = self._create_session(archive, source).parse()
+                return Ok(document)
 
+            except DocxParseError as e:
+                return Err(str(e))
+            except Exception as e:
+                logger.exception("Unexpected error parsing DOCX")
+                return Err(f"Parse error: {e}")
+
+    def _create_session(
+        self, archive: zipfile.ZipFile, source: PackageArchive
+    ) -> ParseSession:
+        """Create the session parsing one package."""
+        return ParseSession(archive, source, self._part_executor)
+
+    def iter_elements(self, path: Path) -> Iterator[BodyElement]:
+        """
+        Stream the top-level body elements of a DOCX file.
+
+        Elements are yielded one at a time as soon as they are complete,
+        and each processed subtree is discarded, so memory stays flat
+        regardless of document size. A body-level section break is
+        yielded as the PageLayout of the section it closes. Images are
+        not loaded in this mode.
+
+        Args:
+            path: Path to the DOCX file
+
+        Yields:
+            Paragraph, Table and ListBlock entities, and PageLayout
+            section breaks, in document order
+
+        Raises:
+            DocxParseError: If the file is not a valid DOCX package
+        """
         try:
-            # Load relationships
-            self._load_relationships()
+            zf = zipfile.ZipFile(path)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise DocxParseError(f"Failed to open DOCX file: {e}", file_path=str(path)) from e
 
-            # Load styles
-            self._load_styles()
+        with zf:
+            yield from ParseSession(zf, PackageArchive(path)).iter_elements()
 
-            # Load numbering definitions
-            self._load_numbering()
 
-            # Parse core properties (metadata)
-            metadata = self._parse_metadata()
+class ParseSession:
+    """
+    Parsing state for a single DOCX package.
 
-            # Parse main document
-            document = self._parse_document(metadata)
+    Owns everything tied to one document: the open archive, its
+    relationships, numbering definitions and style resolver. A new
+    session is created for every parse and discarded afterwards, so
+    nothing leaks from one document into the next.
+    """
 
-            return Ok(document)
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        source: PackageArchive,
+        part_executor: Executor | None = None,
+    ) -> None:
+        """
+        Initialize a parse session.
 
-        except DocxParseError as e:
-            return Err(str(e))
-        except Exception as e:
-            logger.exception("Unexpected error parsing DOCX")
-            return Err(f"Parse error: {e}")
-        finally:
-            if self._zipfile:
-                self._zipfile.close()
-                self._zipfile = None
+        Args:
+            archive: Open DOCX archive (owned by the caller)
+            source: Shared archive of the package, for lazy image handles
+            part_executor: Optional executor loading package parts concurrently
+        """
+        self._package = PackageIndex(archive)
+        self._source = source
+        self._part_executor = part_executor
+        self._main_part = self._package.main_document_part
+        self._style_resolver = StyleResolver()
+        self._paragraph_styles: StyleCache[ParagraphStyle] = StyleCache()
+        self._run_styles: StyleCache[TextStyle] = StyleCache()
+        self._relationships: dict[str, Relationship] = {}
+        self._numbering: dict[str, dict[str, dict[str, str]]] = {}  # numId -> ilvl -> props
+        self._element_ids: Iterator[int] | None = None  # None: number from 1
 
-    def _load_relationships(self) -> None:
-        """Load document relationships from _rels/document.xml.rels."""
-        rels_path = "word/_rels/document.xml.rels"
+    def parse(self) -> Document:
+        """
+        Parse the whole package into a Document.
 
-        if rels_path not in self._zipfile.namelist():
-            return
+        Raises:
+            DocxParseError: If the package has no main document part
+        """
+        # Load relationships
+        self._load_relationships()
 
-        rels_xml = self._zipfile.read(rels_path)
-        root = etree.fromstring(rels_xml)
+        # Decompress and parse the independent parts concurrently, if possible
+        if self._part_executor is not None:
+            self._prefetch_parts(self._part_executor)
 
-        self._relationships["document"] = {}
-        for rel in root.iter(f"{{{NS['pr']}}}Relationship"):
-            rel_id = rel.get("Id", "")
-            rel_type = rel.get("Type", "")
-            target = rel.get("Target", "")
-            self._relationships["document"][rel_id] = {
-                "type": rel_type,
-                "target": target,
-            }
+        # Load styles
+        self._load_styles()
 
-    def _load_styles(self) -> None:
-        """Load styles from word/styles.xml."""
-        styles_path = "word/styles.xml"
+        # Load numbering definitions
+        self._load_numbering()
 
-        if styles_path not in self._zipfile.namelist():
-            return
+        # Parse core properties (metadata)
+        metadata = self._parse_metadata()
 
-        styles_xml = self._zipfile.read(styles_path)
-        self._style_resolver.load_from_xml(styles_xml)
+        # Parse main document, numbering its elements from 1
+        with element_id_scope(self._element_ids):
+            return self._parse_document(metadata)
 
-    def _load_numbering(self) -> None:
-        """Load numbering definitions from word/numbering.xml."""
-        numbering_path = "word/numbering.xml"
+    def iter_elements(self) -> Iterator[BodyElement]:
+        """
+        Stream top-level body elements (see DocxParser.iter_elements).
+
+        Raises:
+            DocxParseError: If the package has no main document part
+        """
+        self._load_relationships()
+        self._load_styles()
+        self._load_numbering()
 
-        if numbering_path not in self._zipfile.namelist():
+        if not self._package.has_part(self._main_part):
+            raise DocxParseError("Missing document.xml")
+
+        with self._package.open(self._main_part) as stream:
+            yield from self._iter_body(stream)
+
+    def _prefetch_parts(self, executor: Executor) -> None:
+        """
+        Load the parts needed before body assembly concurrently.
+
+        Styles, numbering and core properties are parsed into the
+        package's tree cache; every load has finished when this
+        returns. The main document is not prefetched: it is streamed
+        while the body is assembled, never held whole in memory.
+        """
+        self._package.prefetch(
+            [
+                self._find_part("styles", "word/styles.xml"),
+                self._find_part("numbering", "word/numbering.xml"),
+                self._find_part("core-properties", "docProps/core.xml", source_part=""),
+            ],
+            executor,
+        )
+
+    def _find_part(self, type_name: str, default_path: str, source_part: str | None = None) -> str:
+        """Locate a part through the relationships graph, falling back to its usual path."""
+        source = self._main_part if source_part is None else source_part
+        return self._package.related_part(source, type_name) or default_path
+
+    def _load_relationships(self) -> None:
+        """Load main document relationships."""
+        self._relationships = self._package.relationships(self._main_part)
+
+    def _load_styles(self) -> None:
+        """Load styles from the styles part (word/styles.xml)."""
+        root = self._package.tree(self._find_part("styles", "word/styles.xml"))
+        if root is None:
             return
 
-        numbering_xml = self._zipfile.read(numbering_path)
-        root = etree.fromstring(numbering_xml)
+        self._style_resolver.load_from_tree(root)
+
+    def _load_numbering(self) -> None:
+        """Load numbering definitions from the numbering part (word/numbering.xml)."""
+        root = self._package.tree(self._find_part("numbering", "word/numbering.xml"))
+        if root is None:
+            return
 
         # Parse abstract numbering definitions
-        abstract_nums: dict[str, dict] = {}
+        abstract_nums: dict[str, dict[str, dict[str, str]]] = {}
         for abstract in root.iter(f"{{{NS['w']}}}abstractNum"):
             abstract_id = abstract.get(f"{{{NS['w']}}}abstractNumId", "")
             levels = {}
@@ -193,146 +526,140 @@ class DocxParser:
                     self._numbering[num_id] = abstract_nums[abstract_id]
 
     def _parse_metadata(self) -> DocumentMetadata:
-        """Parse document metadata from docProps/core.xml."""
-        core_path = "docProps/core.xml"
+        """Parse document metadata from the core properties part (docProps/core.xml)."""
+        core_path = self._find_part("core-properties", "docProps/core.xml", source_part="")
 
         metadata = DocumentMetadata()
 
-        if core_path not in self._zipfile.namelist():
-            return metadata
-
         try:
-            core_xml = self._zipfile.read(core_path)
-            root = etree.fromstring(core_xml)
-
-            # Title
-            title_elem = root.find(f".//{{{NS['dc']}}}title")
-            if title_elem is not None and title_elem.text:
-                metadata.title = title_elem.text
-
-            # Author
-            creator_elem = root.find(f".//{{{NS['dc']}}}creator")
-            if creator_elem is not None and creator_elem.text:
-                metadata.author = creator_elem.text
-
-            # Subject
-            subject_elem = root.find(f".//{{{NS['dc']}}}subject")
-            if subject_elem is not None and subject_elem.text:
-                metadata.subject = subject_elem.text
-
-            # Description
-            desc_elem = root.find(f".//{{{NS['dc']}}}description")
-            if desc_elem is not None and desc_elem.text:
-                metadata.description = desc_elem.text
-
-            # Created date
-            created_elem = root.find(f".//{{{NS['dcterms']}}}created")
-            if created_elem is not None and created_elem.text:
-                metadata.created = created_elem.text
-
-            # Modified date
-            modified_elem = root.find(f".//{{{NS['dcterms']}}}modified")
-            if modified_elem is not None and modified_elem.text:
-                metadata.modified = modified_elem.text
-
+            root = self._package.tree(core_path)
+            if root is None:
+                return metadata
+            metadata = read_core_properties(root)
         except Exception as e:
             logger.warning(f"Failed to parse metadata: {e}")
 
         return metadata
 
     def _parse_document(self, metadata: DocumentMetadata) -> Document:
-        """Parse the main document content."""
-        document_path = "word/document.xml"
+        """
+        Parse the main document content.
 
-        if document_path not in self._zipfile.namelist():
+        Args:
+            metadata: Parsed core properties
+        """
+        if not self._package.has_part(self._main_part):
             raise DocxParseError("Missing document.xml")
 
-        document_xml = self._zipfile.read(document_path)
-        root = etree.fromstring(document_xml)
-
         document = Document(metadata=metadata)
-        self._current_list_stack = []
-
-        # Find document body
-        body = root.find(f".//{{{NS['w']}}}body")
-        if body is None:
-            return document
 
         # Parse body elements
         current_section = document.current_section
+
+        with self._package.open(self._main_part) as stream:
+            for element in self._iter_body(stream):
+                if isinstance(element, PageLayout):
+                    # Section properties - create new section for subsequent content
+                    current_section.layout = element
+                    current_section = document.new_section()
+                elif isinstance(element, Table):
+                    current_section.add_table(element)
+                elif isinstance(element, ListBlock):
+                    current_section.add_list(element)
+                else:
+                    current_section.add_paragraph(element)
+
+        # Load images
+        self._load_images(document)
+
+        return document
+
+    def _iter_body(self, stream: IO[bytes]) -> Iterator[BodyElement]:
+        """
+        Incrementally parse document.xml and yield finished body elements.
+
+        Consecutive list item paragraphs are grouped into ListBlocks.
+        """
         pending_list_items: list[tuple[Paragraph, int, str]] = []  # (para, level, numId)
 
-        for elem in body:
-            tag = etree.QName(elem).localname
+        for element, num_info in self._iter_blocks(stream):
+            if num_info and isinstance(element, Paragraph):
+                num_id, ilvl = num_info
+                pending_list_items.append((element, ilvl, num_id))
+                continue
 
-            if tag == "p":
-                # Check if this is a list item
-                num_info = self._get_numbering_info(elem)
-                if num_info:
-                    num_id, ilvl = num_info
-                    para = self._parse_paragraph(elem)
-                    pending_list_items.append((para, ilvl, num_id))
-                else:
-                    # Flush any pending list items
-                    if pending_list_items:
-                        list_block = self._build_list_from_items(pending_list_items)
-                        current_section.add_list(list_block)
-                        pending_list_items = []
-
-                    para = self._parse_paragraph(elem)
-                    current_section.add_paragraph(para)
-
-            elif tag == "tbl":
-                # Flush any pending list items
-                if pending_list_items:
-                    list_block = self._build_list_from_items(pending_list_items)
-                    current_section.add_list(list_block)
-                    pending_list_items = []
-
-                table = self._parse_table(elem)
-                current_section.add_table(table)
-
-            elif tag == "sectPr":
-                # Section properties - create new section for subsequent content
-                layout = self._parse_section_props(elem)
-                current_section.layout = layout
-                # Create new section for subsequent content
-                current_section = document.new_section()
+            # Flush any pending list items (section breaks do not end a list)
+            if pending_list_items and not isinstance(element, PageLayout):
+                yield self._build_list_from_items(pending_list_items)
+                pending_list_items = []
+
+            yield element
 
         # Flush any remaining list items
         if pending_list_items:
-            list_block = self._build_list_from_items(pending_list_items)
-            current_section.add_list(list_block)
+            yield self._build_list_from_items(pending_list_items)
 
-        # Load images
-        self._load_images(document)
+    def _iter_blocks(self, stream: IO[bytes]) -> Iterator[NumberedBlock]:
+        """
+        Parse body elements with iterparse, one subtree at a time.
 
-        return document
+        Only end events for paragraphs, tables and section properties are
+        reported by lxml. Elements nested deeper than the body (table cell
+        paragraphs, paragraph-level sectPr) are left in place for their
+        enclosing element, which is parsed once it ends.
+        """
+        for _event, elem in etree.iterparse(stream, events=("end",), tag=(W.P, W.TBL, W.SECTPR)):
+            body = elem.getparent()
+            if body is None or body.tag != W.BODY:
+                continue
+
+            yield self._parse_block(elem)
+
+            # Release the processed subtree and everything before it
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del body[0]
+
+    def _parse_block(self, elem: etree._Element) -> NumberedBlock:
+        """Parse a top-level body element (paragraph, table or section properties)."""
+        tag = elem.tag
+        if tag == W.P:
+            return self._parse_paragraph(elem), self._get_numbering_info(elem)
+        if tag == W.TBL:
+            return self._parse_table(elem), None
+        # Section properties close the current section
+        return self._parse_section_props(elem), None
 
     def _get_numbering_info(self, para_elem: etree._Element) -> tuple[str, int] | None:
         """Get numbering info (numId, ilvl) if paragraph is a list item."""
-        ppr = para_elem.find(f"{{{NS['w']}}}pPr", namespaces=NS)
+        ppr = para_elem.find(W.PPR)
         if ppr is None:
             return None
 
-        numpr = ppr.find(f"{{{NS['w']}}}numPr", namespaces=NS)
+        numpr = ppr.find(W.NUMPR)
         if numpr is None:
             return None
 
-        num_id_elem = numpr.find(f"{{{NS['w']}}}numId", namespaces=NS)
-        ilvl_elem = numpr.find(f"{{{NS['w']}}}ilvl", namespaces=NS)
+        return self._numbering_info(child_properties(numpr))
+
+    def _numbering_info(self, num_props: PropertyMap | None) -> tuple[str, int] | None:
+        """Get numbering info (numId, ilvl) from a numPr property map."""
+        if num_props is None:
+            return None
 
-        if num_id_elem is None:
+        num_id_attrs = num_props.get(W.NUMID)
+        if num_id_attrs is None:
             return None
 
-        num_id = num_id_elem.get(f"{{{NS['w']}}}val", "0")
+        num_id = num_id_attrs.get(W.VAL, "0")
         if num_id == "0":  # numId 0 means no numbering
             return None
 
         ilvl = 0
-        if ilvl_elem is not None:
+        ilvl_attrs = num_props.get(W.ILVL)
+        if ilvl_attrs is not None:
             try:
-                ilvl = int(ilvl_elem.get(f"{{{NS['w']}}}val", "0"))
+                ilvl = int(ilvl_attrs.get(W.VAL, "0"))
             except ValueError:
                 pass
 
@@ -391,110 +718,121 @@ class DocxParser:
     def _parse_paragraph(self, para_elem: etree._Element) -> Paragraph:
         """Parse a paragraph element."""
         # Get paragraph properties
-        ppr = para_elem.find(f"{{{NS['w']}}}pPr", namespaces=NS)
+        ppr = para_elem.find(W.PPR)
         style = self._parse_paragraph_style(ppr)
 
         paragraph = Paragraph(style=style)
 
         # Parse content (runs, math, hyperlinks)
         for child in para_elem:
-            tag = etree.QName(child).localname
+            tag = child.tag
 
-            if tag == "r":
+            if tag == W.R:
                 run = self._parse_run(child)
                 if run:
                     paragraph.content.append(run)
 
-            elif tag == "hyperlink":
+            elif tag == W.HYPERLINK:
                 hyperlink = self._parse_hyperlink(child)
                 if hyperlink:
                     paragraph.content.append(hyperlink)
 
-            elif tag == "oMath":
+            elif tag == M.OMATH:
                 math = self._parse_math(child, MathType.INLINE)
                 paragraph.content.append(math)
 
-            elif tag == "oMathPara":
+            elif tag == M.OMATHPARA:
                 # Display math - may contain multiple oMath elements
-                for omath in child.iter(f"{{{NS['m']}}}oMath"):
-                    math = self._parse_math(omath, MathType.DISPLAY)
-                    paragraph.content.append(math)
+                paragraph.content.extend(self._parse_math_para(child))
 
         return paragraph
 
+    def _parse_math_para(self, math_para: etree._Element) -> list[MathBlock]:
+        """Parse the oMath elements of a display math paragraph."""
+        return [self._parse_math(omath, MathType.DISPLAY) for omath in math_para.iter(M.OMATH)]
+
     def _parse_paragraph_style(self, ppr: etree._Element | None) -> ParagraphStyle:
-        """Parse paragraph properties into a style."""
+        """Parse paragraph properties into a (shared) style, keyed by their XML."""
         if ppr is None:
+            return self._paragraph_style(None)
+
+        return self._paragraph_styles.get(
+            etree.tostring(ppr, with_tail=False),
+            lambda: self._resolve_paragraph_style(child_properties(ppr)),
+        )
+
+    def _paragraph_style(self, props: PropertyMap | None) -> ParagraphStyle:
+        """Get the (shared) paragraph style for a pPr property map."""
+        return self._paragraph_styles.get(
+            property_key(props), lambda: self._resolve_paragraph_style(props)
+        )
+
+    def _resolve_paragraph_style(self, props: PropertyMap | None) -> ParagraphStyle:
+        """Resolve a paragraph style from a pPr property map."""
+        if props is None:
             return ParagraphStyle.empty()
 
         # Get style reference
-        pstyle_elem = ppr.find(f"{{{NS['w']}}}pStyle", namespaces=NS)
-        style_id = pstyle_elem.get(f"{{{NS['w']}}}val") if pstyle_elem is not None else None
+        pstyle_attrs = props.get(W.PSTYLE)
+        style_id = pstyle_attrs.get(W.VAL) if pstyle_attrs is not None else None
 
         # Get base style from resolver
         base_style = self._style_resolver.resolve_paragraph_style(style_id)
 
         # Parse direct formatting (overrides style)
-        direct = self._style_resolver._parse_paragraph_props(ppr)
+        direct = self._style_resolver.paragraph_props_from_map(props)
 
         # Merge: base <- direct
         return base_style.merge_with(direct)
 
     def _parse_run(self, run_elem: etree._Element) -> Run | None:
         """Parse a run element."""
-        # Get run properties
-        rpr = run_elem.find(f"{{{NS['w']}}}rPr", namespaces=NS)
-        style = self._parse_run_style(rpr)
-
         # Collect text content
         text_parts = []
 
         for child in run_elem:
-            tag = etree.QName(child).localname
-
-            if tag == "t":
+            if child.tag == W.T:
                 text_parts.append(child.text or "")
-
-            elif tag == "br":
-                br_type = child.get(f"{{{NS['w']}}}type", "")
-                if br_type == "page":
-                    text_parts.append("\n\\newpage\n")
-                else:
-                    text_parts.append("\n")
-
-            elif tag == "tab":
-                text_parts.append("\t")
-
-            elif tag == "sym":
-                # Symbol - try to get character
-                char = child.get(f"{{{NS['w']}}}char", "")
-                if char:
-                    try:
-                        text_parts.append(chr(int(char, 16)))
-                    except ValueError:
-                        text_parts.append("?")
+            else:
+                text_parts.append(_run_child_text(child))
 
         text = "".join(text_parts)
 
         if not text:
             return None
 
-        return Run(text=text, style=style)
+        # Get run properties
+        rpr = run_elem.find(W.RPR)
+        return Run(text=text, style=self._parse_run_style(rpr))
 
     def _parse_run_style(self, rpr: etree._Element | None) -> TextStyle:
-        """Parse run properties into a style."""
+        """Parse run properties into a (shared) style, keyed by their XML."""
         if rpr is None:
+            return self._run_style(None)
+
+        return self._run_styles.get(
+            etree.tostring(rpr, with_tail=False),
+            lambda: self._resolve_run_style(child_properties(rpr)),
+        )
+
+    def _run_style(self, props: PropertyMap | None) -> TextStyle:
+        """Get the (shared) run style for an rPr property map."""
+        return self._run_styles.get(property_key(props), lambda: self._resolve_run_style(props))
+
+    def _resolve_run_style(self, props: PropertyMap | None) -> TextStyle:
+        """Resolve a run style from an rPr property map."""
+        if props is None:
             return TextStyle.empty()
 
         # Get style reference
-        rstyle_elem = rpr.find(f"{{{NS['w']}}}rStyle", namespaces=NS)
-        style_id = rstyle_elem.get(f"{{{NS['w']}}}val") if rstyle_elem is not None else None
+        rstyle_attrs = props.get(W.RSTYLE)
+        style_id = rstyle_attrs.get(W.VAL) if rstyle_attrs is not None else None
 
         # Get base style from resolver
         base_style = self._style_resolver.resolve_run_style(style_id)
 
         # Parse direct formatting
-        direct = self._style_resolver._parse_run_props(rpr)
+        direct = self._style_resolver.run_props_from_map(props)
 
         # Merge: base <- direct
         return base_style.merge_with(direct)
@@ -502,45 +840,56 @@ class DocxParser:
     def _parse_hyperlink(self, hl_elem: etree._Element) -> Hyperlink | None:
         """Parse a hyperlink element."""
         # Get relationship ID or anchor
-        rel_id = hl_elem.get(f"{{{NS['r']}}}id", "")
-        anchor = hl_elem.get(f"{{{NS['w']}}}anchor", "")
-
-        url = ""
-        if rel_id and rel_id in self._relationships.get("document", {}):
-            rel = self._relationships["document"][rel_id]
-            url = rel.get("target", "")
-        elif anchor:
-            url = f"#{anchor}"
+        rel_id = hl_elem.get(R.ID, "")
+        anchor = hl_elem.get(W.ANCHOR, "")
 
         # Parse runs inside hyperlink
         runs = []
-        for run_elem in hl_elem.iter(f"{{{NS['w']}}}r"):
+        for run_elem in hl_elem.iter(W.R):
             run = self._parse_run(run_elem)
             if run:
                 runs.append(run)
 
+        return self._build_hyperlink(rel_id, anchor, runs)
+
+    def _build_hyperlink(self, rel_id: str, anchor: str, runs: list[Run]) -> Hyperlink | None:
+        """Build a hyperlink from its relationship ID or anchor and its runs."""
         if not runs:
             return None
 
+        url = ""
+        if rel_id and rel_id in self._relationships:
+            url = self._relationships[rel_id].target
+        elif anchor:
+            url = f"#{anchor}"
+
         return Hyperlink(url=url, runs=runs, bookmark=anchor if anchor else None)
 
     def _parse_math(self, math_elem: etree._Element, math_type: MathType) -> MathBlock:
-        """Parse a math element."""
-        # Store original OMML XML for conversion
-        omml_xml = etree.tostring(math_elem, encoding="unicode")
-        return MathBlock(omml_xml=omml_xml, math_type=math_type)
+        """
+        Parse a math element.
+
+        The OMML subtree itself is kept for conversion. Clearing its
+        enclosing body element once it is parsed only detaches it.
+        """
+        return MathBlock(omml=math_elem, math_type=math_type)
 
     def _parse_table(self, tbl_elem: etree._Element) -> Table:
-        """Parse a table element."""
+        """
+        Parse a table element.
+
+        Only direct children are visited at each level, so a nested
+        table is parsed once, by the cell that contains it.
+        """
         table = Table()
 
         # Parse table properties
-        tblpr = tbl_elem.find(f"{{{NS['w']}}}tblPr", namespaces=NS)
+        tblpr = tbl_elem.find(W.TBLPR)
         if tblpr is not None:
             # Alignment
-            jc_elem = tblpr.find(f"{{{NS['w']}}}jc", namespaces=NS)
+            jc_elem = tblpr.find(W.JC)
             if jc_elem is not None:
-                jc_val = jc_elem.get(f"{{{NS['w']}}}val", "")
+                jc_val = jc_elem.get(W.VAL, "")
                 table.alignment = {
                     "left": Alignment.LEFT,
                     "center": Alignment.CENTER,
@@ -548,27 +897,21 @@ class DocxParser:
                 }.get(jc_val, Alignment.CENTER)
 
         # Parse table grid (column widths)
-        tblgrid = tbl_elem.find(f"{{{NS['w']}}}tblGrid", namespaces=NS)
+        tblgrid = tbl_elem.find(W.TBLGRID)
         if tblgrid is not None:
-            for gridcol in tblgrid.iter(f"{{{NS['w']}}}gridCol"):
-                width = gridcol.get(f"{{{NS['w']}}}w", "0")
+            for gridcol in tblgrid.iterchildren(W.GRIDCOL):
+                width = gridcol.get(W.W, "0")
                 try:
                     table.column_widths.append(Dimension.from_twips(int(width)))
                 except ValueError:
                     pass
 
         # Parse rows
-        for tr_elem in tbl_elem.iter(f"{{{NS['w']}}}tr"):
+        for tr_elem in iter_content(tbl_elem, W.TR):
             row = self._parse_table_row(tr_elem)
             table.rows.append(row)
-
-            # Check if this is a header row
-            trpr = tr_elem.find(f"{{{NS['w']}}}trPr", namespaces=NS)
-            if trpr is not None:
-                tblheader = trpr.find(f"{{{NS['w']}}}tblHeader", namespaces=NS)
-                if tblheader is not None:
-                    row.is_header = True
-                    table.has_header_row = True
+            if row.is_header:
+                table.has_header_row = True
 
         return table
 
@@ -577,19 +920,23 @@ class DocxParser:
         row = TableRow()
 
         # Parse row properties
-        trpr = tr_elem.find(f"{{{NS['w']}}}trPr", namespaces=NS)
+        trpr = tr_elem.find(W.TRPR)
         if trpr is not None:
             # Height
-            trheight = trpr.find(f"{{{NS['w']}}}trHeight", namespaces=NS)
+            trheight = trpr.find(W.TRHEIGHT)
             if trheight is not None:
-                height = trheight.get(f"{{{NS['w']}}}val", "0")
+                height = trheight.get(W.VAL, "0")
                 try:
                     row.height = Dimension.from_twips(int(height))
                 except ValueError:
                     pass
 
+            # Repeated header row
+            if trpr.find(W.TBLHEADER) is not None:
+                row.is_header = True
+
         # Parse cells
-        for tc_elem in tr_elem.iter(f"{{{NS['w']}}}tc"):
+        for tc_elem in iter_content(tr_elem, W.TC):
             cell = self._parse_table_cell(tc_elem)
             row.cells.append(cell)
 
@@ -600,147 +947,90 @@ class DocxParser:
         cell = TableCell()
 
         # Parse cell properties
-        tcpr = tc_elem.find(f"{{{NS['w']}}}tcPr", namespaces=NS)
+        tcpr = tc_elem.find(W.TCPR)
         if tcpr is not None:
             # Width
-            tcw = tcpr.find(f"{{{NS['w']}}}tcW", namespaces=NS)
+            tcw = tcpr.find(W.TCW)
             if tcw is not None:
-                width = tcw.get(f"{{{NS['w']}}}w", "0")
+                width = tcw.get(W.W, "0")
                 try:
                     cell.width = Dimension.from_twips(int(width))
                 except ValueError:
                     pass
 
             # Grid span (horizontal merge)
-            gridspan = tcpr.find(f"{{{NS['w']}}}gridSpan", namespaces=NS)
+            gridspan = tcpr.find(W.GRIDSPAN)
             if gridspan is not None:
                 try:
-                    cell.col_span = int(gridspan.get(f"{{{NS['w']}}}val", "1"))
+                    cell.col_span = int(gridspan.get(W.VAL, "1"))
                 except ValueError:
                     pass
 
             # Vertical merge
-            vmerge = tcpr.find(f"{{{NS['w']}}}vMerge", namespaces=NS)
+            vmerge = tcpr.find(W.VMERGE)
             if vmerge is not None:
-                merge_val = vmerge.get(f"{{{NS['w']}}}val", "continue")
+                merge_val = vmerge.get(W.VAL, "continue")
                 if merge_val == "restart":
                     cell.row_span = 1  # Will be updated later
                 # "continue" means this cell is merged with above
 
             # Vertical alignment
-            valign = tcpr.find(f"{{{NS['w']}}}vAlign", namespaces=NS)
+            valign = tcpr.find(W.VALIGN)
             if valign is not None:
-                cell.vertical_alignment = valign.get(f"{{{NS['w']}}}val", "top")
+                cell.vertical_alignment = valign.get(W.VAL, "top")
 
-        # Parse paragraphs in cell
-        for p_elem in tc_elem.iter(f"{{{NS['w']}}}p"):
-            para = self._parse_paragraph(p_elem)
-            cell.paragraphs.append(para)
+        # Parse cell content: paragraphs and nested tables
+        for child in iter_content(tc_elem, W.P, W.TBL):
+            if child.tag == W.P:
+                cell.content.append(self._parse_paragraph(child))
+            else:
+                cell.content.append(self._parse_table(child))
 
         return cell
 
     def _parse_section_props(self, sectpr: etree._Element) -> PageLayout:
         """Parse section properties."""
-        # Page size
-        width = None
-        height = None
-        pgsz = sectpr.find(f"{{{NS['w']}}}pgSz", namespaces=NS)
-        if pgsz is not None:
-            w = pgsz.get(f"{{{NS['w']}}}w")
-            h = pgsz.get(f"{{{NS['w']}}}h")
-            if w:
-                try:
-                    width = int(w)
-                except ValueError:
-                    pass
-            if h:
-                try:
-                    height = int(h)
-                except ValueError:
-                    pass
-
-        # Page margins
-        margin_top = None
-        margin_bottom = None
-        margin_left = None
-        margin_right = None
-        header = None
-        footer = None
-        gutter = None
-
-        pgmar = sectpr.find(f"{{{NS['w']}}}pgMar", namespaces=NS)
-        if pgmar is not None:
-            for attr, var_name in [
-                ("top", "margin_top"),
-                ("bottom", "margin_bottom"),
-                ("left", "margin_left"),
-                ("right", "margin_right"),
-                ("header", "header"),
-                ("footer", "footer"),
-                ("gutter", "gutter"),
-            ]:
-                val = pgmar.get(f"{{{NS['w']}}}{attr}")
-                if val:
-                    try:
-                        locals()[var_name] = int(val)
-                    except ValueError:
-                        pass
-
-        return PageLayout.from_docx_section(
-            width_twips=width,
-            height_twips=height,
-            margin_top_twips=margin_top,
-            margin_bottom_twips=margin_bottom,
-            margin_left_twips=margin_left,
-            margin_right_twips=margin_right,
-            header_twips=header,
-            footer_twips=footer,
-            gutter_twips=gutter,
-        )
+        return read_section_layout(sectpr)
 
     def _load_images(self, document: Document) -> None:
-        """Load embedded images from the DOCX package."""
-        if not self._relationships.get("document"):
-            return
-
-        for rel_id, rel_info in self._relationships["document"].items():
-            rel_type = rel_info.get("type", "")
-            target = rel_info.get("target", "")
-
+        """Register embedded images from the DOCX package."""
+        for rel_id, rel in self._relationships.items():
             # Check if this is an image relationship
-            if "image" not in rel_type.lower():
+            if "image" not in rel.type.lower() or rel.part_name is None:
                 continue
 
-            # Resolve target path
-            if target.startswith("/"):
-                image_path = target[1:]
-            else:
-                image_path = f"word/{target}"
-
-            if image_path not in self._zipfile.namelist():
+            info = self._package.get_info(rel.part_name)
+            if info is None:
                 continue
 
             try:
-                image_data = self._zipfile.read(image_path)
-                filename = Path(target).name
+                filename = Path(rel.target).name
 
                 # Determine content type
-                content_type = "image/png"  # Default
-                if filename.lower().endswith(".jpg") or filename.lower().endswith(".jpeg"):
-                    content_type = "image/jpeg"
-                elif filename.lower().endswith(".gif"):
-                    content_type = "image/gif"
-                elif filename.lower().endswith(".svg"):
-                    content_type = "image/svg+xml"
+                content_type = self._package.content_type(rel.part_name) or "image/png"
+                if not content_type.startswith("image/"):
+                    content_type = "image/png"  # Default
+                    if filename.lower().endswith(".jpg") or filename.lower().endswith(".jpeg"):
+                        content_type = "image/jpeg"
+                    elif filename.lower().endswith(".gif"):
+                        content_type = "image/gif"
+                    elif filename.lower().endswith(".svg"):
+                        content_type = "image/svg+xml"
 
                 image = Image(
                     rel_id=rel_id,
                     filename=filename,
                     content_type=content_type,
-                    data=image_data,
+                    source=PartRef(
+                        package=self._source.package,
+                        member=info.filename,
+                        size=info.file_size,
+                        crc=info.CRC,
+                        archive=self._source,
+                    ),
                 )
 
                 document.register_image(rel_id, image)
 
             except Exception as e:
-                logger.warning(f"Failed to load image {target}: {e}")
+                logger.warning(f"Failed to load image {rel.target}: {e}")
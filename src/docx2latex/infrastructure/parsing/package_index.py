@@ -0,0 +1,299 @@
+"""
+OPC package index for DOCX archives.
+
+Provides constant-time part lookup, content types, the relationships
+graph and a bounded cache of lazily parsed XML parts.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING
+
+from lxml import etree
+
+from docx2latex.infrastructure.parsing.xml_namespaces import NS
+
+if TYPE_CHECKING:
+    import zipfile
+    from collections.abc import Iterable
+    from concurrent.futures import Executor
+
+# Default number of parsed part trees kept in memory
+DEFAULT_TREE_CACHE_SIZE = 8
+
+# Fallback location of the main document part
+DEFAULT_MAIN_DOCUMENT_PART = "word/document.xml"
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+
+@dataclass(frozen=True, slots=True)
+class Relationship:
+    """A single relationship from a .rels part."""
+
+    id: str
+    type: str
+    target: str  # Raw Target attribute (URL for external relationships)
+    part_name: str | None = None  # Resolved part name for internal targets
+
+    @property
+    def is_external(self) -> bool:
+        return self.part_name is None
+
+    @property
+    def type_name(self) -> str:
+        """Last segment of the relationship type URI (e.g. "styles")."""
+        return self.type.rsplit("/", 1)[-1]
+
+
+class PackageIndex:
+    """
+    Index over the parts of an open DOCX (OPC) package.
+
+    The index is built from the ZIP central directory, so part lookup
+    is a dict hit instead of a scan of ``namelist()``. Content types and
+    relationships are read once, on first use. XML parts are parsed
+    only when requested and kept in a small LRU cache, so parts that
+    nothing asks for (footnotes, headers, comments, ...) cost nothing.
+
+    Parts can be read and parsed from several threads at once (see
+    prefetch); the tree cache is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        max_cached_trees: int = DEFAULT_TREE_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            archive: Open DOCX archive (owned by the caller)
+            max_cached_trees: Maximum number of parsed parts kept in memory
+        """
+        self._archive = archive
+        self._members: dict[str, zipfile.ZipInfo] = {}
+        self._folded: dict[str, str] = {}  # Part names are case-insensitive in OPC
+        for info in archive.infolist():
+            self._members[info.filename] = info
+            self._folded.setdefault(info.filename.casefold(), info.filename)
+
+        self._max_cached_trees = max_cached_trees
+        self._trees: OrderedDict[str, etree._Element] = OrderedDict()
+        self._trees_lock = threading.Lock()
+        self._relationships: dict[str, dict[str, Relationship]] = {}
+        self._content_types: tuple[dict[str, str], dict[str, str]] | None = None
+
+    # Central directory
+
+    def _normalize(self, part_name: str) -> str | None:
+        """Map a part name to the archive member name, if present."""
+        name = part_name.lstrip("/")
+        if name in self._members:
+            return name
+        return self._folded.get(name.casefold())
+
+    def has_part(self, part_name: str) -> bool:
+        """Check if the package contains a part."""
+        return self._normalize(part_name) is not None
+
+    def get_info(self, part_name: str) -> zipfile.ZipInfo | None:
+        """Get the central directory entry of a part."""
+        name = self._normalize(part_name)
+        return self._members[name] if name is not None else None
+
+    def open(self, part_name: str) -> IO[bytes]:
+        """
+        Open a part for streaming reads.
+
+        Raises:
+            KeyError: If the part does not exist
+        """
+        name = self._normalize(part_name)
+        if name is None:
+            raise KeyError(part_name)
+        return self._archive.open(self._members[name])
+
+    def read(self, part_name: str) -> bytes:
+        """
+        Read the decompressed content of a part.
+
+        Raises:
+            KeyError: If the part does not exist
+        """
+        name = self._normalize(part_name)
+        if name is None:
+            raise KeyError(part_name)
+        return self._archive.read(self._members[name])
+
+    # Parsed parts
+
+    def tree(self, part_name: str) -> etree._Element | None:
+        """
+        Get the parsed root element of an XML part.
+
+        Parts are parsed on first access, streamed from the archive,
+        and cached (LRU-bounded).
+
+        Returns:
+            Root element, or None if the part does not exist
+        """
+        return self._tree(part_name, in_memory=False)
+
+    def _tree(self, part_name: str, in_memory: bool) -> etree._Element | None:
+        """Get the parsed root element of an XML part, reading it whole if in_memory."""
+        name = self._normalize(part_name)
+        if name is None:
+            return None
+
+        with self._trees_lock:
+            root = self._trees.get(name)
+            if root is not None:
+                self._trees.move_to_end(name)
+                return root
+
+        # Parse outside the lock. lxml releases the GIL when parsing from
+        # memory, which lets prefetched parts parse concurrently
+        if in_memory:
+            root = etree.fromstring(self._archive.read(self._members[name]))
+        else:
+            with self._archive.open(self._members[name]) as stream:
+                root = etree.parse(stream).getroot()
+
+        with self._trees_lock:
+            root = self._trees.setdefault(name, root)
+            while len(self._trees) > self._max_cached_trees:
+                self._trees.popitem(last=False)
+        return root
+
+    def prefetch(self, part_names: Iterable[str], executor: Executor) -> None:
+        """
+        Parse several XML parts concurrently into the tree cache.
+
+        Decompression and parsing of each part run on the executor;
+        the call returns once every part is parsed. Parts are read whole
+        into memory to be parsed in parallel, so prefetch only small
+        parts (styles, numbering, properties). Missing parts are
+        skipped. Parts beyond the cache size are evicted as usual, so
+        prefetch at most as many parts as the cache holds.
+
+        Args:
+            part_names: Parts to parse
+            executor: Executor running the parses (typically a thread pool)
+        """
+        futures = [
+            executor.submit(self._tree, name, True) for name in part_names if self.has_part(name)
+        ]
+        for future in futures:
+            future.result()
+
+    # Content types
+
+    def content_type(self, part_name: str) -> str | None:
+        """Get the declared content type of a part."""
+        if self._content_types is None:
+            self._content_types = self._load_content_types()
+        defaults, overrides = self._content_types
+
+        name = self._normalize(part_name) or part_name.lstrip("/")
+        override = overrides.get(f"/{name}".casefold())
+        if override:
+            return override
+
+        _, ext = posixpath.splitext(name)
+        return defaults.get(ext[1:].lower())
+
+    def _load_content_types(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Read [Content_Types].xml (without caching its tree)."""
+        defaults: dict[str, str] = {}
+        overrides: dict[str, str] = {}
+
+        name = self._normalize(CONTENT_TYPES_PART)
+        if name is None:
+            return defaults, overrides
+
+        with self._archive.open(self._members[name]) as stream:
+            root = etree.parse(stream).getroot()
+
+        for elem in root.iter(f"{{{NS['ct']}}}Default"):
+            defaults[elem.get("Extension", "").lower()] = elem.get("ContentType", "")
+        for elem in root.iter(f"{{{NS['ct']}}}Override"):
+            overrides[elem.get("PartName", "").casefold()] = elem.get("ContentType", "")
+
+        return defaults, overrides
+
+    # Relationships
+
+    def relationships(self, source_part: str = "") -> dict[str, Relationship]:
+        """
+        Get the relationships of a part, keyed by relationship ID.
+
+        Args:
+            source_part: Source part name, or "" for package relationships
+
+        Returns:
+            Relationships of the part (empty if it has none)
+        """
+        source = source_part.lstrip("/")
+        rels = self._relationships.get(source)
+        if rels is not None:
+            return rels
+
+        directory, filename = posixpath.split(source)
+        rels_part = posixpath.join(directory, "_rels", f"{filename}.rels")
+
+        rels = {}
+        name = self._normalize(rels_part)
+        if name is not None:
+            with self._archive.open(self._members[name]) as stream:
+                root = etree.parse(stream).getroot()
+
+            for rel in root.iter(f"{{{NS['pr']}}}Relationship"):
+                rel_id = rel.get("Id", "")
+                target = rel.get("Target", "")
+                part_name = None
+                if rel.get("TargetMode") != "External":
+                    part_name = self.resolve_target(source, target)
+                rels[rel_id] = Relationship(
+                    id=rel_id,
+                    type=rel.get("Type", ""),
+                    target=target,
+                    part_name=part_name,
+                )
+
+        self._relationships[source] = rels
+        return rels
+
+    def related_part(self, source_part: str, type_name: str) -> str | None:
+        """
+        Find the first internal part related to a source part by type.
+
+        Args:
+            source_part: Source part name, or "" for the package
+            type_name: Last segment of the relationship type (e.g. "styles")
+
+        Returns:
+            Target part name, or None
+        """
+        for rel in self.relationships(source_part).values():
+            if rel.part_name is not None and rel.type_name == type_name:
+                return rel.part_name
+        return None
+
+    @property
+    def main_document_part(self) -> str:
+        """Name of the main document part."""
+        return self.related_part("", "officeDocument") or DEFAULT_MAIN_DOCUMENT_PART
+
+    @staticmethod
+    def resolve_target(source_part: str, target: str) -> str:
+        """Resolve a relationship target relative to its source part."""
+        if target.startswith("/"):
+            return posixpath.normpath(target[1:])
+        base = posixpath.dirname(source_part.lstrip("/"))
+        return posixpath.normpath(posixpath.join(base, target))
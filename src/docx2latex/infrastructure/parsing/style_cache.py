@@ -0,0 +1,82 @@
+"""
+Flyweight cache for run and paragraph styles.
+
+Real documents reuse a few dozen distinct rPr/pPr blocks across many
+thousands of runs and paragraphs. Resolving each block once and sharing
+the resulting immutable style keeps both parse time and the number of
+live style objects proportional to the distinct formatting, not to the
+size of the document.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from docx2latex.infrastructure.parsing.style_resolver import PropertyMap
+
+S = TypeVar("S", bound=Hashable)
+
+
+def property_key(props: PropertyMap | None) -> Hashable:
+    """
+    Build a canonical, hashable key for a property map.
+
+    Two properties elements with the same children and attributes (in
+    the same order) get the same key. The style reference (pStyle or
+    rStyle) is one of the children, so it is part of the key.
+
+    Args:
+        props: Property map of a pPr/rPr element, or None if absent
+
+    Returns:
+        Cache key
+    """
+    if props is None:
+        return None
+    return tuple((tag, tuple(attrs.items())) for tag, attrs in props.items())
+
+
+class StyleCache(Generic[S]):
+    """
+    Interning cache of resolved styles.
+
+    Styles are cached by the canonical key of the properties element
+    they were resolved from. Resolved values are interned as well, so
+    different elements that resolve to equal styles share one instance.
+    A cache belongs to a single parse session: resolved styles depend on
+    that document's styles part.
+    """
+
+    def __init__(self) -> None:
+        self._by_key: dict[Hashable, S] = {}
+        self._interned: dict[S, S] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, resolve: Callable[[], S]) -> S:
+        """
+        Get the style for a key, resolving it on first use.
+
+        Args:
+            key: Canonical key of the properties element
+            resolve: Computes the style on a cache miss
+
+        Returns:
+            Shared style instance
+        """
+        style = self._by_key.get(key)
+        if style is not None:
+            self.hits += 1
+            return style
+
+        self.misses += 1
+        style = resolve()
+        style = self._interned.setdefault(style, style)
+        self._by_key[key] = style
+        return style
+
+    def __len__(self) -> int:
+        """Number of distinct style instances."""
+        return len(self._interned)
@@ -6,8 +6,9 @@ Handles style inheritance and resolution from styles.xml.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final, cast
 
 from lxml import etree
 
@@ -20,7 +21,58 @@ from docx2latex.domain.value_objects.style import (
     TextStyle,
     UnderlineStyle,
 )
-from docx2latex.infrastructure.parsing.xml_namespaces import NS, W
+from docx2latex.infrastructure.parsing.xml_namespaces import W
+
+# Attributes of property children (pPr/rPr/numPr), keyed by child tag
+PropertyMap = Mapping[str, Mapping[str, str]]
+
+PARAGRAPH_ALIGNMENTS: Final[dict[str, Alignment]] = {
+    "left": Alignment.LEFT,
+    "start": Alignment.LEFT,
+    "center": Alignment.CENTER,
+    "right": Alignment.RIGHT,
+    "end": Alignment.RIGHT,
+    "both": Alignment.JUSTIFY,
+    "distribute": Alignment.JUSTIFY,
+}
+
+# Highlight names mapped to colors
+HIGHLIGHT_COLORS: Final[dict[str, Color]] = {
+    "yellow": Color(255, 255, 0),
+    "green": Color(0, 255, 0),
+    "cyan": Color(0, 255, 255),
+    "magenta": Color(255, 0, 255),
+    "blue": Color(0, 0, 255),
+    "red": Color(255, 0, 0),
+    "darkBlue": Color(0, 0, 139),
+    "darkCyan": Color(0, 139, 139),
+    "darkGreen": Color(0, 100, 0),
+    "darkMagenta": Color(139, 0, 139),
+    "darkRed": Color(139, 0, 0),
+    "darkYellow": Color(128, 128, 0),
+    "darkGray": Color(169, 169, 169),
+    "lightGray": Color(211, 211, 211),
+    "black": Color(0, 0, 0),
+}
+
+
+def child_properties(elem: etree._Element) -> dict[str, Mapping[str, str]]:
+    """
+    Map the tag of each direct child of a properties element to its attributes.
+
+    Only the first child with a given tag is kept, as with ``find``.
+
+    Args:
+        elem: A properties element (pPr, rPr, numPr, ...)
+
+    Returns:
+        Property map of the element
+    """
+    props: dict[str, Mapping[str, str]] = {}
+    for child in elem:
+        # Parsed from text, so names and values are str (the stubs also allow bytes)
+        props.setdefault(child.tag, cast("Mapping[str, str]", child.attrib))
+    return props
 
 
 @dataclass
@@ -47,13 +99,21 @@ class StyleResolver:
 
     Handles style inheritance (basedOn relationships) and
     provides resolved styles for paragraphs and runs.
+
+    The whole basedOn graph is resolved once, when styles are loaded:
+    every style gets its properties merged over its ancestors' and the
+    document defaults (docDefaults), along with its outline level and
+    heading flag. Lookups during body parsing are then dict hits.
     """
 
     def __init__(self) -> None:
         self._styles: dict[str, StyleDefinition] = {}
         self._default_paragraph_style: StyleDefinition | None = None
         self._default_character_style: StyleDefinition | None = None
-        self._resolved_cache: dict[str, StyleDefinition] = {}
+        self._default_paragraph_props = ParagraphStyle.empty()
+        self._default_run_props = TextStyle.empty()
+        self._resolved: dict[str, StyleDefinition] = {}
+        self._heading_styles: set[str] = set()
 
     def load_from_xml(self, styles_xml: bytes) -> None:
         """
@@ -65,52 +125,61 @@ class StyleResolver:
         root = etree.fromstring(styles_xml)
         self._parse_styles(root)
 
+    def load_from_tree(self, root: etree._Element) -> None:
+        """
+        Load styles from an already parsed styles.xml root element.
+
+        Args:
+            root: The w:styles root element
+        """
+        self._parse_styles(root)
+
     def _parse_styles(self, root: etree._Element) -> None:
-        """Parse all style elements."""
-        # Find all w:style elements
-        for style_elem in root.findall(f".//{W.P}/../w:style", namespaces=NS):
-            self._parse_style_element(style_elem)
+        """Parse document defaults and all style elements, then resolve them."""
+        for elem in root.iter(W.STYLE, W.DOCDEFAULTS):
+            if elem.tag == W.DOCDEFAULTS:
+                self._parse_doc_defaults(elem)
+            elif elem.get(W.STYLEID) not in self._styles:
+                self._parse_style_element(elem)
 
-        # Alternative path for styles
-        for style_elem in root.iter(f"{{{NS['w']}}}style"):
-            if style_elem.get(f"{{{NS['w']}}}styleId") not in self._styles:
-                self._parse_style_element(style_elem)
+        self._resolve_styles()
+
+    def _parse_doc_defaults(self, elem: etree._Element) -> None:
+        """Parse the default paragraph and run properties of the document."""
+        ppr = elem.find(f"{W.PPRDEFAULT}/{W.PPR}")
+        if ppr is not None:
+            self._default_paragraph_props = self._parse_paragraph_props(ppr)
+
+        rpr = elem.find(f"{W.RPRDEFAULT}/{W.RPR}")
+        if rpr is not None:
+            self._default_run_props = self._parse_run_props(rpr)
 
     def _parse_style_element(self, elem: etree._Element) -> None:
         """Parse a single style element."""
-        style_id = elem.get(f"{{{NS['w']}}}styleId", "")
+        style_id = elem.get(W.STYLEID, "")
         if not style_id:
             return
 
-        style_type = elem.get(f"{{{NS['w']}}}type", "paragraph")
-        is_default = elem.get(f"{{{NS['w']}}}default") == "1"
+        style_type = elem.get(W.TYPE, "paragraph")
+        is_default = elem.get(W.DEFAULT) == "1"
+        props = child_properties(elem)
 
         # Get style name
-        name_elem = elem.find(f"{{{NS['w']}}}name", namespaces=NS)
-        name = name_elem.get(f"{{{NS['w']}}}val", style_id) if name_elem is not None else style_id
+        name_attrs = props.get(W.NAME)
+        name = name_attrs.get(W.VAL, style_id) if name_attrs is not None else style_id
 
         # Get basedOn
-        based_on_elem = elem.find(f"{{{NS['w']}}}basedOn", namespaces=NS)
-        based_on = based_on_elem.get(f"{{{NS['w']}}}val") if based_on_elem is not None else None
+        based_on_attrs = props.get(W.BASEDON)
+        based_on = based_on_attrs.get(W.VAL) if based_on_attrs is not None else None
 
-        # Parse paragraph properties
-        ppr_elem = elem.find(f"{{{NS['w']}}}pPr", namespaces=NS)
+        # Parse paragraph properties (including the outline level of headings)
+        ppr_elem = elem.find(W.PPR)
         paragraph_props = self._parse_paragraph_props(ppr_elem) if ppr_elem is not None else ParagraphStyle.empty()
 
         # Parse run properties
-        rpr_elem = elem.find(f"{{{NS['w']}}}rPr", namespaces=NS)
+        rpr_elem = elem.find(W.RPR)
         run_props = self._parse_run_props(rpr_elem) if rpr_elem is not None else TextStyle.empty()
 
-        # Get outline level (for headings)
-        outline_level = None
-        if ppr_elem is not None:
-            outline_elem = ppr_elem.find(f"{{{NS['w']}}}outlineLvl", namespaces=NS)
-            if outline_elem is not None:
-                try:
-                    outline_level = int(outline_elem.get(f"{{{NS['w']}}}val", "0"))
-                except ValueError:
-                    pass
-
         style_def = StyleDefinition(
             style_id=style_id,
             name=name,
@@ -119,7 +188,7 @@ class StyleResolver:
             paragraph_props=paragraph_props,
             run_props=run_props,
             is_default=is_default,
-            outline_level=outline_level,
+            outline_level=paragraph_props.outline_level,
         )
 
         self._styles[style_id] = style_def
@@ -130,39 +199,104 @@ class StyleResolver:
             elif style_type == "character":
                 self._default_character_style = style_def
 
+    def _resolve_styles(self) -> None:
+        """
+        Resolve every style against its basedOn ancestors.
+
+        Styles are resolved in topological order (ancestors first), so
+        each one costs a single merge over its already resolved parent.
+        A basedOn cycle is cut where the walk first meets it.
+        """
+        base = StyleDefinition(
+            style_id="",
+            name="",
+            style_type="",
+            paragraph_props=self._default_paragraph_props,
+            run_props=self._default_run_props,
+        )
+        resolved: dict[str, StyleDefinition] = {}
+
+        for style_def in self._styles.values():
+            # Walk up to the nearest resolved ancestor
+            pending: list[StyleDefinition] = []
+            visiting: set[str] = set()
+            current: StyleDefinition | None = style_def
+            while (
+                current is not None
+                and current.style_id not in resolved
+                and current.style_id not in visiting
+            ):
+                pending.append(current)
+                visiting.add(current.style_id)
+                current = self._styles.get(current.based_on) if current.based_on else None
+
+            parent = resolved.get(current.style_id, base) if current is not None else base
+
+            # Resolve from the oldest ancestor down
+            for pending_def in reversed(pending):
+                parent = self._merge_style(parent, pending_def)
+                resolved[pending_def.style_id] = parent
+
+        self._resolved = resolved
+        self._heading_styles = {
+            style_id
+            for style_id, style_def in resolved.items()
+            if style_def.outline_level is not None
+            or "heading" in style_def.name.lower()
+            or "titre" in style_def.name.lower()
+        }
+
+    @staticmethod
+    def _merge_style(parent: StyleDefinition, style_def: StyleDefinition) -> StyleDefinition:
+        """Merge a style over its resolved parent."""
+        paragraph_props = parent.paragraph_props.merge_with(style_def.paragraph_props)
+        return StyleDefinition(
+            style_id=style_def.style_id,
+            name=style_def.name,
+            style_type=style_def.style_type,
+            based_on=style_def.based_on,
+            paragraph_props=paragraph_props,
+            run_props=parent.run_props.merge_with(style_def.run_props),
+            is_default=style_def.is_default,
+            outline_level=paragraph_props.outline_level,
+        )
+
     def _parse_paragraph_props(self, ppr: etree._Element) -> ParagraphStyle:
         """Parse paragraph properties element."""
+        return self.paragraph_props_from_map(child_properties(ppr))
+
+    def paragraph_props_from_map(self, props: PropertyMap) -> ParagraphStyle:
+        """
+        Build paragraph properties from a pPr property map.
+
+        Args:
+            props: Attributes of the pPr children, keyed by tag
+
+        Returns:
+            Direct paragraph formatting
+        """
         # Alignment
         alignment = Alignment.JUSTIFY
-        jc_elem = ppr.find(f"{{{NS['w']}}}jc", namespaces=NS)
-        if jc_elem is not None:
-            jc_val = jc_elem.get(f"{{{NS['w']}}}val", "")
-            alignment = {
-                "left": Alignment.LEFT,
-                "start": Alignment.LEFT,
-                "center": Alignment.CENTER,
-                "right": Alignment.RIGHT,
-                "end": Alignment.RIGHT,
-                "both": Alignment.JUSTIFY,
-                "distribute": Alignment.JUSTIFY,
-            }.get(jc_val, Alignment.JUSTIFY)
+        jc_attrs = props.get(W.JC)
+        if jc_attrs is not None:
+            alignment = PARAGRAPH_ALIGNMENTS.get(jc_attrs.get(W.VAL, ""), Alignment.JUSTIFY)
 
         # Spacing
         space_before = None
         space_after = None
         line_spacing = None
-        spacing_elem = ppr.find(f"{{{NS['w']}}}spacing", namespaces=NS)
-        if spacing_elem is not None:
-            before = spacing_elem.get(f"{{{NS['w']}}}before")
+        spacing_attrs = props.get(W.SPACING)
+        if spacing_attrs is not None:
+            before = spacing_attrs.get(W.BEFORE)
             if before:
                 space_before = Dimension.from_twips(int(before))
 
-            after = spacing_elem.get(f"{{{NS['w']}}}after")
+            after = spacing_attrs.get(W.AFTER)
             if after:
                 space_after = Dimension.from_twips(int(after))
 
-            line = spacing_elem.get(f"{{{NS['w']}}}line")
-            line_rule = spacing_elem.get(f"{{{NS['w']}}}lineRule", "auto")
+            line = spacing_attrs.get(W.LINE)
+            line_rule = spacing_attrs.get(W.LINE_RULE, "auto")
             if line and line_rule == "auto":
                 # Line spacing as multiple (240 = single)
                 line_spacing = int(line) / 240.0
@@ -171,39 +305,39 @@ class StyleResolver:
         first_line_indent = None
         left_indent = None
         right_indent = None
-        ind_elem = ppr.find(f"{{{NS['w']}}}ind", namespaces=NS)
-        if ind_elem is not None:
-            first_line = ind_elem.get(f"{{{NS['w']}}}firstLine")
+        ind_attrs = props.get(W.IND)
+        if ind_attrs is not None:
+            first_line = ind_attrs.get(W.FIRST_LINE)
             if first_line:
                 first_line_indent = Dimension.from_twips(int(first_line))
 
-            hanging = ind_elem.get(f"{{{NS['w']}}}hanging")
+            hanging = ind_attrs.get(W.HANGING)
             if hanging:
                 # Hanging indent is negative first-line indent
                 first_line_indent = Dimension.from_twips(-int(hanging))
 
-            left = ind_elem.get(f"{{{NS['w']}}}left") or ind_elem.get(f"{{{NS['w']}}}start")
+            left = ind_attrs.get(W.LEFT) or ind_attrs.get(W.START)
             if left:
                 left_indent = Dimension.from_twips(int(left))
 
-            right = ind_elem.get(f"{{{NS['w']}}}right") or ind_elem.get(f"{{{NS['w']}}}end")
+            right = ind_attrs.get(W.RIGHT) or ind_attrs.get(W.END)
             if right:
                 right_indent = Dimension.from_twips(int(right))
 
         # Outline level
         outline_level = None
-        outline_elem = ppr.find(f"{{{NS['w']}}}outlineLvl", namespaces=NS)
-        if outline_elem is not None:
+        outline_attrs = props.get(W.OUTLINE_LVL)
+        if outline_attrs is not None:
             try:
-                outline_level = int(outline_elem.get(f"{{{NS['w']}}}val", "0"))
+                outline_level = int(outline_attrs.get(W.VAL, "0"))
             except ValueError:
                 pass
 
         # Style reference
         style_name = None
-        pstyle_elem = ppr.find(f"{{{NS['w']}}}pStyle", namespaces=NS)
-        if pstyle_elem is not None:
-            style_name = pstyle_elem.get(f"{{{NS['w']}}}val")
+        pstyle_attrs = props.get(W.PSTYLE)
+        if pstyle_attrs is not None:
+            style_name = pstyle_attrs.get(W.VAL)
 
         return ParagraphStyle(
             alignment=alignment,
@@ -219,96 +353,76 @@ class StyleResolver:
 
     def _parse_run_props(self, rpr: etree._Element) -> TextStyle:
         """Parse run (character) properties element."""
-        # Bold
-        bold = rpr.find(f"{{{NS['w']}}}b", namespaces=NS) is not None
-        if bold:
-            # Check if explicitly turned off
-            b_elem = rpr.find(f"{{{NS['w']}}}b", namespaces=NS)
-            if b_elem is not None and b_elem.get(f"{{{NS['w']}}}val") == "0":
-                bold = False
-
-        # Italic
-        italic = rpr.find(f"{{{NS['w']}}}i", namespaces=NS) is not None
-        if italic:
-            i_elem = rpr.find(f"{{{NS['w']}}}i", namespaces=NS)
-            if i_elem is not None and i_elem.get(f"{{{NS['w']}}}val") == "0":
-                italic = False
+        return self.run_props_from_map(child_properties(rpr))
+
+    def run_props_from_map(self, props: PropertyMap) -> TextStyle:
+        """
+        Build run properties from an rPr property map.
+
+        Args:
+            props: Attributes of the rPr children, keyed by tag
+
+        Returns:
+            Direct character formatting
+        """
+        # Bold / Italic (unless explicitly turned off)
+        b_attrs = props.get(W.B)
+        bold = b_attrs is not None and b_attrs.get(W.VAL) != "0"
+
+        i_attrs = props.get(W.I)
+        italic = i_attrs is not None and i_attrs.get(W.VAL) != "0"
 
         # Underline
         underline = UnderlineStyle.NONE
-        u_elem = rpr.find(f"{{{NS['w']}}}u", namespaces=NS)
-        if u_elem is not None:
-            u_val = u_elem.get(f"{{{NS['w']}}}val", "single")
-            underline = UnderlineStyle.from_docx(u_val)
+        u_attrs = props.get(W.U)
+        if u_attrs is not None:
+            underline = UnderlineStyle.from_docx(u_attrs.get(W.VAL, "single"))
 
         # Strike
-        strike = rpr.find(f"{{{NS['w']}}}strike", namespaces=NS) is not None
-        dstrike = rpr.find(f"{{{NS['w']}}}dstrike", namespaces=NS) is not None
-        strike = strike or dstrike
+        strike = W.STRIKE in props or W.DSTRIKE in props
 
         # Vertical alignment (superscript/subscript)
         superscript = False
         subscript = False
-        vert_elem = rpr.find(f"{{{NS['w']}}}vertAlign", namespaces=NS)
-        if vert_elem is not None:
-            vert_val = vert_elem.get(f"{{{NS['w']}}}val", "")
+        vert_attrs = props.get(W.VERTALING)
+        if vert_attrs is not None:
+            vert_val = vert_attrs.get(W.VAL, "")
             superscript = vert_val == "superscript"
             subscript = vert_val == "subscript"
 
         # Small caps / All caps
-        small_caps = rpr.find(f"{{{NS['w']}}}smallCaps", namespaces=NS) is not None
-        all_caps = rpr.find(f"{{{NS['w']}}}caps", namespaces=NS) is not None
+        small_caps = W.SMALLCAPS in props
+        all_caps = W.CAPS in props
 
         # Color
         color = None
-        color_elem = rpr.find(f"{{{NS['w']}}}color", namespaces=NS)
-        if color_elem is not None:
-            color_val = color_elem.get(f"{{{NS['w']}}}val")
-            color = Color.from_docx_color(color_val)
+        color_attrs = props.get(W.COLOR)
+        if color_attrs is not None:
+            color = Color.from_docx_color(color_attrs.get(W.VAL))
 
         # Highlight
         highlight = None
-        hl_elem = rpr.find(f"{{{NS['w']}}}highlight", namespaces=NS)
-        if hl_elem is not None:
-            hl_val = hl_elem.get(f"{{{NS['w']}}}val")
-            # Map highlight names to colors
-            highlight_colors = {
-                "yellow": Color(255, 255, 0),
-                "green": Color(0, 255, 0),
-                "cyan": Color(0, 255, 255),
-                "magenta": Color(255, 0, 255),
-                "blue": Color(0, 0, 255),
-                "red": Color(255, 0, 0),
-                "darkBlue": Color(0, 0, 139),
-                "darkCyan": Color(0, 139, 139),
-                "darkGreen": Color(0, 100, 0),
-                "darkMagenta": Color(139, 0, 139),
-                "darkRed": Color(139, 0, 0),
-                "darkYellow": Color(128, 128, 0),
-                "darkGray": Color(169, 169, 169),
-                "lightGray": Color(211, 211, 211),
-                "black": Color(0, 0, 0),
-            }
-            highlight = highlight_colors.get(hl_val)
+        hl_attrs = props.get(W.HIGHLIGHT)
+        if hl_attrs is not None:
+            highlight = HIGHLIGHT_COLORS.get(hl_attrs.get(W.VAL))
 
         # Font
         font = None
-        sz_elem = rpr.find(f"{{{NS['w']}}}sz", namespaces=NS)
-        fonts_elem = rpr.find(f"{{{NS['w']}}}rFonts", namespaces=NS)
-
         font_family = None
         font_size = None
 
-        if fonts_elem is not None:
+        fonts_attrs = props.get(W.RFONTS)
+        if fonts_attrs is not None:
             font_family = (
-                fonts_elem.get(f"{{{NS['w']}}}ascii")
-                or fonts_elem.get(f"{{{NS['w']}}}hAnsi")
-                or fonts_elem.get(f"{{{NS['w']}}}cs")
+                fonts_attrs.get(W.ASCII)
+                or fonts_attrs.get(W.HANSI)
+                or fonts_attrs.get(W.CS)
             )
 
-        if sz_elem is not None:
+        sz_attrs = props.get(W.SZ)
+        if sz_attrs is not None:
             try:
-                font_size = int(sz_elem.get(f"{{{NS['w']}}}val", "0"))
+                font_size = int(sz_attrs.get(W.VAL, "0"))
             except ValueError:
                 pass
 
@@ -341,23 +455,12 @@ class StyleResolver:
         """
         if not style_id:
             if self._default_paragraph_style:
-                return self._default_paragraph_style.paragraph_props
-            return ParagraphStyle.empty()
-
-        # Check cache
-        cache_key = f"para:{style_id}"
-        if cache_key in self._resolved_cache:
-            return self._resolved_cache[cache_key].paragraph_props
+                style_id = self._default_paragraph_style.style_id
+            else:
+                return self._default_paragraph_props
 
-        # Get style definition
-        style_def = self._styles.get(style_id)
-        if not style_def:
-            return ParagraphStyle.empty()
-
-        # Resolve inheritance chain
-        resolved = self._resolve_style_chain(style_def)
-        self._resolved_cache[cache_key] = resolved
-        return resolved.paragraph_props
+        resolved = self._resolved.get(style_id)
+        return resolved.paragraph_props if resolved else self._default_paragraph_props
 
     def resolve_run_style(self, style_id: str | None) -> TextStyle:
         """
@@ -371,82 +474,18 @@ class StyleResolver:
         """
         if not style_id:
             if self._default_character_style:
-                return self._default_character_style.run_props
-            return TextStyle.empty()
-
-        # Check cache
-        cache_key = f"run:{style_id}"
-        if cache_key in self._resolved_cache:
-            return self._resolved_cache[cache_key].run_props
-
-        # Get style definition
-        style_def = self._styles.get(style_id)
-        if not style_def:
-            return TextStyle.empty()
-
-        # Resolve inheritance chain
-        resolved = self._resolve_style_chain(style_def)
-        self._resolved_cache[cache_key] = resolved
-        return resolved.run_props
-
-    def _resolve_style_chain(self, style_def: StyleDefinition) -> StyleDefinition:
-        """Resolve the full inheritance chain for a style."""
-        # Build chain from base to derived
-        chain: list[StyleDefinition] = [style_def]
-        current = style_def
-
-        while current.based_on:
-            parent = self._styles.get(current.based_on)
-            if not parent or parent in chain:  # Prevent cycles
-                break
-            chain.insert(0, parent)
-            current = parent
-
-        # Merge styles from base to derived
-        result_para = ParagraphStyle.empty()
-        result_run = TextStyle.empty()
-
-        for style in chain:
-            result_para = result_para.merge_with(style.paragraph_props)
-            result_run = result_run.merge_with(style.run_props)
+                style_id = self._default_character_style.style_id
+            else:
+                return self._default_run_props
 
-        return StyleDefinition(
-            style_id=style_def.style_id,
-            name=style_def.name,
-            style_type=style_def.style_type,
-            based_on=style_def.based_on,
-            paragraph_props=result_para,
-            run_props=result_run,
-            is_default=style_def.is_default,
-            outline_level=style_def.outline_level,
-        )
+        resolved = self._resolved.get(style_id)
+        return resolved.run_props if resolved else self._default_run_props
 
     def get_outline_level(self, style_id: str | None) -> int | None:
         """Get outline level for a style (for headings)."""
-        if not style_id:
-            return None
-
-        style_def = self._styles.get(style_id)
-        if style_def and style_def.outline_level is not None:
-            return style_def.outline_level
-
-        # Check resolved
-        resolved = self._resolve_style_chain(style_def) if style_def else None
+        resolved = self._resolved.get(style_id) if style_id else None
         return resolved.outline_level if resolved else None
 
     def is_heading_style(self, style_id: str | None) -> bool:
         """Check if a style is a heading style."""
-        if not style_id:
-            return False
-
-        # Check outline level
-        if self.get_outline_level(style_id) is not None:
-            return True
-
-        # Check style name
-        style_def = self._styles.get(style_id)
-        if style_def:
-            name_lower = style_def.name.lower()
-            return "heading" in name_lower or "titre" in name_lower
-
-        return False
+        return style_id in self._heading_styles
@@ -118,6 +118,16 @@ class W:
     TAB = qn("w:tab")  # Tab
     SYM = qn("w:sym")  # Symbol
 
+    # Styles
+    STYLE = qn("w:style")
+    STYLEID = qn("w:styleId")
+    NAME = qn("w:name")
+    BASEDON = qn("w:basedOn")
+    DEFAULT = qn("w:default")
+    DOCDEFAULTS = qn("w:docDefaults")
+    PPRDEFAULT = qn("w:pPrDefault")
+    RPRDEFAULT = qn("w:rPrDefault")
+
     # Paragraph properties
     PPR = qn("w:pPr")
     PSTYLE = qn("w:pStyle")
@@ -157,6 +167,14 @@ class W:
     VMERGE = qn("w:vMerge")
     HMERGE = qn("w:hMerge")
     TCW = qn("w:tcW")  # Cell width
+    TBLHEADER = qn("w:tblHeader")  # Repeated header row
+    TRHEIGHT = qn("w:trHeight")  # Row height
+    VALIGN = qn("w:vAlign")  # Cell vertical alignment
+
+    # Content wrappers
+    SDT = qn("w:sdt")  # Structured document tag (content control)
+    SDTCONTENT = qn("w:sdtContent")
+    CUSTOMXML = qn("w:customXml")
 
     # Lists
     NUMPR = qn("w:numPr")  # Numbering properties
@@ -181,6 +199,23 @@ class W:
 
     # Attributes
     VAL = qn("w:val")
+    TYPE = qn("w:type")
+    CHAR = qn("w:char")
+    ANCHOR = qn("w:anchor")
+    BEFORE = qn("w:before")
+    AFTER = qn("w:after")
+    LINE = qn("w:line")
+    LINE_RULE = qn("w:lineRule")
+    FIRST_LINE = qn("w:firstLine")
+    HANGING = qn("w:hanging")
+    LEFT = qn("w:left")
+    RIGHT = qn("w:right")
+    START = qn("w:start")
+    END = qn("w:end")
+    ASCII = qn("w:ascii")
+    HANSI = qn("w:hAnsi")
+    CS = qn("w:cs")
+    W = qn("w:w")  # Width (twips)
 
 
 class M:
@@ -237,6 +272,13 @@ class M:
     SUPHIDE = qn("m:supHide")
     RADPR = qn("m:radPr")
     DEGHIDE = qn("m:degHide")
+    RPR = qn("m:rPr")  # Math run properties
+    SCR = qn("m:scr")  # Script (double-struck, fraktur, ...)
+    STY = qn("m:sty")  # Style (plain, bold, italic)
+    FPR = qn("m:fPr")  # Fraction properties
+    TYPE = qn("m:type")  # Fraction type
+    GROUPCHRPR = qn("m:groupChrPr")  # Group character properties
+    VAL = qn("m:val")  # Property value attribute
 
 
 class R:
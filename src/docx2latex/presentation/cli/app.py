@@ -5,7 +5,7 @@ CLI application using Typer.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated
 
 import typer
 from rich.console import Console
@@ -38,7 +38,7 @@ def version_callback(value: bool) -> None:
 @app.callback()
 def main_callback(
     version: Annotated[
-        Optional[bool],
+        bool | None,
         typer.Option(
             "--version",
             "-v",
@@ -66,7 +66,7 @@ def convert(
         ),
     ],
     output: Annotated[
-        Optional[Path],
+        Path | None,
         typer.Option(
             "--output",
             "-o",
@@ -74,7 +74,7 @@ def convert(
         ),
     ] = None,
     output_dir: Annotated[
-        Optional[Path],
+        Path | None,
         typer.Option(
             "--output-dir",
             "-d",
@@ -110,6 +110,41 @@ def convert(
             help="Don't extract images.",
         ),
     ] = False,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            help=(
+                "Cache parsed documents in this directory, to skip parsing on reconversion. "
+                "Entries are pickles, trusted like code: the directory must be owned by you "
+                "and writable by no one else, or it is ignored."
+            ),
+        ),
+    ] = None,
+    equation_cache: Annotated[
+        Path | None,
+        typer.Option(
+            "--equation-cache",
+            help="SQLite file caching converted equations across runs and processes.",
+        ),
+    ] = None,
+    math_workers: Annotated[
+        int,
+        typer.Option(
+            "--math-workers",
+            "-j",
+            help="Processes converting equations, for math-heavy documents.",
+            min=1,
+        ),
+    ] = 1,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Processes converting the document's content, for very large documents.",
+            min=1,
+        ),
+    ] = 1,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -136,6 +171,14 @@ def convert(
         docx2latex convert document.docx -o output.tex
 
         docx2latex convert document.docx -d output_folder/
+
+        docx2latex convert document.docx --cache-dir ~/.cache/docx2latex
+
+        docx2latex convert document.docx --equation-cache ~/.cache/docx2latex/equations.db
+
+        docx2latex convert lecture-notes.docx --math-workers 4
+
+        docx2latex convert thesis.docx --workers 8
     """
     # Setup logging
     setup_logging(verbose=verbose or debug)
@@ -148,12 +191,25 @@ def convert(
         document_class=document_class,
         font_size=font_size,
         extract_images=not no_images,
+        math_workers=math_workers,
+        workers=workers,
         verbose=verbose,
         debug=debug,
     )
 
     # Create service and convert
-    service = ConversionService()
+    parse_cache = None
+    if cache_dir is not None:
+        from docx2latex.infrastructure.caching import ParseCache
+
+        parse_cache = ParseCache(cache_dir.expanduser())
+    math_cache = None
+    if equation_cache is not None:
+        from docx2latex.infrastructure.caching import EquationStore
+        from docx2latex.infrastructure.converters.math import MathCache
+
+        math_cache = MathCache(store=EquationStore(equation_cache.expanduser()))
+    service = ConversionService(parse_cache=parse_cache, math_cache=math_cache)
 
     with Progress(
         SpinnerColumn(),
@@ -165,6 +221,9 @@ def convert(
 
         result = service.convert(input_file, options)
 
+    if math_cache is not None and math_cache.store is not None:
+        math_cache.store.close()
+
     # Display results
     if result.success:
         console.print()
@@ -186,6 +245,13 @@ def convert(
         stats_table.add_row("Images", str(result.image_count))
         stats_table.add_row("Math blocks", str(result.math_count))
         stats_table.add_row("Time", f"{result.total_time_ms:.0f}ms")
+        if result.parse_cached:
+            stats_table.add_row("Parse", "cached")
+        if result.math_cache_hits:
+            stats_table.add_row(
+                "Formula cache",
+                f"{result.math_cache_hits} hits, {result.math_cache_misses} misses",
+            )
 
         console.print(stats_table)
 
@@ -211,11 +277,132 @@ def convert(
 
 
 @app.command()
-def info(
+def watch(
     input_file: Annotated[
         Path,
         typer.Argument(
-            help="DOCX file to inspect.",
+            help="Input DOCX file to watch.",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Output LaTeX file path. Defaults to input filename with .tex extension.",
+        ),
+    ] = None,
+    output_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--output-dir",
+            "-d",
+            help="Output directory. Images will be saved in a subdirectory.",
+        ),
+    ] = None,
+    document_class: Annotated[
+        str,
+        typer.Option(
+            "--class",
+            "-c",
+            help="LaTeX document class.",
+        ),
+    ] = "article",
+    font_size: Annotated[
+        int,
+        typer.Option(
+            "--font-size",
+            help="Base font size in points.",
+        ),
+    ] = 11,
+    no_images: Annotated[
+        bool,
+        typer.Option(
+            "--no-images",
+            help="Don't extract images.",
+        ),
+    ] = False,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            help="Seconds between checks for changes.",
+            min=0.05,
+        ),
+    ] = 0.5,
+) -> None:
+    """
+    Convert a DOCX file, then reconvert it every time it changes.
+
+    Only what an edit touched is parsed and converted again: styles and
+    numbering are reused while unchanged, and unchanged paragraphs,
+    tables and equations are spliced in from the previous run. Stop
+    with Ctrl+C.
+
+    Examples:
+
+        docx2latex watch document.docx -o build/document.tex
+    """
+    import logging
+    import time
+
+    from docx2latex.application.services.incremental_service import (
+        IncrementalConversionService,
+    )
+
+    # One status line per conversion; keep the per-step log quiet
+    setup_logging(level=logging.WARNING)
+
+    options = ConversionOptions(
+        output_path=output,
+        output_dir=output_dir,
+        document_class=document_class,
+        font_size=font_size,
+        extract_images=not no_images,
+    )
+    service = IncrementalConversionService()
+    last_seen = None
+
+    console.print(f"Watching [bold]{input_file.name}[/bold] (Ctrl+C to stop)")
+    try:
+        while True:
+            try:
+                stat = input_file.stat()
+                seen = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                seen = None  # Being replaced by the editor; check again later
+
+            if seen is not None and seen != last_seen:
+                last_seen = seen
+                result = service.convert(input_file, options)
+                stamp = time.strftime("%H:%M:%S")
+                if result.success:
+                    console.print(
+                        f"[dim]{stamp}[/dim] [green]Wrote[/green] {result.output_path} "
+                        f"in {result.total_time_ms:.0f}ms ({service.fragments_converted} "
+                        f"elements converted, {service.fragments_reused} reused)"
+                    )
+                else:
+                    # Often a save caught halfway; the next change retries
+                    error = result.errors[0] if result.errors else "Unknown error"
+                    console.print(f"[dim]{stamp}[/dim] [red]Conversion failed:[/red] {error}")
+
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        console.print("Stopped watching.")
+
+
+@app.command()
+def info(
+    input_files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="DOCX files to inspect.",
             exists=True,
             file_okay=True,
             dir_okay=False,
@@ -223,55 +410,199 @@ def info(
             resolve_path=True,
         ),
     ],
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print one JSON object per file (JSON Lines).",
+        ),
+    ] = False,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Also parse each file fully, for exact content statistics.",
+        ),
+    ] = False,
 ) -> None:
     """
-    Show information about a DOCX file without converting.
+    Show information about DOCX files without converting.
+
+    Files are scanned, not parsed: document.xml is streamed once to
+    count its content, so inspecting many files is fast.
+
+    Examples:
+
+        docx2latex info document.docx
+
+        docx2latex info --json incoming/*.docx > inventory.jsonl
     """
+    import json
+
     from docx2latex.infrastructure.parsing.docx_parser import DocxParser
+    from docx2latex.infrastructure.parsing.scanner import DocxScanner
     from docx2latex.shared.result import Err
 
+    scanner = DocxScanner()
     parser = DocxParser()
-    result = parser.parse(input_file)
+    failed = False
+
+    for input_file in input_files:
+        result = scanner.scan(input_file)
+        statistics = None
+        if full and not isinstance(result, Err):
+            parsed = parser.parse(input_file)
+            if isinstance(parsed, Err):
+                result = parsed
+            else:
+                statistics = parsed.value.statistics()
+
+        if isinstance(result, Err):
+            failed = True
+            if json_output:
+                typer.echo(json.dumps({"path": str(input_file), "error": result.error}))
+            else:
+                console.print(f"[red]Error parsing {input_file.name}:[/red] {result.error}")
+            continue
+
+        scan = result.value
+        if json_output:
+            record = scan.to_dict()
+            if statistics is not None:
+                record["statistics"] = statistics.to_dict()
+            typer.echo(json.dumps(record, ensure_ascii=False))
+            continue
 
-    if isinstance(result, Err):
-        console.print(f"[red]Error parsing file:[/red] {result.error}")
-        raise typer.Exit(1)
+        console.print()
+        console.print(Panel(f"[bold]{input_file.name}[/bold]", title="Document Info"))
+
+        # Metadata
+        meta_table = Table(title="Metadata", show_header=False, box=None)
+        meta_table.add_column("Field", style="cyan")
+        meta_table.add_column("Value", style="white")
+
+        if scan.metadata.title:
+            meta_table.add_row("Title", scan.metadata.title)
+        if scan.metadata.author:
+            meta_table.add_row("Author", scan.metadata.author)
+        if scan.metadata.created:
+            meta_table.add_row("Created", scan.metadata.created)
+
+        console.print(meta_table)
+
+        # Statistics
+        stats_table = Table(title="Content", show_header=False, box=None)
+        stats_table.add_column("Element", style="cyan")
+        stats_table.add_column("Count", style="white")
+
+        stats_table.add_row("Sections", str(scan.sections))
+        stats_table.add_row("Paragraphs", str(scan.paragraphs))
+        stats_table.add_row("Tables", str(scan.tables))
+        stats_table.add_row("Images", str(scan.media_parts))
+        stats_table.add_row("Drawings", str(scan.drawings))
+        stats_table.add_row("Math blocks", str(scan.equations))
+        if statistics is not None:
+            stats_table.add_row("Characters", str(statistics.text_length))
+            stats_table.add_row("Table nesting", str(statistics.max_table_depth))
 
-    doc = result.value
+        console.print(stats_table)
 
-    console.print()
-    console.print(Panel(f"[bold]{input_file.name}[/bold]", title="Document Info"))
+        # Page layout
+        if scan.layout is not None:
+            console.print(f"\n[cyan]Page layout:[/cyan] {scan.layout}")
 
-    # Metadata
-    meta_table = Table(title="Metadata", show_header=False, box=None)
-    meta_table.add_column("Field", style="cyan")
-    meta_table.add_column("Value", style="white")
+    if failed:
+        raise typer.Exit(1)
 
-    if doc.metadata.title:
-        meta_table.add_row("Title", doc.metadata.title)
-    if doc.metadata.author:
-        meta_table.add_row("Author", doc.metadata.author)
-    if doc.metadata.created:
-        meta_table.add_row("Created", doc.metadata.created)
 
-    console.print(meta_table)
+@app.command("extract-math")
+def extract_math(
+    input_files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="DOCX files to extract equations from.",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="JSON Lines file to write. Defaults to standard output.",
+        ),
+    ] = None,
+    equation_cache: Annotated[
+        Path | None,
+        typer.Option(
+            "--equation-cache",
+            help="SQLite file caching converted equations across runs and processes.",
+        ),
+    ] = None,
+) -> None:
+    """
+    Extract the equations of DOCX files as LaTeX, one JSON object per line.
 
-    # Statistics
-    stats_table = Table(title="Content", show_header=False, box=None)
-    stats_table.add_column("Element", style="cyan")
-    stats_table.add_column("Count", style="white")
+    Each record holds the file path, the equation's index in the file,
+    its type (display or inline), the ordinal of its paragraph, its
+    LaTeX and the digest of its OMML. Equations are streamed out of
+    document.xml without parsing the rest of the document, so memory
+    stays flat however many files are given; files that cannot be read
+    are reported as {"path": ..., "error": ...} records.
+
+    Examples:
 
-    stats_table.add_row("Sections", str(len(doc.sections)))
-    stats_table.add_row("Paragraphs", str(doc.paragraph_count))
-    stats_table.add_row("Tables", str(doc.table_count))
-    stats_table.add_row("Images", str(doc.image_count))
-    stats_table.add_row("Math blocks", str(doc.math_count))
+        docx2latex extract-math document.docx
 
-    console.print(stats_table)
+        docx2latex extract-math corpus/*.docx -o equations.jsonl
+    """
+    import json
+    import logging
+    import sys
+
+    from docx2latex.infrastructure.converters.math import (
+        EquationExtractor,
+        ExtractedEquation,
+        MathCache,
+    )
+    from docx2latex.shared.result import Err
 
-    # Page layout
-    layout = doc.primary_layout
-    console.print(f"\n[cyan]Page layout:[/cyan] {layout}")
+    # Records go to standard output; keep the log to warnings
+    setup_logging(level=logging.WARNING)
+
+    store = None
+    if equation_cache is not None:
+        from docx2latex.infrastructure.caching import EquationStore
+
+        store = EquationStore(equation_cache.expanduser())
+    extractor = EquationExtractor(cache=MathCache(store=store))
+    failed = False
+
+    stream = output.open("w", encoding="utf-8") if output is not None else sys.stdout
+    try:
+        for input_file in input_files:
+            path = str(input_file)
+
+            def write(equation: ExtractedEquation, path: str = path) -> None:
+                record = {"path": path, **equation.to_dict()}
+                stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            result = extractor.extract(input_file, write)
+            if isinstance(result, Err):
+                failed = True
+                stream.write(json.dumps({"path": path, "error": result.error}) + "\n")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+        if store is not None:
+            store.close()
+
+    if failed:
+        raise typer.Exit(1)
 
 
 def main() -> None:
@@ -1,9 +1,37 @@
 """Pytest configuration and fixtures."""
 
+import zipfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+M_NS = "http://schemas.openxmlformats.org/officeDocument/2006/math"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Default Extension="png" ContentType="image/png"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.'
+    'document.main+xml"/>'
+    "</Types>"
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
 
 @pytest.fixture
 def sample_dir() -> Path:
@@ -17,3 +45,34 @@ def output_dir(tmp_path: Path) -> Path:
     output = tmp_path / "output"
     output.mkdir()
     return output
+
+
+@pytest.fixture
+def make_docx(tmp_path: Path) -> Callable[..., Path]:
+    """
+    Return a factory that writes a minimal DOCX package.
+
+    The factory takes the inner XML of ``w:body`` plus optional extra
+    package parts (name -> bytes or str) and returns the file path.
+    """
+
+    def factory(
+        body_xml: str,
+        parts: dict[str, bytes | str] | None = None,
+        name: str = "test.docx",
+    ) -> Path:
+        document_xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:document xmlns:w="{W_NS}" xmlns:m="{M_NS}" xmlns:r="{R_NS}">'
+            f"<w:body>{body_xml}</w:body></w:document>"
+        )
+        path = tmp_path / name
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+            zf.writestr("_rels/.rels", PACKAGE_RELS_XML)
+            zf.writestr("word/document.xml", document_xml)
+            for part_name, content in (parts or {}).items():
+                zf.writestr(part_name, content)
+        return path
+
+    return factory
@@ -1,13 +1,28 @@
 """Integration tests for full document conversion."""
 
+import json
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
+from typer.testing import CliRunner
 
 from docx2latex.application.dto.conversion_options import ConversionOptions
+from docx2latex.application.services import conversion_service
 from docx2latex.application.services.conversion_service import ConversionService
+from docx2latex.application.services.incremental_service import IncrementalConversionService
+from docx2latex.domain.entities.elements import DocumentElement, Paragraph
+from docx2latex.domain.protocols.converter import ConversionContext
+from docx2latex.infrastructure.converters import registry as registry_module
+from docx2latex.infrastructure.converters.base import BaseConverter
+from docx2latex.infrastructure.converters.paragraph import ParagraphConverter
 from docx2latex.infrastructure.parsing.docx_parser import DocxParser
-from docx2latex.shared.result import Ok
+from docx2latex.infrastructure.parsing.scanner import DocxScanner
+from docx2latex.infrastructure.writing.latex_writer import LatexWriter
+from docx2latex.presentation.cli.app import app
+from docx2latex.shared.result import Ok, Result
 
 
 class TestDocxParser:
@@ -33,6 +48,24 @@ class TestDocxParser:
         assert doc.paragraph_count >= 0
         assert len(doc.sections) >= 1
 
+    def test_scan_counts_match_parse(self, sample_dir: Path) -> None:
+        """Test that the scanner counts what a full parse builds."""
+        samples = [s for s in sample_dir.glob("*.docx") if not s.name.startswith("~")]
+
+        if not samples:
+            pytest.skip("No sample DOCX files found")
+
+        for sample in samples:
+            scan = DocxScanner().scan(sample)
+            parsed = DocxParser().parse(sample)
+            assert isinstance(scan, Ok)
+            assert isinstance(parsed, Ok)
+
+            stats = parsed.value.statistics()
+            counts = (scan.value.paragraphs, scan.value.tables, scan.value.sections)
+            assert counts == (stats.paragraphs, stats.tables, stats.sections), sample.name
+            assert scan.value.equations == stats.math_blocks, sample.name
+
 
 class TestConversionService:
     """Tests for the conversion service."""
@@ -86,3 +119,264 @@ class TestConversionService:
                 assert result.output_path is not None
                 print(f"Converted {sample.name}: {result.paragraph_count} paragraphs, "
                       f"{result.math_count} math blocks")
+
+    def test_parallel_conversion_matches_serial(
+        self, sample_dir: Path, output_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that converting chunks in worker processes gives the same output."""
+        sample = sample_dir / "Fev.docx"
+        if not sample.exists():
+            pytest.skip("Sample file not found")
+        monkeypatch.setattr(conversion_service, "PARALLEL_MIN_ELEMENTS", 0)
+
+        serial = ConversionService().convert(
+            sample, ConversionOptions(output_path=output_dir / "serial.tex")
+        )
+        parallel = ConversionService().convert(
+            sample, ConversionOptions(output_path=output_dir / "parallel.tex", workers=3)
+        )
+
+        assert serial.success
+        assert parallel.success
+        assert parallel.output_path.read_bytes() == serial.output_path.read_bytes()
+        assert parallel.warnings == serial.warnings
+
+    def test_parallel_chunks_keep_document_order(
+        self,
+        make_docx: Callable[..., Path],
+        output_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that chunks split at section ends and merge back in order."""
+        monkeypatch.setattr(conversion_service, "PARALLEL_MIN_ELEMENTS", 0)
+        sizes: list[tuple[int, int]] = []
+        convert_chunks = ConversionService._convert_chunks
+
+        def recording_convert_chunks(
+            self: ConversionService, chunks: list[Any], *args: Any
+        ) -> list[Any]:
+            sizes.extend((chunk.section, len(chunk.elements)) for chunk in chunks)
+            return convert_chunks(self, chunks, *args)
+
+        monkeypatch.setattr(ConversionService, "_convert_chunks", recording_convert_chunks)
+        sect_pr = '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>'
+        body = (
+            "".join(f"<w:p><w:r><w:t>first {i}</w:t></w:r></w:p>" for i in range(23))
+            + sect_pr
+            + "".join(f"<w:p><w:r><w:t>second {i}</w:t></w:r></w:p>" for i in range(10))
+        )
+        path = make_docx(body)
+
+        serial = ConversionService().convert(
+            path, ConversionOptions(output_path=output_dir / "serial.tex")
+        )
+        parallel = ConversionService().convert(
+            path, ConversionOptions(output_path=output_dir / "parallel.tex", workers=3)
+        )
+
+        assert serial.success
+        assert parallel.success
+        assert parallel.output_path.read_bytes() == serial.output_path.read_bytes()
+        assert sizes == [(0, 3)] * 7 + [(0, 2), (1, 3), (1, 3), (1, 3), (1, 1)]
+
+    def test_concurrent_conversions_with_workers(
+        self,
+        make_docx: Callable[..., Path],
+        output_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that conversions in two threads, each asking for workers, both succeed."""
+        monkeypatch.setattr(conversion_service, "PARALLEL_MIN_ELEMENTS", 0)
+        body = "".join(f"<w:p><w:r><w:t>p {i}</w:t></w:r></w:p>" for i in range(40))
+        path = make_docx(body)
+        expected = ConversionService().convert(
+            path, ConversionOptions(output_path=output_dir / "serial.tex")
+        )
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def run(index: int) -> None:
+            barrier.wait()
+            results[index] = ConversionService().convert(
+                path, ConversionOptions(output_path=output_dir / f"{index}.tex", workers=2)
+            )
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        assert sorted(results) == [0, 1]
+        for result in results.values():
+            assert result.success
+            assert result.output_path.read_bytes() == expected.output_path.read_bytes()
+
+
+class TestIncrementalConversion:
+    """Tests for reconverting revisions of a document."""
+
+    def test_reconversion_matches_full_conversion(
+        self, sample_dir: Path, output_dir: Path
+    ) -> None:
+        samples = [s for s in sample_dir.glob("*.docx") if not s.name.startswith("~")]
+        if not samples:
+            pytest.skip("No sample DOCX files found")
+
+        service = IncrementalConversionService()
+        options = ConversionOptions(output_path=output_dir / "incremental.tex")
+        service.convert(samples[0], options)
+        result = service.convert(samples[0], options)
+        expected = ConversionService().convert(
+            samples[0], ConversionOptions(output_path=output_dir / "full.tex")
+        )
+
+        assert result.success
+        assert service.fragments_converted == 0
+        assert result.warnings == expected.warnings
+        assert (output_dir / "incremental.tex").read_text() == (
+            output_dir / "full.tex"
+        ).read_text()
+
+    def test_reused_fragments_replay_labels(
+        self, sample_dir: Path, output_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        samples = [s for s in sample_dir.glob("*.docx") if not s.name.startswith("~")]
+        if not samples:
+            pytest.skip("No sample DOCX files found")
+
+        do_convert = ParagraphConverter.do_convert
+
+        def labelling_convert(
+            self: ParagraphConverter, element: Paragraph, context: ConversionContext
+        ) -> Result[str, str]:
+            context.labels[f"par:{element.id}"] = element.text
+            return do_convert(self, element, context)
+
+        monkeypatch.setattr(ParagraphConverter, "do_convert", labelling_convert)
+        writer = LabelRecordingWriter()
+        service = IncrementalConversionService(writer=writer)
+        options = ConversionOptions(output_path=output_dir / "incremental.tex")
+        service.convert(samples[0], options)
+        service.convert(samples[0], options)
+
+        assert service.fragments_converted == 0
+        assert writer.labels[0]
+        assert writer.labels[1] == writer.labels[0]
+
+
+class LabelRecordingWriter(LatexWriter):
+    """Writer recording the labels of each conversion."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.labels: list[dict[str, str]] = []
+
+    def write(
+        self, content: str, context: ConversionContext, output_path: Path
+    ) -> Result[Path, str]:
+        self.labels.append(dict(context.labels))
+        return super().write(content, context, output_path)
+
+
+class Chart(DocumentElement):
+    """Element type no built-in converter handles."""
+
+    @property
+    def element_type(self) -> str:
+        return "chart"
+
+    def children(self) -> Iterator[DocumentElement]:
+        return iter([])
+
+
+class ChartConverter(BaseConverter[Chart]):
+    """Converter a plugin would provide."""
+
+    def __init__(self, registry: registry_module.ConverterRegistry) -> None:
+        self.registry = registry
+
+    @property
+    def element_type(self) -> str:
+        return "chart"
+
+    def do_convert(self, element: Chart, context: ConversionContext) -> Result[str, str]:
+        context.require_package("pgfplots")
+        return Ok(f"% {element.element_type}")
+
+
+class FakeEntryPoint:
+    """Entry point loading ChartConverter, counting the loads."""
+
+    name = "chart"
+    value = "tests:ChartConverter"
+    loads = 0
+
+    def load(self) -> type[ChartConverter]:
+        FakeEntryPoint.loads += 1
+        return ChartConverter
+
+
+class TestConverterRegistry:
+    """Tests for converter dispatch."""
+
+    def test_plugin_loaded_when_its_type_first_appears(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that plugins are imported lazily, once."""
+        monkeypatch.setattr(registry_module, "entry_points", lambda **_: [FakeEntryPoint()])
+        FakeEntryPoint.loads = 0
+        registry = registry_module.create_default_registry()
+        context = ConversionContext()
+
+        assert FakeEntryPoint.loads == 0
+        assert registry.convert(Chart(), context) == Ok("% chart")
+        assert registry.convert(Chart(), context) == Ok("% chart")
+        assert FakeEntryPoint.loads == 1
+        assert registry.has_converter("chart")
+        assert "{pgfplots}" in context.required_packages
+
+    def test_plugin_that_is_not_a_converter_is_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a plugin loading something else leaves the element unsupported."""
+        entry_point = FakeEntryPoint()
+        monkeypatch.setattr(entry_point, "load", lambda: Chart)
+        monkeypatch.setattr(registry_module, "entry_points", lambda **_: [entry_point])
+        registry = registry_module.create_default_registry()
+        context = ConversionContext()
+
+        assert registry.convert(Chart(), context) == Ok("")
+        assert not registry.has_converter("chart")
+        assert context.warnings == ["Unsupported element: chart"]
+
+
+class TestExtractMathCommand:
+    """Tests for the extract-math command."""
+
+    def test_writes_one_record_per_equation(
+        self, make_docx: Callable[..., Path], tmp_path: Path
+    ) -> None:
+        """Test that equations and unreadable files come out as JSON Lines."""
+        body = (
+            "<w:p><m:oMath><m:r><m:t>x</m:t></m:r></m:oMath></w:p>"
+            "<w:p><m:oMathPara><m:oMath><m:r><m:t>y</m:t></m:r></m:oMath></m:oMathPara></w:p>"
+        )
+        path = make_docx(body)
+        broken = tmp_path / "broken.docx"
+        broken.write_bytes(b"not a zip")
+        output = tmp_path / "equations.jsonl"
+
+        result = CliRunner().invoke(
+            app, ["extract-math", str(path), str(broken), "-o", str(output)]
+        )
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [(r["path"], r.get("latex")) for r in records] == [
+            (str(path), "x"),
+            (str(path), "y"),
+            (str(broken), None),
+        ]
+        assert [r.get("type") for r in records[:2]] == ["inline", "display"]
+        assert "error" in records[2]
@@ -0,0 +1,777 @@
+"""Tests for DOCX parsing."""
+
+import dataclasses
+import io
+import os
+import pickle
+import tempfile
+import zipfile
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO
+
+import pytest
+from lxml import etree
+
+from docx2latex.domain.entities.elements import Image, ListBlock, Paragraph, Run, Table
+from docx2latex.domain.protocols.converter import ConversionContext
+from docx2latex.domain.value_objects.font import FontSpec
+from docx2latex.domain.value_objects.layout import PageLayout
+from docx2latex.infrastructure.caching import ParseCache
+from docx2latex.infrastructure.converters.image import ImageConverter
+from docx2latex.infrastructure.converters.registry import create_default_registry
+from docx2latex.infrastructure.parsing.docx_parser import DocxParser
+from docx2latex.infrastructure.parsing.incremental import IncrementalParser
+from docx2latex.infrastructure.parsing.package_index import PackageIndex
+from docx2latex.infrastructure.parsing.scanner import DocxScanner
+from docx2latex.infrastructure.parsing.style_resolver import StyleResolver
+from docx2latex.shared.exceptions import DocxParseError
+from docx2latex.shared.result import Ok
+from tests.conftest import PACKAGE_RELS_XML, W_NS
+
+
+def para(text: str, ppr: str = "") -> str:
+    return f"<w:p>{ppr}<w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def list_para(text: str, num_id: str = "1", ilvl: str = "0") -> str:
+    ppr = (
+        f'<w:pPr><w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/></w:numPr></w:pPr>'
+    )
+    return para(text, ppr)
+
+
+SECT_PR = '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>'
+
+HYPERLINK_RELS_XML = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId9" Type="http://schemas.openxmlformats.org/officeDocument/'
+    '2006/relationships/hyperlink" Target="https://example.com" TargetMode="External"/>'
+    "</Relationships>"
+)
+
+STYLES_XML = (
+    f'<w:styles xmlns:w="{W_NS}">'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/>'
+    '<w:pPr><w:jc w:val="both"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/>'
+    '<w:basedOn w:val="Normal"/><w:pPr><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:b/></w:rPr></w:style>'
+    '<w:style w:type="character" w:styleId="Emph"><w:name w:val="Emphasis"/>'
+    "<w:rPr><w:i/></w:rPr></w:style>"
+    "</w:styles>"
+)
+
+
+def _without_ids(value: object) -> object:
+    """Project a parsed document onto plain data, dropping generated element IDs."""
+    if isinstance(value, etree._Element):
+        # Canonical form: detached subtrees may redeclare fewer namespaces
+        return etree.tostring(value, method="c14n", exclusive=True, with_tail=False)
+    if isinstance(value, dict):
+        return {k: _without_ids(v) for k, v in value.items() if k != "id"}
+    if isinstance(value, list | tuple):
+        return [_without_ids(v) for v in value]
+    return value
+
+
+class TestStreamingParser:
+    """Tests for DocxParser.iter_elements."""
+
+    def test_yields_body_elements_in_order(self, make_docx: Callable[..., Path]) -> None:
+        body = (
+            para("intro")
+            + list_para("one")
+            + list_para("two")
+            + "<w:tbl><w:tr><w:tc>" + para("cell") + "</w:tc></w:tr></w:tbl>"
+            + para("outro")
+            + SECT_PR
+        )
+        path = make_docx(body)
+
+        elements = list(DocxParser().iter_elements(path))
+
+        assert [type(e) for e in elements] == [
+            Paragraph, ListBlock, Table, Paragraph, PageLayout,
+        ]
+        assert elements[0].text == "intro"
+        assert [item.text for item in elements[1].items] == ["one", "two"]
+        assert elements[2].rows[0].cells[0].text == "cell"
+
+    def test_matches_full_parse(self, make_docx: Callable[..., Path]) -> None:
+        body = "".join(para(f"p{i}") for i in range(50)) + SECT_PR
+        path = make_docx(body)
+        parser = DocxParser()
+
+        streamed = [e.text for e in parser.iter_elements(path) if isinstance(e, Paragraph)]
+        result = parser.parse(path)
+
+        assert isinstance(result, Ok)
+        assert streamed == [p.text for p in result.value.iter_paragraphs()]
+
+    def test_invalid_file_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip")
+
+        with pytest.raises(DocxParseError):
+            list(DocxParser().iter_elements(path))
+
+
+IMAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId5" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" '
+    'Target="media/image1.png"/>'
+    "</Relationships>"
+)
+
+
+class TestBodyContent:
+    """Paragraph content: runs, run children, hyperlinks and math."""
+
+    BODY = (
+        para("Title", '<w:pPr><w:pStyle w:val="Heading1"/><w:spacing w:after="120"/></w:pPr>')
+        + '<w:p><w:pPr><w:jc w:val="center"/><w:ind w:left="720" w:hanging="360"/></w:pPr>'
+        '<w:r><w:rPr><w:b w:val="0"/><w:i/><w:u/><w:color w:val="FF0000"/></w:rPr>'
+        '<w:t xml:space="preserve">styled </w:t><w:tab/><w:t>a&amp;b</w:t></w:r>'
+        '<w:r><w:rPr><w:rStyle w:val="Emph"/><w:sz w:val="28"/><w:rFonts w:ascii="Arial"/>'
+        '</w:rPr><w:t>x</w:t><w:br/><w:sym w:char="03B1"/><w:br w:type="page"/></w:r>'
+        "<w:r><w:lastRenderedPageBreak/></w:r>"
+        '<w:hyperlink r:id="rId9"><w:r><w:t>link</w:t></w:r>'
+        '<w:smartTag><w:r><w:rPr><w:b/></w:rPr><w:t> text</w:t></w:r></w:smartTag></w:hyperlink>'
+        '<w:hyperlink w:anchor="top"><w:r><w:t>back</w:t></w:r></w:hyperlink>'
+        "<m:oMath><m:r><m:t>x</m:t></m:r></m:oMath>"
+        "<w:ins><w:r><w:t>ignored</w:t></w:r></w:ins>"
+        "</w:p>"
+        + "<w:p><m:oMathPara><m:oMath><m:f><m:num><m:r><m:t>1</m:t></m:r></m:num>"
+        "<m:den><m:r><m:t>2</m:t></m:r></m:den></m:f></m:oMath></m:oMathPara></w:p>"
+        + list_para("one")
+        + list_para("nested", ilvl="1")
+        + SECT_PR
+        + list_para("two")
+        + "<w:tbl><w:tblPr><w:jc w:val='right'/></w:tblPr><w:tr><w:tc>"
+        + para("cell")
+        + "</w:tc></w:tr></w:tbl>"
+        + "<w:sdt><w:sdtContent>" + para("skipped") + "</w:sdtContent></w:sdt>"
+        + "<w:p><w:pPr/><w:r><w:t>bare <!-- note -->tail</w:t></w:r></w:p>"
+        + SECT_PR
+    )
+
+    def test_builds_paragraph_content(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(self.BODY, {"word/_rels/document.xml.rels": HYPERLINK_RELS_XML})
+
+        elements = list(DocxParser().iter_elements(path))
+
+        styled = elements[1]
+        assert [type(c).__name__ for c in styled.content] == [
+            "Run", "Run", "Hyperlink", "Hyperlink", "MathBlock",
+        ]
+        assert styled.content[0].text == "styled \ta&b"
+        assert not styled.content[0].style.bold
+        assert styled.content[0].style.italic
+        assert styled.content[1].text == "x\n\u03b1\n\\newpage\n"
+        assert styled.content[2].url == "https://example.com"
+        assert [run.text for run in styled.content[2].runs] == ["link", " text"]
+        assert styled.content[3].url == "#top"
+        assert elements[-2].text == "bare "
+
+
+class TestStyleCache:
+    """Equal direct formatting resolves to one shared style instance."""
+
+    def test_runs_share_style_instances(self, make_docx: Callable[..., Path]) -> None:
+        def run(rpr: str, text: str) -> str:
+            return f"<w:r><w:rPr>{rpr}</w:rPr><w:t>{text}</w:t></w:r>"
+
+        ppr = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+        runs_xml = (
+            run("<w:b/>", "a")
+            + run('<w:b w:val="1"/>', "b")
+            + run("<w:i/>", "c")
+            + "<w:r><w:t>d</w:t></w:r>"
+        )
+        body = f"<w:p>{ppr}{runs_xml}</w:p>" * 3
+        path = make_docx(body, {"word/styles.xml": STYLES_XML})
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        paragraphs = list(result.value.iter_paragraphs())
+        runs = [run for p in paragraphs for run in p.content]
+        bold, bold_val, italic, plain = runs[:4]
+
+        assert bold.style.bold
+        assert italic.style.italic
+        assert bold.style is bold_val.style  # Different XML, equal style
+        assert all(r.style is b.style for r, b in zip(runs, runs[:4] * 3, strict=True))
+        assert plain.style is not bold.style
+        assert len({id(p.style) for p in paragraphs}) == 1
+        assert hash(paragraphs[0].style) == hash(paragraphs[1].style)
+
+
+class TestStyleResolver:
+    """The basedOn graph is resolved once, over the document defaults."""
+
+    @staticmethod
+    def resolver(styles: str) -> StyleResolver:
+        defaults = (
+            '<w:docDefaults><w:rPrDefault><w:rPr><w:sz w:val="22"/></w:rPr></w:rPrDefault>'
+            '<w:pPrDefault><w:pPr><w:spacing w:after="160"/></w:pPr></w:pPrDefault>'
+            "</w:docDefaults>"
+        )
+        resolver = StyleResolver()
+        resolver.load_from_xml(f'<w:styles xmlns:w="{W_NS}">{defaults}{styles}</w:styles>'.encode())
+        return resolver
+
+    def test_chain_is_merged_over_defaults(self) -> None:
+        # Derived styles come first, so resolution cannot rely on document order
+        heading2 = (
+            '<w:style w:styleId="Heading2"><w:name w:val="heading 2"/>'
+            '<w:basedOn w:val="Heading1"/><w:pPr><w:outlineLvl w:val="1"/></w:pPr></w:style>'
+        )
+        quote = (
+            '<w:style w:styleId="Quote"><w:name w:val="Quote"/>'
+            '<w:basedOn w:val="Heading1"/><w:rPr><w:i/></w:rPr></w:style>'
+        )
+        heading1 = (
+            '<w:style w:styleId="Heading1"><w:name w:val="heading 1"/>'
+            '<w:pPr><w:outlineLvl w:val="0"/></w:pPr><w:rPr><w:b/></w:rPr></w:style>'
+        )
+        resolver = self.resolver(heading2 + quote + heading1)
+
+        heading2_run = resolver.resolve_run_style("Heading2")
+        assert heading2_run.bold
+        assert heading2_run.font == FontSpec.from_docx(size_half_points=22)
+        assert resolver.resolve_paragraph_style("Heading2").space_after is not None
+        assert resolver.get_outline_level("Heading2") == 1
+        assert resolver.get_outline_level("Quote") == 0  # Inherited from Heading1
+        assert resolver.is_heading_style("Heading1")
+        assert not resolver.is_heading_style("Emph")
+        assert resolver.resolve_run_style("Quote").italic
+        assert resolver.resolve_run_style("Quote").bold
+
+    def test_based_on_cycle_terminates(self) -> None:
+        styles = (
+            '<w:style w:styleId="A"><w:basedOn w:val="B"/><w:rPr><w:b/></w:rPr></w:style>'
+            '<w:style w:styleId="B"><w:basedOn w:val="A"/><w:rPr><w:i/></w:rPr></w:style>'
+        )
+        resolver = self.resolver(styles)
+
+        assert resolver.resolve_run_style("A").bold
+        assert resolver.resolve_run_style("B").italic
+        assert resolver.resolve_run_style("Missing").font == FontSpec.from_docx(size_half_points=22)
+
+
+def table(*rows: str) -> str:
+    return "<w:tbl>" + "".join(rows) + "</w:tbl>"
+
+
+def row(*cells: str) -> str:
+    return "<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in cells) + "</w:tr>"
+
+
+class TestNestedTables:
+    """Nested tables are modelled as cell content and parsed once."""
+
+    def test_nested_table_is_cell_content(self, make_docx: Callable[..., Path]) -> None:
+        inner = table(row(para("a"), para("b")), row(para("c"), para("d")))
+        outer = table(row(para("label"), para("before") + inner + para("after")))
+        path = make_docx(outer)
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        document = result.value
+        (outer_table,) = document.iter_elements()
+        assert len(outer_table.rows) == 1
+        assert [len(r.cells) for r in outer_table.rows] == [2]
+
+        cell = outer_table.rows[0].cells[1]
+        assert [type(item) for item in cell.content] == [Paragraph, Table, Paragraph]
+        assert [p.text for p in cell.paragraphs] == ["before", "after"]
+        assert cell.content[1].rows[1].cells[0].text == "c"
+
+        assert document.table_count == 2
+        assert [p.text for p in document.iter_paragraphs()] == [
+            "label", "before", "a", "b", "c", "d", "after",
+        ]
+
+    def test_deep_nesting_does_not_duplicate_content(self, make_docx: Callable[..., Path]) -> None:
+        body = para("leaf")
+        for level in range(5):
+            body = table(row(para(f"label {level}"), body))
+        path = make_docx(body)
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        assert result.value.paragraph_count == 6
+        assert result.value.table_count == 5
+
+    def test_content_controls_are_transparent(self, make_docx: Callable[..., Path]) -> None:
+        sdt_row = "<w:sdt><w:sdtContent>" + row(para("in sdt")) + "</w:sdtContent></w:sdt>"
+        custom_cell = (
+            "<w:tr><w:customXml><w:tc>" + para("in customXml") + "</w:tc></w:customXml></w:tr>"
+        )
+        path = make_docx("<w:tbl>" + row(para("plain")) + sdt_row + custom_cell + "</w:tbl>")
+
+        (parsed,) = DocxParser().iter_elements(path)
+
+        assert [r.cells[0].text for r in parsed.rows] == ["plain", "in sdt", "in customXml"]
+
+    def test_nested_table_converts_to_nested_tabular(self, make_docx: Callable[..., Path]) -> None:
+        inner = table(row(para("x"), para("y")))
+        path = make_docx(table(row(para("outer"), inner)))
+        (outer_table,) = DocxParser().iter_elements(path)
+
+        result = create_default_registry().convert(outer_table, ConversionContext())
+
+        assert isinstance(result, Ok)
+        assert result.value.count("\\begin{tabular}") == 2
+        assert "x & y" in result.value
+
+
+class TestStatistics:
+    """Document statistics come from a single traversal."""
+
+    def test_counts_match_per_property_traversals(self, make_docx: Callable[..., Path]) -> None:
+        inner = table(row(para("deep"), para("x")))
+        body = (
+            para("intro")
+            + table(row(para("a") + inner, para("b")))
+            + list_para("one")
+            + list_para("two")
+        )
+        result = DocxParser().parse(make_docx(body))
+
+        assert isinstance(result, Ok)
+        document = result.value
+        stats = document.statistics()
+        assert stats.paragraphs == document.paragraph_count == 7
+        assert stats.tables == document.table_count == 2
+        assert stats.elements == document.element_count
+        assert stats.max_table_depth == 2
+        assert stats.max_list_depth == 1
+        assert stats.by_type["list_item"] == 2
+        assert stats.text_length == len("introadeepxbonetwo")
+
+    def test_nested_list_items_are_counted(self, make_docx: Callable[..., Path]) -> None:
+        body = list_para("one") + list_para("nested", ilvl="1") + list_para("two")
+        result = DocxParser().parse(make_docx(body))
+
+        assert isinstance(result, Ok)
+        document = result.value
+        assert [p.text for p in document.iter_paragraphs()] == ["one", "nested", "two"]
+        assert document.statistics().paragraphs == document.paragraph_count == 3
+
+
+class TestScanner:
+    """The scanner counts content without a full parse."""
+
+    def test_scan_counts_and_metadata(self, make_docx: Callable[..., Path]) -> None:
+        core = (
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/'
+            'metadata/core-properties" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            "<dc:title>Report</dc:title></cp:coreProperties>"
+        )
+        math = "<w:p><m:oMathPara><m:oMath><m:r><m:t>x</m:t></m:r></m:oMath></m:oMathPara></w:p>"
+        body = (
+            para("a") * 3
+            + table(row(table(row(para("in"))), para("b")))
+            + math
+            + '<w:sectPr><w:pgSz w:w="16838" w:h="11906"/></w:sectPr>'
+        )
+        path = make_docx(
+            body, {"docProps/core.xml": core, "word/media/image1.png": b"0123456789"}
+        )
+
+        result = DocxScanner().scan(path)
+
+        assert isinstance(result, Ok)
+        scan = result.value
+        assert (scan.paragraphs, scan.tables, scan.equations, scan.sections) == (6, 2, 1, 2)
+        assert scan.display_equations == 1
+        assert (scan.media_parts, scan.media_bytes) == (1, 10)
+        assert scan.metadata.title == "Report"
+        assert scan.to_dict()["orientation"] == "landscape"
+
+    def test_scan_rejects_non_zip(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip")
+
+        assert not isinstance(DocxScanner().scan(path), Ok)
+
+
+class TestImages:
+    """Tests for lazy image loading."""
+
+    def test_images_are_lazy_handles(
+        self, make_docx: Callable[..., Path], output_dir: Path
+    ) -> None:
+        payload = bytes(range(256)) * 4096
+        path = make_docx(
+            para("x"),
+            parts={
+                "word/_rels/document.xml.rels": IMAGE_RELS_XML,
+                "word/media/image1.png": payload,
+            },
+        )
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        image = result.value.get_image("rId5")
+        assert image is not None
+        assert image.data == b""
+        assert image.source is not None
+        assert image.size == len(payload)
+
+        context = ConversionContext(output_dir=output_dir)
+        assert isinstance(ImageConverter().convert(image, context), Ok)
+        assert (output_dir / "images" / "image1.png").read_bytes() == payload
+
+    def test_images_share_the_package_archive(self, make_docx: Callable[..., Path]) -> None:
+        rels = IMAGE_RELS_XML.replace(
+            "</Relationships>",
+            '<Relationship Id="rId6" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" '
+            'Target="media/image2.png"/></Relationships>',
+        )
+        path = make_docx(
+            para("x"),
+            parts={
+                "word/_rels/document.xml.rels": rels,
+                "word/media/image1.png": b"one",
+                "word/media/image2.png": b"two",
+            },
+        )
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        first, second = result.value.get_image("rId5"), result.value.get_image("rId6")
+        assert first is not None
+        assert second is not None
+        assert first.source is not None
+        assert second.source is not None
+        assert first.source.archive is second.source.archive
+        assert (first.source.read(), second.source.read()) == (b"one", b"two")
+
+    def test_image_without_source_exports_its_data(self, output_dir: Path) -> None:
+        image = Image(rel_id="rId1", filename="inline.png", data=b"png")
+
+        context = ConversionContext(output_dir=output_dir)
+        assert isinstance(ImageConverter().convert(image, context), Ok)
+        assert (output_dir / "images" / "inline.png").read_bytes() == b"png"
+
+
+class TestParseCache:
+    """Parsed documents are cached by content, with image references rebound."""
+
+    def test_round_trip_rebinds_images(
+        self, make_docx: Callable[..., Path], tmp_path: Path
+    ) -> None:
+        parts = {"word/_rels/document.xml.rels": IMAGE_RELS_XML, "word/media/image1.png": b"png"}
+        body = para("x") + "<w:p><m:oMath><m:r><m:t>y</m:t></m:r></m:oMath></w:p>"
+        original = make_docx(body, parts=parts)
+        copy = make_docx(body, parts=parts, name="copy.docx")
+        cache = ParseCache(tmp_path / "cache")
+
+        result = DocxParser().parse(original)
+        assert isinstance(result, Ok)
+        key = cache.key_for(original)
+        assert cache.get(key, original) is None
+        cache.put(key, result.value)
+
+        cached = cache.get(cache.key_for(copy), copy)
+
+        assert cached is not None
+        assert cache.hits == 1
+        assert cached.source_path == copy
+        assert _without_ids(dataclasses.asdict(cached.sections[0])) == _without_ids(
+            dataclasses.asdict(result.value.sections[0])
+        )
+        image = cached.get_image("rId5")
+        assert image is not None
+        assert image.source is not None
+        assert image.source.package == copy
+        assert image.source.read() == b"png"
+
+    def test_evicts_least_recently_used(
+        self, make_docx: Callable[..., Path], tmp_path: Path
+    ) -> None:
+        path = make_docx(para("x"))
+        result = DocxParser().parse(path)
+        assert isinstance(result, Ok)
+        cache = ParseCache(tmp_path / "cache")
+        cache.put("a", result.value)
+        cache.put("b", result.value)
+        entry_size = (cache.directory / "a.doc.z").stat().st_size
+        os.utime(cache.directory / "a.doc.z", (1000, 1000))
+        os.utime(cache.directory / "b.doc.z", (2000, 2000))
+
+        cache = ParseCache(cache.directory, max_bytes=2 * entry_size + entry_size // 2)
+        assert cache.get("a", path) is not None  # Now the most recently used
+        cache.put("c", result.value)
+
+        assert sorted(p.name for p in cache.directory.iterdir()) == ["a.doc.z", "c.doc.z"]
+
+    def test_rejects_foreign_entries(
+        self, make_docx: Callable[..., Path], tmp_path: Path
+    ) -> None:
+        path = make_docx(para("x"))
+        result = DocxParser().parse(path)
+        assert isinstance(result, Ok)
+        cache = ParseCache(tmp_path / "cache")
+        cache.put("a", result.value)
+        (cache.directory / "b.doc.z").write_bytes(zlib.compress(pickle.dumps(["not", "a doc"])))
+
+        assert cache.get("b", path) is None
+        assert not (cache.directory / "b.doc.z").exists()
+
+        cache.directory.chmod(0o777)
+        try:
+            assert cache.get("a", path) is None
+        finally:
+            cache.directory.chmod(0o700)
+        assert cache.get("a", path) is not None
+
+
+class TestIncrementalParser:
+    """Reparsing a revision reuses the elements an edit did not touch."""
+
+    def test_reuses_unchanged_elements(self, make_docx: Callable[..., Path]) -> None:
+        parts = {"word/styles.xml": STYLES_XML}
+        parser = IncrementalParser()
+        first = parser.parse(make_docx(para("a") + para("b") + list_para("c"), parts))
+        second = parser.parse(make_docx(para("a") + para("B") + list_para("c"), parts))
+
+        assert isinstance(first, Ok)
+        assert isinstance(second, Ok)
+        before = first.value.sections[0].elements
+        after = second.value.sections[0].elements
+        assert after[0] is before[0]
+        assert after[1] is not before[1]
+        assert after[1].id not in {element.id for element in before}
+        assert after[2] is before[2]
+        assert parser.last_stats is not None
+        assert parser.last_stats.styles_reused
+        assert (parser.last_stats.blocks_reused, parser.last_stats.blocks_parsed) == (2, 1)
+
+    def test_style_change_reparses_everything(self, make_docx: Callable[..., Path]) -> None:
+        parser = IncrementalParser()
+        parser.parse(make_docx(para("a"), {"word/styles.xml": STYLES_XML}))
+        styles = STYLES_XML.replace('w:val="both"', 'w:val="center"')
+        result = parser.parse(make_docx(para("a"), {"word/styles.xml": styles}))
+
+        assert isinstance(result, Ok)
+        assert parser.last_stats is not None
+        assert not parser.last_stats.styles_reused
+        assert parser.last_stats.blocks_parsed == 1
+
+
+class _NonSeekable(io.RawIOBase):
+    """Forward-only stream, like a socket or pipe."""
+
+    def __init__(self, data: bytes) -> None:
+        self._inner = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        chunk = self._inner.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestStreamInput:
+    """Tests for parsing from file handles and streams."""
+
+    def test_parse_seekable_stream(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(para("hello"))
+
+        with path.open("rb") as stream:
+            result = DocxParser().parse_stream(stream)
+
+        assert isinstance(result, Ok)
+        assert [p.text for p in result.value.iter_paragraphs()] == ["hello"]
+
+    def test_parse_non_seekable_stream(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(
+            para("hello"),
+            parts={
+                "word/_rels/document.xml.rels": IMAGE_RELS_XML,
+                "word/media/image1.png": b"\x89PNG-data",
+            },
+        )
+
+        result = DocxParser().parse_stream(_NonSeekable(path.read_bytes()))
+
+        assert isinstance(result, Ok)
+        image = result.value.get_image("rId5")
+        assert image is not None
+        assert image.source is not None
+        assert image.source.read() == b"\x89PNG-data"
+
+    def test_spool_closed_without_images(
+        self, make_docx: Callable[..., Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        spools: list[IO[bytes]] = []
+        temporary_file = tempfile.TemporaryFile
+
+        def recording_temporary_file() -> IO[bytes]:
+            spools.append(temporary_file())
+            return spools[-1]
+
+        monkeypatch.setattr(tempfile, "TemporaryFile", recording_temporary_file)
+        path = make_docx(para("hello"))
+
+        result = DocxParser().parse_stream(_NonSeekable(path.read_bytes()))
+
+        assert isinstance(result, Ok)
+        assert len(spools) == 1
+        assert spools[0].closed
+
+
+class TestReentrancy:
+    """Tests for sharing one parser across documents and threads."""
+
+    def test_no_state_leaks_between_parses(self, make_docx: Callable[..., Path]) -> None:
+        link = '<w:hyperlink r:id="rId9"><w:r><w:t>link</w:t></w:r></w:hyperlink>'
+        rels = (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId9" Type="http://schemas.openxmlformats.org/officeDocument/'
+            '2006/relationships/hyperlink" Target="https://example.com" TargetMode="External"/>'
+            "</Relationships>"
+        )
+        with_rels = make_docx(
+            f"<w:p>{link}</w:p>", {"word/_rels/document.xml.rels": rels}, name="a.docx"
+        )
+        without_rels = make_docx(f"<w:p>{link}</w:p>", name="b.docx")
+        parser = DocxParser()
+
+        first = parser.parse(with_rels)
+        second = parser.parse(without_rels)
+
+        assert isinstance(first, Ok)
+        assert isinstance(second, Ok)
+        assert next(first.value.iter_paragraphs()).content[0].url == "https://example.com"
+        assert next(second.value.iter_paragraphs()).content[0].url == ""
+
+    def test_concurrent_parses(self, make_docx: Callable[..., Path]) -> None:
+        paths = [
+            make_docx("".join(para(f"doc{n}-p{i}") for i in range(200)), name=f"d{n}.docx")
+            for n in range(8)
+        ]
+        parser = DocxParser()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(parser.parse, paths))
+
+        for n, result in enumerate(results):
+            assert isinstance(result, Ok)
+            texts = [p.text for p in result.value.iter_paragraphs()]
+            assert texts == [f"doc{n}-p{i}" for i in range(200)]
+
+
+    def test_part_executor_loads_parts_concurrently(self, make_docx: Callable[..., Path]) -> None:
+        body = '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Title</w:t></w:r></w:p>'
+        body += "".join(list_para(f"item {i}") for i in range(3))
+        path = make_docx(body, {"word/styles.xml": STYLES_XML})
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            result = DocxParser(part_executor=pool).parse(path)
+        expected = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        assert isinstance(expected, Ok)
+        assert _without_ids(dataclasses.asdict(result.value)) == _without_ids(
+            dataclasses.asdict(expected.value)
+        )
+
+
+class TestElementIds:
+    """Elements carry document-scoped integer IDs and on-demand UUIDs."""
+
+    def test_ids_restart_per_document(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(para("a") + table(row(para("b"), para("c"))) + list_para("d"))
+        parser = DocxParser()
+
+        first = parser.parse(path)
+        second = parser.parse(path)
+
+        assert isinstance(first, Ok)
+        assert isinstance(second, Ok)
+        ids = [p.id for p in first.value.iter_paragraphs()]
+        assert ids == [p.id for p in second.value.iter_paragraphs()]
+        assert len(set(ids)) == len(ids)
+        assert max(ids) < 20
+
+    def test_uuid_on_demand(self) -> None:
+        run = Run(text="x")
+
+        assert not hasattr(run, "__dict__")
+        assert run.uuid is run.uuid
+        assert run.uuid != Run(text="x").uuid
+
+
+class TestPackageIndex:
+    """Tests for the OPC package index."""
+
+    def test_lookup_relationships_and_lazy_trees(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(
+            para("x"),
+            parts={
+                "word/_rels/document.xml.rels": IMAGE_RELS_XML,
+                "word/media/image1.png": b"png",
+                "word/footnotes.xml": f'<w:footnotes xmlns:w="{W_NS}"/>',
+            },
+        )
+
+        with zipfile.ZipFile(path) as archive:
+            index = PackageIndex(archive, max_cached_trees=1)
+
+            assert index.main_document_part == "word/document.xml"
+            assert index.has_part("/WORD/Document.xml")
+            assert index.content_type("word/media/image1.png") == "image/png"
+            rel = index.relationships("word/document.xml")["rId5"]
+            assert rel.part_name == "word/media/image1.png"
+            assert rel.type_name == "image"
+
+            document = index.tree("word/document.xml")
+            assert index.tree("word/document.xml") is document
+            index.tree("word/footnotes.xml")
+            assert index.tree("word/document.xml") is not document  # evicted
+            assert index.tree("word/missing.xml") is None
+
+    def test_prefetch_fills_tree_cache(self, make_docx: Callable[..., Path]) -> None:
+        path = make_docx(para("x"), parts={"word/styles.xml": STYLES_XML})
+
+        with zipfile.ZipFile(path) as archive, ThreadPoolExecutor(max_workers=2) as pool:
+            index = PackageIndex(archive)
+            index.prefetch(["word/styles.xml", "word/document.xml", "word/missing.xml"], pool)
+
+            assert index._trees.keys() == {"word/styles.xml", "word/document.xml"}
+            assert index.tree("word/styles.xml") is index._trees["word/styles.xml"]
+            assert index.read("word/styles.xml") == STYLES_XML.encode()
+
+    def test_main_part_from_package_relationships(self, tmp_path: Path) -> None:
+        path = tmp_path / "renamed.docx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr(
+                "_rels/.rels",
+                PACKAGE_RELS_XML.replace("word/document.xml", "word/main.xml"),
+            )
+            zf.writestr(
+                "word/main.xml",
+                f'<w:document xmlns:w="{W_NS}"><w:body>{para("moved")}</w:body></w:document>',
+            )
+
+        result = DocxParser().parse(path)
+
+        assert isinstance(result, Ok)
+        assert [p.text for p in result.value.iter_paragraphs()] == ["moved"]
@@ -1,7 +1,21 @@
 """Tests for math conversion."""
 
+import os
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
+from lxml import etree
 
+from docx2latex.domain.entities.elements import MathBlock
+from docx2latex.domain.protocols.converter import ConversionContext
+from docx2latex.infrastructure.caching.equation_store import EquationStore
+from docx2latex.infrastructure.converters.math.cache import MathCache, omml_key
+from docx2latex.infrastructure.converters.math.converter import MathConverter
+from docx2latex.infrastructure.converters.math.extractor import (
+    EquationExtractor,
+    ExtractedEquation,
+)
 from docx2latex.infrastructure.converters.math.omml_parser import OmmlParser
 from docx2latex.infrastructure.converters.math.symbols import SymbolMapper
 
@@ -37,6 +51,45 @@ class TestSymbolMapper:
         assert mapper.get_function_latex("log") == r"\log"
         assert mapper.get_function_latex("custom") == r"\operatorname{custom}"
 
+    def test_math_alphanumerics(self) -> None:
+        mapper = SymbolMapper()
+        assert (
+            mapper.map_text("\N{MATHEMATICAL ITALIC SMALL X}+\N{MATHEMATICAL ITALIC SMALL Y}")
+            == "x+y"
+        )
+        assert (
+            mapper.map_text("\N{MATHEMATICAL BOLD CAPITAL A}\N{MATHEMATICAL BOLD DIGIT ONE}")
+            == r"\mathbf{A}\mathbf{1}"
+        )
+        assert (
+            mapper.map_text("\N{DOUBLE-STRUCK CAPITAL R}\N{MATHEMATICAL DOUBLE-STRUCK CAPITAL F}")
+            == r"\mathbb{R}\mathbb{F}"
+        )
+        assert (
+            mapper.map_text("\N{MATHEMATICAL ITALIC SMALL ALPHA}\N{MATHEMATICAL ITALIC SMALL X}")
+            == r"\alpha x"
+        )
+        assert (
+            mapper.map_text("\N{MATHEMATICAL BOLD SCRIPT CAPITAL L}")
+            == r"\boldsymbol{\mathcal{L}}"
+        )
+
+    def test_small_letters_of_capital_only_alphabets(self) -> None:
+        mapper = SymbolMapper()
+        assert mapper.map_char("\N{MATHEMATICAL SCRIPT CAPITAL A}") == r"\mathcal{A}"
+        assert mapper.map_char("\N{MATHEMATICAL SCRIPT SMALL A}") == "a"
+        assert mapper.map_char("\N{SCRIPT SMALL E}") == "e"
+        assert mapper.map_char("\N{MATHEMATICAL BOLD SCRIPT SMALL A}") == r"\boldsymbol{a}"
+        assert mapper.map_char("\N{MATHEMATICAL DOUBLE-STRUCK SMALL A}") == "a"
+        assert mapper.map_text("\N{MATHEMATICAL DOUBLE-STRUCK SMALL K}x") == r"\Bbbk x"
+        assert mapper.map_char("\N{MATHEMATICAL DOUBLE-STRUCK DIGIT ONE}") == "1"
+
+    def test_command_spacing(self) -> None:
+        mapper = SymbolMapper()
+        assert mapper.map_text("\N{MULTIPLICATION SIGN}P") == r"\times P"
+        assert mapper.map_text("\N{GREEK SMALL LETTER ALPHA}\u2062x") == r"\alpha x"
+        assert mapper.map_text("2\N{MULTIPLICATION SIGN}3") == r"2\times3"
+
 
 class TestOmmlParser:
     """Tests for OMML parsing."""
@@ -115,3 +168,284 @@ class TestOmmlParser:
         result = parser.parse(omml)
         assert r"\left(" in result
         assert r"\right)" in result
+
+    def test_parses_element_without_serialising(self) -> None:
+        """Test that a parsed OMML subtree converts like its XML text."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:sSup>
+                <m:e><m:r><m:t>x</m:t></m:r></m:e>
+                <m:sup><m:r><m:t>2</m:t></m:r></m:sup>
+            </m:sSup>
+        </m:oMath>
+        """
+        parser = OmmlParser()
+        assert parser.parse(etree.fromstring(omml)) == parser.parse(omml)
+
+    def test_deep_nesting_beyond_recursion_limit(self) -> None:
+        """Test that nesting depth is not bounded by the recursion limit."""
+        root = etree.Element(f"{{{M_NS}}}oMath")
+        current = root
+        for _ in range(2000):
+            fraction = etree.SubElement(current, f"{{{M_NS}}}f")
+            den = etree.SubElement(fraction, f"{{{M_NS}}}den")
+            etree.SubElement(etree.SubElement(den, f"{{{M_NS}}}r"), f"{{{M_NS}}}t").text = "2"
+            current = etree.SubElement(fraction, f"{{{M_NS}}}num")
+        etree.SubElement(etree.SubElement(current, f"{{{M_NS}}}r"), f"{{{M_NS}}}t").text = "x"
+
+        result = OmmlParser().parse(root)
+        assert result.count(r"\dfrac") + result.count(r"\frac") == 2000
+        assert "x" in result
+
+    def test_empty_script_is_dropped(self) -> None:
+        """Test that an empty superscript leaves the base alone, not a dangling ^."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:sSup>
+                <m:e><m:r><m:t>x</m:t></m:r></m:e>
+                <m:sup></m:sup>
+            </m:sSup>
+        </m:oMath>
+        """
+        assert OmmlParser().parse(omml) == "x"
+
+    def test_prescript_attaches_to_empty_group(self) -> None:
+        """Test that pre-scripts keep the empty group they attach to."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:sPre>
+                <m:sub><m:r><m:t>1</m:t></m:r></m:sub>
+                <m:sup></m:sup>
+                <m:e><m:r><m:t>X</m:t></m:r></m:e>
+            </m:sPre>
+        </m:oMath>
+        """
+        assert OmmlParser().parse(omml) == "{}_{1}X"
+
+    def test_nested_delimiters_convert_each_operand_once(self) -> None:
+        """Test that operands of nested structures are not repeated by enclosing ones."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:d>
+                <m:e>
+                    <m:sSub>
+                        <m:e><m:r><m:t>x</m:t></m:r></m:e>
+                        <m:sub><m:r><m:t>1</m:t></m:r></m:sub>
+                    </m:sSub>
+                    <m:d><m:e><m:r><m:t>y</m:t></m:r></m:e></m:d>
+                </m:e>
+            </m:d>
+        </m:oMath>
+        """
+        assert OmmlParser().parse(omml) == r"\left( x_{1}\left( y \right) \right)"
+
+    def test_deeply_nested_delimiters_grow_linearly(self) -> None:
+        """Test that each level of nested delimiters adds the same output."""
+        root = etree.Element(f"{{{M_NS}}}oMath")
+        current = root
+        for _ in range(30):
+            current = etree.SubElement(etree.SubElement(current, f"{{{M_NS}}}d"), f"{{{M_NS}}}e")
+        etree.SubElement(etree.SubElement(current, f"{{{M_NS}}}r"), f"{{{M_NS}}}t").text = "x"
+
+        result = OmmlParser().parse(root)
+        # Repeating nested operands at each level would double it per level
+        assert len(result) == 30 * len(r"\left( " + r" \right)") + 1
+        assert result == r"\left( " * 30 + "x" + r" \right)" * 30
+
+    def test_matrix_cells(self) -> None:
+        """Test that a matrix takes only its own rows and cells."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:m>
+                <m:mr>
+                    <m:e><m:d><m:e><m:r><m:t>a</m:t></m:r></m:e></m:d></m:e>
+                    <m:e><m:r><m:t>b</m:t></m:r></m:e>
+                </m:mr>
+                <m:mr>
+                    <m:e><m:r><m:t>c</m:t></m:r></m:e>
+                    <m:e><m:m><m:mr><m:e><m:r><m:t>d</m:t></m:r></m:e></m:mr></m:m></m:e>
+                </m:mr>
+            </m:m>
+        </m:oMath>
+        """
+        assert OmmlParser().parse(omml) == (
+            r"\begin{matrix} \left( a \right) & b \\ c & "
+            r"\begin{matrix} d \end{matrix} \end{matrix}"
+        )
+
+    def test_equation_array_rows(self) -> None:
+        """Test that an equation array takes only its own rows."""
+        omml = """
+        <m:oMath xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+            <m:eqArr>
+                <m:e>
+                    <m:r><m:t>x=</m:t></m:r>
+                    <m:d><m:e><m:r><m:t>y</m:t></m:r></m:e></m:d>
+                </m:e>
+                <m:e><m:r><m:t>z=1</m:t></m:r></m:e>
+            </m:eqArr>
+        </m:oMath>
+        """
+        assert OmmlParser().parse(omml) == (
+            r"\begin{aligned} x=\left( y \right) \\ z=1 \end{aligned}"
+        )
+
+
+M_NS = "http://schemas.openxmlformats.org/officeDocument/2006/math"
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+class TestMathCache:
+    """Tests for memoised formula conversion."""
+
+    def test_key_ignores_revision_ids_and_declarations(self) -> None:
+        """Test that the key depends on the formula only."""
+        plain = f'<m:oMath xmlns:m="{M_NS}"><m:r><m:t>x</m:t></m:r></m:oMath>'
+        edited = (
+            f'<m:oMath xmlns:m="{M_NS}" xmlns:w="{W_NS}">'
+            '<m:r w:rsidR="00A1B2C3"><m:t>x</m:t></m:r></m:oMath>'
+        )
+        other = f'<m:oMath xmlns:m="{M_NS}"><m:r><m:t>y</m:t></m:r></m:oMath>'
+
+        assert omml_key(plain) == omml_key(edited)
+        assert omml_key(plain) == omml_key(etree.fromstring(plain))
+        assert omml_key(plain) != omml_key(other)
+
+    def test_converter_reuses_cached_latex(self) -> None:
+        """Test that repeated formulas are converted once."""
+        omml = f'<m:oMath xmlns:m="{M_NS}"><m:r><m:t>n</m:t></m:r></m:oMath>'
+        cache = MathCache()
+        converter = MathConverter(cache)
+        context = ConversionContext()
+
+        first = converter.convert(MathBlock(omml=omml), context)
+        second = converter.convert(MathBlock(omml=etree.fromstring(omml)), context)
+
+        assert first == second
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_bounded_by_entries_and_bytes(self) -> None:
+        """Test that the least recently used formulas are evicted."""
+        cache = MathCache(max_entries=2)
+        cache.put(b"a", "a")
+        cache.put(b"b", "b")
+        cache.get(b"a")
+        cache.put(b"c", "c")
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == "a"
+
+        small = MathCache(max_bytes=200)
+        small.put(b"big", "x" * 500)
+        assert len(small) == 0
+
+
+class TestBatchConversion:
+    """Tests for converting the formulas of a document ahead of time."""
+
+    def test_converts_each_distinct_formula_once(self) -> None:
+        """Test that duplicates are converted once and later read back."""
+        x = f'<m:oMath xmlns:m="{M_NS}"><m:r><m:t>x</m:t></m:r></m:oMath>'
+        y = f'<m:oMath xmlns:m="{M_NS}"><m:r><m:t>y</m:t></m:r></m:oMath>'
+        blocks = [MathBlock(omml=x), MathBlock(omml=etree.fromstring(x)), MathBlock(omml=y)]
+        cache = MathCache()
+        converter = MathConverter(cache)
+
+        assert converter.convert_many(blocks) == 2
+        assert [block.latex for block in blocks] == ["x", "x", "y"]
+        assert converter.convert(blocks[0], ConversionContext()).value == "$x$"
+        assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+    def test_worker_processes_match_in_process(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that converting across processes gives the same LaTeX."""
+        from docx2latex.infrastructure.converters.math import converter as module
+
+        formulas = [
+            f'<m:oMath xmlns:m="{M_NS}"><m:f><m:num><m:r><m:t>{i}</m:t></m:r></m:num>'
+            "<m:den><m:r><m:t>n</m:t></m:r></m:den></m:f></m:oMath>"
+            for i in range(8)
+        ]
+        serial = [MathBlock(omml=omml) for omml in formulas]
+        parallel = [MathBlock(omml=omml) for omml in formulas]
+        MathConverter().convert_many(serial)
+        monkeypatch.setattr(module, "PARALLEL_MIN_FORMULAS", 0)
+        MathConverter().convert_many(parallel, workers=2)
+
+        assert [block.latex for block in parallel] == [block.latex for block in serial]
+        assert parallel[3].latex == r"\frac{3}{n}"
+
+
+class TestEquationExtractor:
+    """Tests for streaming equations out of a DOCX package."""
+
+    def test_extracts_in_document_order(self, make_docx: Callable[..., Path]) -> None:
+        """Test the records of inline and display equations."""
+        x = "<m:oMath><m:r><m:t>x</m:t></m:r></m:oMath>"
+        y = "<m:oMath><m:r><m:t>y</m:t></m:r></m:oMath>"
+        body = (
+            "<w:p><w:r><w:t>intro</w:t></w:r></w:p>"
+            f"<w:p><w:r><w:t>let </w:t></w:r>{x}</w:p>"
+            f"<w:p><m:oMathPara>{y}{x}</m:oMathPara></w:p>"
+        )
+        equations: list[ExtractedEquation] = []
+
+        result = EquationExtractor().extract(make_docx(body), equations.append)
+
+        assert result.value == 3
+        assert [(e.index, e.display, e.paragraph, e.latex) for e in equations] == [
+            (0, False, 1, "x"),
+            (1, True, 2, "y"),
+            (2, True, 2, "x"),
+        ]
+        assert equations[0].digest == equations[2].digest
+        assert equations[0].to_dict()["type"] == "inline"
+
+
+class TestEquationStore:
+    """Tests for the persistent equation store."""
+
+    def test_shared_through_the_database(self, tmp_path: Path) -> None:
+        """Test that a new cache reads what another one stored."""
+        path = tmp_path / "equations.db"
+        with EquationStore(path) as store:
+            MathCache(store=store).put(b"k" * 16, "x^{2}")
+
+        with EquationStore(path) as store:
+            cache = MathCache(store=store)
+            assert cache.get(b"k" * 16) == "x^{2}"
+            assert cache.get(b"k" * 16) == "x^{2}"
+            assert (cache.stats.hits, cache.stats.store_hits) == (2, 1)
+
+    def test_version_change_ignores_entries(self, tmp_path: Path) -> None:
+        """Test that entries of another converter version are ignored, then aged out."""
+        path = tmp_path / "equations.db"
+        with EquationStore(path, version="1") as store:
+            store.put(b"k" * 16, "x")
+
+        with EquationStore(path, version="2") as store:
+            assert store.get(b"k" * 16) is None
+            assert len(store) == 1
+
+        with EquationStore(path, version="1") as store:
+            assert store.get(b"k" * 16) == "x"
+
+        with EquationStore(path, version="2", max_age_days=0) as store:
+            pass
+        with EquationStore(path, version="1") as store:
+            assert len(store) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_disabled_in_forked_child(self, tmp_path: Path) -> None:
+        """Test that a forked child leaves the parent's connection alone."""
+        with EquationStore(tmp_path / "equations.db") as store:
+            store.put(b"k" * 16, "x")
+            store.flush()
+
+            pid = os.fork()
+            if pid == 0:
+                os._exit(0 if not store.available and store.get(b"k" * 16) is None else 1)
+            _, status = os.waitpid(pid, 0)
+
+            assert os.waitstatus_to_exitcode(status) == 0
+            assert store.available
+            assert store.get(b"k" * 16) == "x"